@@ -0,0 +1,13 @@
+"""
+sys.path 부트스트랩
+
+core/adapters 모듈이 lib.mockup_hybrid를 import하기 전에 프로젝트 루트
+(lib/ 위치)를 sys.path에 한 번만 등록합니다.
+"""
+
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = str(Path(__file__).parents[3])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
@@ -37,83 +37,37 @@ DIAGRAM_TYPE_KEYWORDS = {
     },
 }
 
+# 소문자 정규화된 키워드 (import 시 1회 계산)
+DIAGRAM_TYPE_KEYWORDS_LOWER = {
+    diagram_type: {lang: [kw.lower() for kw in kws] for lang, kws in keywords.items()}
+    for diagram_type, keywords in DIAGRAM_TYPE_KEYWORDS.items()
+}
 
-@dataclass
-class MermaidGenerationResult:
-    """Mermaid 생성 결과"""
-    success: bool
-    mermaid_code: str
-    diagram_type: str
-    error_message: Optional[str] = None
-
-
-class MermaidAdapter:
-    """Mermaid 다이어그램 어댑터"""
-
-    def detect_diagram_type(self, prompt: str) -> str:
-        """프롬프트에서 다이어그램 타입 감지"""
-        prompt_lower = prompt.lower()
-
-        for diagram_type, keywords in DIAGRAM_TYPE_KEYWORDS.items():
-            all_keywords = keywords["ko"] + keywords["en"]
-            for keyword in all_keywords:
-                if keyword.lower() in prompt_lower:
-                    return diagram_type
-
-        return "flowchart"  # 기본값
-
-    def generate_from_prompt(self, prompt: str) -> MermaidGenerationResult:
-        """
-        프롬프트에서 mermaid 다이어그램 생성
-
-        Args:
-            prompt: 사용자 프롬프트
-
-        Returns:
-            MermaidGenerationResult 객체
-        """
-        try:
-            # 다이어그램 타입 감지
-            diagram_type = self.detect_diagram_type(prompt)
-
-            # 프롬프트 파싱
-            parts = re.split(r'\s*[-:]\s*', prompt, maxsplit=1)
-            title = parts[0].strip()
-            description = parts[1].strip() if len(parts) > 1 else title
-
-            # 다이어그램 타입별 스켈레톤 생성
-            mermaid_code = self._generate_skeleton(diagram_type, title, description)
-
-            return MermaidGenerationResult(
-                success=True,
-                mermaid_code=mermaid_code,
-                diagram_type=diagram_type,
-            )
-
-        except Exception as e:
-            return MermaidGenerationResult(
-                success=False,
-                mermaid_code="",
-                diagram_type="flowchart",
-                error_message=str(e),
-            )
-
-    def _generate_skeleton(self, diagram_type: str, title: str, description: str) -> str:
-        """다이어그램 타입별 스켈레톤 생성"""
-        generators = {
-            "flowchart": self._flowchart_skeleton,
-            "sequenceDiagram": self._sequence_skeleton,
-            "erDiagram": self._er_skeleton,
-            "classDiagram": self._class_skeleton,
-            "stateDiagram-v2": self._state_skeleton,
-            "gitGraph": self._git_skeleton,
-        }
-
-        generator = generators.get(diagram_type, self._flowchart_skeleton)
-        return generator(title, description)
-
-    def _flowchart_skeleton(self, title: str, description: str) -> str:
-        return f"""---
+# 다이어그램 타입 감지 패턴 (단일 정규식, 1-pass)
+# 타입별 분기를 DIAGRAM_TYPE_KEYWORDS 순서대로 배치하여 기존 우선순위를 유지합니다.
+# 각 분기는 lookahead로 키워드 존재만 확인하고, 빈 named group으로 타입을 표시합니다.
+# IGNORECASE로 매칭하므로 프롬프트를 소문자로 복사할 필요가 없습니다.
+_GROUP_TO_TYPE = {
+    diagram_type.replace("-", "_"): diagram_type
+    for diagram_type in DIAGRAM_TYPE_KEYWORDS
+}
+_DETECT_RE = re.compile(
+    "^(?:" + "|".join(
+        "(?=.*?(?:{}))(?P<{}>)".format(
+            "|".join(re.escape(kw) for kw in keywords["ko"] + keywords["en"]),
+            diagram_type.replace("-", "_"),
+        )
+        for diagram_type, keywords in DIAGRAM_TYPE_KEYWORDS_LOWER.items()
+    ) + ")",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# 프롬프트 "제목 - 설명" / "제목: 설명" 분리 패턴
+_PROMPT_SPLIT_RE = re.compile(r'\s*[-:]\s*')
+
+# 다이어그램 타입별 스켈레톤 템플릿 ({title}, {description} 치환, 리터럴 중괄호는 {{ }})
+_SKELETON_TEMPLATES = {
+    "flowchart": """---
 title: {title}
 ---
 flowchart TD
@@ -121,10 +75,8 @@ flowchart TD
     B -->|Yes| C[처리]
     B -->|No| D[종료]
     C --> E[결과]
-    E --> D"""
-
-    def _sequence_skeleton(self, title: str, description: str) -> str:
-        return f"""---
+    E --> D""",
+    "sequenceDiagram": """---
 title: {title}
 ---
 sequenceDiagram
@@ -135,10 +87,8 @@ sequenceDiagram
     Client->>Server: 요청
     Server->>DB: 조회
     DB-->>Server: 결과
-    Server-->>Client: 응답"""
-
-    def _er_skeleton(self, title: str, description: str) -> str:
-        return f"""---
+    Server-->>Client: 응답""",
+    "erDiagram": """---
 title: {title}
 ---
 erDiagram
@@ -153,10 +103,8 @@ erDiagram
         int id PK
         int entity_a_id FK
         string value
-    }}"""
-
-    def _class_skeleton(self, title: str, description: str) -> str:
-        return f"""---
+    }}""",
+    "classDiagram": """---
 title: {title}
 ---
 classDiagram
@@ -171,10 +119,8 @@ classDiagram
         +handle() void
     }}
     BaseClass <|-- ConcreteA
-    BaseClass <|-- ConcreteB"""
-
-    def _state_skeleton(self, title: str, description: str) -> str:
-        return f"""---
+    BaseClass <|-- ConcreteB""",
+    "stateDiagram-v2": """---
 title: {title}
 ---
 stateDiagram-v2
@@ -183,10 +129,8 @@ stateDiagram-v2
     Processing --> Success : complete
     Processing --> Error : fail
     Error --> Idle : retry
-    Success --> [*]"""
-
-    def _git_skeleton(self, title: str, description: str) -> str:
-        return f"""---
+    Success --> [*]""",
+    "gitGraph": """---
 title: {title}
 ---
 gitGraph
@@ -197,4 +141,71 @@ gitGraph
     commit
     checkout main
     merge feature
-    commit"""
+    commit""",
+}
+
+
+@dataclass
+class MermaidGenerationResult:
+    """Mermaid 생성 결과"""
+    success: bool
+    mermaid_code: str
+    diagram_type: str
+    error_message: Optional[str] = None
+
+
+class MermaidAdapter:
+    """Mermaid 다이어그램 어댑터"""
+
+    def detect_diagram_type(self, prompt: str) -> str:
+        """프롬프트에서 다이어그램 타입 감지"""
+        match = _DETECT_RE.match(prompt)
+        if match:
+            return _GROUP_TO_TYPE[match.lastgroup]
+
+        return "flowchart"  # 기본값
+
+    def generate_from_prompt(self, prompt: str) -> MermaidGenerationResult:
+        """
+        프롬프트에서 mermaid 다이어그램 생성
+
+        Args:
+            prompt: 사용자 프롬프트
+
+        Returns:
+            MermaidGenerationResult 객체
+        """
+        try:
+            # 다이어그램 타입 감지
+            diagram_type = self.detect_diagram_type(prompt)
+
+            # 프롬프트 파싱
+            parts = _PROMPT_SPLIT_RE.split(prompt, maxsplit=1)
+            title = parts[0].strip()
+            description = parts[1].strip() if len(parts) > 1 else title
+
+            # 다이어그램 타입별 스켈레톤 생성
+            mermaid_code = self._generate_skeleton(diagram_type, title, description)
+
+            return MermaidGenerationResult(
+                success=True,
+                mermaid_code=mermaid_code,
+                diagram_type=diagram_type,
+            )
+
+        except Exception as e:
+            return MermaidGenerationResult(
+                success=False,
+                mermaid_code="",
+                diagram_type="flowchart",
+                error_message=str(e),
+            )
+
+    def _generate_skeleton(
+        self, diagram_type: str, title: str, description: str
+    ) -> str:
+        """다이어그램 타입별 스켈레톤 생성"""
+        template = _SKELETON_TEMPLATES.get(
+            diagram_type, _SKELETON_TEMPLATES["flowchart"]
+        )
+        return template.format(title=title, description=description)
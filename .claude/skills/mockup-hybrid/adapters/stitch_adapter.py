@@ -6,11 +6,9 @@ Stitch API를 사용하여 고품질 AI 생성 UI 목업을 생성합니다.
 
 import re
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Optional
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+from .. import _bootstrap  # noqa: F401  (프로젝트 루트를 sys.path에 등록)
 
 from lib.mockup_hybrid.stitch_client import StitchClient, StitchResponse, get_stitch_client
 
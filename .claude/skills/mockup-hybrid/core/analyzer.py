@@ -13,8 +13,7 @@ from typing import Optional
 import yaml
 
 # 라이브러리 임포트
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+from .. import _bootstrap  # noqa: F401  (프로젝트 루트를 sys.path에 등록)
 
 from lib.mockup_hybrid import MockupBackend, SelectionReason, MockupOptions
 from lib.mockup_hybrid.stitch_client import get_stitch_client
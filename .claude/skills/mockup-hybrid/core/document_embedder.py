@@ -9,8 +9,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+from .. import _bootstrap  # noqa: F401  (프로젝트 루트를 sys.path에 등록)
 
 from lib.mockup_hybrid import MockupBackend, MockupResult
 from .document_scanner import SectionScanResult
@@ -46,11 +45,71 @@ class DocumentEmbedder:
             EmbedResult 객체
         """
         try:
-            content = doc_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
+            lines, newline, trailing_newline = self._read_lines(doc_path)
+            existing_images = self._existing_images([mockup_result])
 
+            result = self._apply_embed(
+                lines, doc_path, section, mockup_result, existing_images
+            )
+
+            # 저장
+            if result.success:
+                self._write_lines(doc_path, lines, newline, trailing_newline)
+
+            return result
+
+        except Exception as e:
+            return self._failure(section, mockup_result, e)
+
+    def _read_lines(self, doc_path: Path) -> tuple[list[str], str, bool]:
+        """문서를 라인 리스트로 읽기
+
+        Returns:
+            (라인 리스트, 원본 개행 문자, 마지막 개행 여부)
+        """
+        with open(doc_path, "rb") as f:
+            content = f.read().decode("utf-8")
+
+        # 스캐너(텍스트 모드)와 라인 번호를 맞추기 위해 CRLF는 LF로 정규화
+        newline = "\r\n" if "\r\n" in content else "\n"
+        if newline != "\n":
+            content = content.replace("\r\n", "\n")
+
+        trailing_newline = content.endswith("\n")
+        if trailing_newline:
+            content = content[:-1]
+        return content.split("\n"), newline, trailing_newline
+
+    def _write_lines(
+        self,
+        doc_path: Path,
+        lines: list[str],
+        newline: str,
+        trailing_newline: bool,
+    ) -> None:
+        """라인 리스트를 문서에 저장 (원본의 개행 문자와 마지막 개행 유지)"""
+        text = "\n".join(lines)
+        if trailing_newline:
+            text += "\n"
+        if newline != "\n":
+            text = text.replace("\n", newline)
+        with open(doc_path, "wb") as f:
+            f.write(text.encode("utf-8"))
+
+    def _apply_embed(
+        self,
+        lines: list[str],
+        doc_path: Path,
+        section: SectionScanResult,
+        mockup_result: MockupResult,
+        existing_images: set[Path],
+    ) -> EmbedResult:
+        """라인 리스트에 삽입 블록을 in-place로 추가 (파일 I/O 없음)"""
+        try:
             # 삽입할 블록 생성
-            embed_block = self._create_embed_block(mockup_result, doc_path)
+            embed_block = self._create_embed_block(
+                mockup_result, doc_path, existing_images
+            )
             if not embed_block:
                 return EmbedResult(
                     section_heading=section.heading,
@@ -70,9 +129,6 @@ class DocumentEmbedder:
             embed_lines = ["", embed_block, ""]
             lines[insert_line:insert_line] = embed_lines
 
-            # 저장
-            doc_path.write_text("\n".join(lines), encoding="utf-8")
-
             return EmbedResult(
                 section_heading=section.heading,
                 backend=mockup_result.backend,
@@ -81,23 +137,40 @@ class DocumentEmbedder:
             )
 
         except Exception as e:
-            return EmbedResult(
-                section_heading=section.heading,
-                backend=mockup_result.backend,
-                success=False,
-                message=f"삽입 실패: {e}",
-            )
+            return self._failure(section, mockup_result, e)
+
+    def _failure(
+        self,
+        section: SectionScanResult,
+        mockup_result: MockupResult,
+        error: Exception,
+    ) -> EmbedResult:
+        """삽입 실패 결과"""
+        return EmbedResult(
+            section_heading=section.heading,
+            backend=mockup_result.backend,
+            success=False,
+            message=f"삽입 실패: {error}",
+        )
+
+    def _existing_images(self, mockup_results: list[MockupResult]) -> set[Path]:
+        """실제로 존재하는 이미지 경로 집합 (삽입 전 stat 일괄 확인)"""
+        return {
+            r.image_path for r in mockup_results
+            if r.image_path and r.image_path.exists()
+        }
 
     def _create_embed_block(
         self,
         mockup_result: MockupResult,
         doc_path: Path,
+        existing_images: set[Path],
     ) -> Optional[str]:
         """목업 결과에서 삽입할 블록 생성"""
         if mockup_result.backend == MockupBackend.MERMAID:
             return self._mermaid_block(mockup_result)
         elif mockup_result.backend in (MockupBackend.HTML, MockupBackend.STITCH):
-            return self._image_block(mockup_result, doc_path)
+            return self._image_block(mockup_result, doc_path, existing_images)
         return None
 
     def _mermaid_block(self, result: MockupResult) -> str:
@@ -106,9 +179,14 @@ class DocumentEmbedder:
             return f"```mermaid\n{result.mermaid_code}\n```"
         return ""
 
-    def _image_block(self, result: MockupResult, doc_path: Path) -> str:
+    def _image_block(
+        self,
+        result: MockupResult,
+        doc_path: Path,
+        existing_images: set[Path],
+    ) -> str:
         """이미지 참조 블록"""
-        if result.image_path and result.image_path.exists():
+        if result.image_path in existing_images:
             # 문서 위치 기준 상대 경로 계산
             try:
                 rel_path = result.image_path.relative_to(doc_path.parent)
@@ -138,10 +216,33 @@ class DocumentEmbedder:
         # 역순 정렬 (뒤에서부터 삽입해야 앞쪽 라인 번호가 밀리지 않음)
         sorted_results = sorted(results, key=lambda x: x[0].line_start, reverse=True)
 
-        embed_results = []
-        for section, mockup_result in sorted_results:
-            result = self.embed(doc_path, section, mockup_result)
-            embed_results.append(result)
+        # 문서는 한 번만 읽고, 모든 삽입 후 한 번만 저장
+        try:
+            lines, newline, trailing_newline = self._read_lines(doc_path)
+            existing_images = self._existing_images([r for _, r in results])
+        except Exception as e:
+            return [
+                self._failure(section, mockup_result, e)
+                for section, mockup_result in reversed(sorted_results)
+            ]
+
+        embed_results = [
+            self._apply_embed(
+                lines, doc_path, section, mockup_result, existing_images
+            )
+            for section, mockup_result in sorted_results
+        ]
+
+        if any(r.success for r in embed_results):
+            try:
+                self._write_lines(doc_path, lines, newline, trailing_newline)
+            except Exception as e:
+                embed_results = [
+                    self._failure(section, mockup_result, e) if r.success else r
+                    for r, (section, mockup_result) in zip(
+                        embed_results, sorted_results, strict=True
+                    )
+                ]
 
         # 원래 순서로 되돌림
         embed_results.reverse()
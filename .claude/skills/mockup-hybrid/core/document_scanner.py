@@ -5,13 +5,14 @@
 """
 
 import re
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+from .. import _bootstrap  # noqa: F401  (프로젝트 루트를 sys.path에 등록)
 
 from lib.mockup_hybrid import MockupBackend
 
@@ -32,11 +33,21 @@ class SectionScanResult:
     line_start: int                        # 문서에서 시작 라인
     line_end: int                          # 문서에서 끝 라인
     classification: SectionClassification  # NEED / SKIP / EXIST
-    suggested_tier: Optional[MockupBackend] = None  # MERMAID / HTML / STITCH
-    suggested_diagram_type: Optional[str] = None    # flowchart, sequenceDiagram 등
+    suggested_tier: MockupBackend | None = None  # MERMAID / HTML / STITCH
+    suggested_diagram_type: str | None = None  # flowchart, sequenceDiagram 등
     reason: str = ""                       # 분류 이유
 
 
+class _SectionParse(NamedTuple):
+    """분할된 섹션 (분류 전 중간 결과)"""
+    heading: str
+    heading_text: str
+    heading_level: int
+    line_start: int
+    line_end: int
+    content: str
+
+
 @dataclass
 class DocumentScanResult:
     """문서 전체 스캔 결과"""
@@ -80,6 +91,162 @@ VISUAL_HEADING_KEYWORDS = {
 # 시각화 불필요한 섹션 제목 키워드
 SKIP_HEADING_KEYWORDS = ["배경", "background", "개요", "overview", "요약", "summary", "참고", "reference", "위험", "risk", "제약", "constraint", "변경 로그", "changelog", "목차", "toc"]
 
+# 소문자 정규화된 키워드 (import 시 1회 계산, 원본은 분류 이유 표시에 사용)
+VISUAL_HEADING_KEYWORDS_LOWER = {
+    "mermaid": {
+        diagram_type: [kw.lower() for kw in keywords]
+        for diagram_type, keywords in VISUAL_HEADING_KEYWORDS["mermaid"].items()
+    },
+    "html": [kw.lower() for kw in VISUAL_HEADING_KEYWORDS["html"]],
+}
+SKIP_HEADING_KEYWORDS_LOWER = [kw.lower() for kw in SKIP_HEADING_KEYWORDS]
+
+# 섹션 분석용 정규식 (모듈 로드 시 1회 컴파일)
+_HEADING_RE = re.compile(r'^(#{2,4})\s+(.+)$')
+_IMAGE_RE = re.compile(r'!\[.*?\]\(.*?\)')
+_NUMBERED_STEP_RE = re.compile(r'^\d+[\.\)]\s', re.MULTILINE)
+_ARROW_RE = re.compile(r'→|->|>>|에서\s.*으로|부터\s.*까지')
+
+
+@dataclass(frozen=True)
+class _HeadingRule:
+    """헤딩 키워드 매칭 규칙"""
+    priority: int                          # 낮을수록 우선 (키워드 선언 순서)
+    classification: SectionClassification
+    tier: MockupBackend | None
+    diagram_type: str | None
+    reason: str
+    boundary_re: re.Pattern | None = None  # 짧은 키워드의 단어 경계 검사
+
+
+class _KeywordAutomaton:
+    """Aho-Corasick 다중 키워드 매처
+
+    모든 키워드를 하나의 트라이 + 실패 링크로 구성하여,
+    텍스트를 한 번만 순회하면서 포함된 모든 키워드의 payload를 찾습니다.
+    """
+
+    def __init__(self, entries: list[tuple[str, _HeadingRule]]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[_HeadingRule]] = [[]]
+
+        for keyword, payload in entries:
+            node = 0
+            for ch in keyword:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(payload)
+
+        # BFS로 실패 링크 구성 (루트 직계 자식의 실패 링크는 루트)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter(self, text: str):
+        """텍스트에 포함된 키워드의 payload를 순서대로 반환"""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            yield from out[node]
+
+
+def _build_heading_rules() -> list[tuple[str, _HeadingRule]]:
+    """SKIP / Mermaid / HTML 헤딩 키워드 규칙을 우선순위 순으로 생성"""
+    entries: list[tuple[str, _HeadingRule]] = []
+
+    skip_pairs = zip(SKIP_HEADING_KEYWORDS, SKIP_HEADING_KEYWORDS_LOWER, strict=True)
+    for kw, kw_lower in skip_pairs:
+        entries.append((kw_lower, _HeadingRule(
+            priority=len(entries),
+            classification=SectionClassification.SKIP,
+            tier=None,
+            diagram_type=None,
+            reason=f"서술형 섹션 ('{kw}')",
+        )))
+
+    mermaid_lower = VISUAL_HEADING_KEYWORDS_LOWER["mermaid"]
+    for diagram_type, keywords in VISUAL_HEADING_KEYWORDS["mermaid"].items():
+        for kw, kw_lower in zip(keywords, mermaid_lower[diagram_type], strict=True):
+            boundary_re = None
+            if len(kw) <= 3:
+                boundary_re = re.compile(r'\b' + re.escape(kw_lower) + r'\b')
+            entries.append((kw_lower, _HeadingRule(
+                priority=len(entries),
+                classification=SectionClassification.NEED,
+                tier=MockupBackend.MERMAID,
+                diagram_type=diagram_type,
+                reason=f"Mermaid {diagram_type} ('{kw}')",
+                boundary_re=boundary_re,
+            )))
+
+    html_lower = VISUAL_HEADING_KEYWORDS_LOWER["html"]
+    for kw, kw_lower in zip(VISUAL_HEADING_KEYWORDS["html"], html_lower, strict=True):
+        entries.append((kw_lower, _HeadingRule(
+            priority=len(entries),
+            classification=SectionClassification.NEED,
+            tier=MockupBackend.HTML,
+            diagram_type=None,
+            reason=f"HTML wireframe ('{kw}')",
+        )))
+
+    return entries
+
+
+_HEADING_RULES = _build_heading_rules()
+_HEADING_AUTOMATON = _KeywordAutomaton(_HEADING_RULES)
+
+# SKIP 빠른 경로: 헤딩 토큰이 SKIP 키워드와 정확히 일치하면 SKIP 확정
+# (SKIP이 최우선이므로 automaton 순회 없이 결정 가능)
+_HEADING_TOKEN_SPLIT = re.compile(r'[\s/,;]+')
+_SKIP_KEYWORD_SET = frozenset(SKIP_HEADING_KEYWORDS_LOWER)
+_SKIP_RULES = [
+    (kw, rule) for kw, rule in _HEADING_RULES
+    if rule.classification == SectionClassification.SKIP
+]
+
+
+def _match_heading_rule(heading_lower: str) -> _HeadingRule | None:
+    """헤딩에서 가장 우선순위가 높은 키워드 규칙 반환"""
+    if not _SKIP_KEYWORD_SET.isdisjoint(_HEADING_TOKEN_SPLIT.split(heading_lower)):
+        # 분류 이유는 선언 순서상 첫 번째로 포함된 SKIP 키워드 기준
+        for kw, rule in _SKIP_RULES:
+            if kw in heading_lower:
+                return rule
+
+    best = None
+    for rule in _HEADING_AUTOMATON.iter(heading_lower):
+        if best is not None and rule.priority >= best.priority:
+            continue
+        # 짧은 키워드는 단어 경계가 맞을 때만 인정
+        if rule.boundary_re and not rule.boundary_re.search(heading_lower):
+            continue
+        best = rule
+    return best
+
+
+def _has_min_matches(pattern: re.Pattern, content: str, minimum: int) -> bool:
+    """패턴이 minimum회 이상 매칭되는지 확인 (도달 즉시 중단, 리스트 생성 없음)"""
+    return any(
+        count >= minimum for count, _ in enumerate(pattern.finditer(content), 1)
+    )
+
 
 class DocumentScanner:
     """마크다운 문서 스캐너"""
@@ -95,11 +262,9 @@ class DocumentScanner:
         Returns:
             DocumentScanResult 객체
         """
-        content = doc_path.read_text(encoding="utf-8")
-        lines = content.split("\n")
-
-        # 섹션 분리 (## 이상의 헤딩)
-        sections = self._split_sections(lines)
+        # 섹션 분리 (## 이상의 헤딩) - 파일을 줄 단위로 스트리밍
+        with doc_path.open(encoding="utf-8") as f:
+            sections = self._split_sections(f)
 
         result = DocumentScanResult(
             doc_path=doc_path,
@@ -118,111 +283,85 @@ class DocumentScanner:
 
         return result
 
-    def _split_sections(self, lines: list[str]) -> list[dict]:
-        """## 헤딩 기준으로 섹션 분리"""
+    def _split_sections(self, lines: Iterable[str]) -> list[_SectionParse]:
+        """## 헤딩 기준으로 섹션 분리 (1-pass, 본문은 섹션별 버퍼에 누적)"""
         sections = []
-        current = None
+        current = None  # (헤딩 라인, 헤딩 매치, 시작 라인)
+        buf: list[str] = []
+        line_count = 0
 
-        for i, line in enumerate(lines):
-            heading_match = re.match(r'^(#{2,4})\s+(.+)$', line)
+        for i, raw_line in enumerate(lines):
+            line_count = i + 1
+            line = raw_line[:-1] if raw_line.endswith("\n") else raw_line
+
+            heading_match = _HEADING_RE.match(line)
             if heading_match:
                 if current:
-                    current["line_end"] = i - 1
-                    current["content"] = "\n".join(lines[current["content_start"]:i]).strip()
-                    sections.append(current)
-
-                current = {
-                    "heading": line,
-                    "heading_text": heading_match.group(2).strip(),
-                    "heading_level": len(heading_match.group(1)),
-                    "line_start": i,
-                    "content_start": i + 1,
-                    "line_end": i,
-                    "content": "",
-                }
+                    sections.append(self._close_section(current, i - 1, buf))
+
+                buf = []
+                current = (line, heading_match, i)
+            elif current:
+                buf.append(line)
 
         # 마지막 섹션
         if current:
-            current["line_end"] = len(lines) - 1
-            current["content"] = "\n".join(lines[current["content_start"]:]).strip()
-            sections.append(current)
+            sections.append(self._close_section(current, line_count - 1, buf))
 
         return sections
 
-    def _classify_section(self, section: dict, force: bool) -> SectionScanResult:
+    def _close_section(
+        self,
+        current: tuple[str, re.Match, int],
+        line_end: int,
+        buf: list[str],
+    ) -> _SectionParse:
+        """누적된 본문으로 섹션 확정"""
+        heading, heading_match, line_start = current
+        return _SectionParse(
+            heading=heading,
+            heading_text=heading_match.group(2).strip(),
+            heading_level=len(heading_match.group(1)),
+            line_start=line_start,
+            line_end=line_end,
+            content="\n".join(buf).strip(),
+        )
+
+    def _classify_section(
+        self, section: _SectionParse, force: bool
+    ) -> SectionScanResult:
         """섹션 분류"""
-        heading_text = section["heading_text"]
-        content = section["content"]
+        heading_text = section.heading_text
+        content = section.content
 
         # 1. EXIST 체크: 이미 mermaid 블록이나 이미지가 있는가?
         if not force and self._has_existing_visual(content):
             return SectionScanResult(
-                heading=section["heading"],
-                heading_level=section["heading_level"],
+                heading=section.heading,
+                heading_level=section.heading_level,
                 content=content,
-                line_start=section["line_start"],
-                line_end=section["line_end"],
+                line_start=section.line_start,
+                line_end=section.line_end,
                 classification=SectionClassification.EXIST,
                 reason="이미 시각화 존재",
             )
 
-        # 2. SKIP 체크: 명확한 서술형 섹션인가?
+        # 2~3. SKIP / NEED 체크: 헤딩 키워드 매칭 (Aho-Corasick 1-pass)
+        # 우선순위: SKIP > Mermaid (다이어그램 타입 순) > HTML
         heading_lower = heading_text.lower()
-        for kw in SKIP_HEADING_KEYWORDS:
-            if kw.lower() in heading_lower:
-                return SectionScanResult(
-                    heading=section["heading"],
-                    heading_level=section["heading_level"],
-                    content=content,
-                    line_start=section["line_start"],
-                    line_end=section["line_end"],
-                    classification=SectionClassification.SKIP,
-                    reason=f"서술형 섹션 ('{kw}')",
-                )
-
-        # 3. NEED 체크: 시각화 키워드 매칭
-        # 3a. Mermaid 키워드 (다이어그램 타입별)
-        for diagram_type, keywords in VISUAL_HEADING_KEYWORDS["mermaid"].items():
-            for kw in keywords:
-                if len(kw) <= 3:
-                    if re.search(r'\b' + re.escape(kw.lower()) + r'\b', heading_lower):
-                        return SectionScanResult(
-                            heading=section["heading"],
-                            heading_level=section["heading_level"],
-                            content=content,
-                            line_start=section["line_start"],
-                            line_end=section["line_end"],
-                            classification=SectionClassification.NEED,
-                            suggested_tier=MockupBackend.MERMAID,
-                            suggested_diagram_type=diagram_type,
-                            reason=f"Mermaid {diagram_type} ('{kw}')",
-                        )
-                elif kw.lower() in heading_lower:
-                    return SectionScanResult(
-                        heading=section["heading"],
-                        heading_level=section["heading_level"],
-                        content=content,
-                        line_start=section["line_start"],
-                        line_end=section["line_end"],
-                        classification=SectionClassification.NEED,
-                        suggested_tier=MockupBackend.MERMAID,
-                        suggested_diagram_type=diagram_type,
-                        reason=f"Mermaid {diagram_type} ('{kw}')",
-                    )
-
-        # 3b. HTML 키워드
-        for kw in VISUAL_HEADING_KEYWORDS["html"]:
-            if kw.lower() in heading_lower:
-                return SectionScanResult(
-                    heading=section["heading"],
-                    heading_level=section["heading_level"],
-                    content=content,
-                    line_start=section["line_start"],
-                    line_end=section["line_end"],
-                    classification=SectionClassification.NEED,
-                    suggested_tier=MockupBackend.HTML,
-                    reason=f"HTML wireframe ('{kw}')",
-                )
+        rule = _match_heading_rule(heading_lower)
+        if rule:
+            return SectionScanResult(
+                heading=section.heading,
+                heading_level=section.heading_level,
+                content=content,
+                line_start=section.line_start,
+                line_end=section.line_end,
+                classification=rule.classification,
+                suggested_tier=rule.tier,
+                suggested_diagram_type=rule.diagram_type,
+                reason=rule.reason,
+            )
 
         # 4. 본문 내용 기반 추가 판단
         content_result = self._analyze_content(section)
@@ -231,58 +370,53 @@ class DocumentScanner:
 
         # 5. 기본값: SKIP
         return SectionScanResult(
-            heading=section["heading"],
-            heading_level=section["heading_level"],
+            heading=section.heading,
+            heading_level=section.heading_level,
             content=content,
-            line_start=section["line_start"],
-            line_end=section["line_end"],
+            line_start=section.line_start,
+            line_end=section.line_end,
             classification=SectionClassification.SKIP,
             reason="시각화 키워드 없음",
         )
 
     def _has_existing_visual(self, content: str) -> bool:
         """이미 시각화가 존재하는지 확인"""
-        # mermaid 코드 블록
-        if re.search(r'```mermaid', content):
+        # mermaid 코드 블록 (리터럴 검색, 정규식 불필요)
+        if "```mermaid" in content:
             return True
         # 이미지 참조
-        if re.search(r'!\[.*?\]\(.*?\)', content):
-            return True
-        return False
+        return _IMAGE_RE.search(content) is not None
 
-    def _analyze_content(self, section: dict) -> Optional[SectionScanResult]:
+    def _analyze_content(self, section: _SectionParse) -> SectionScanResult | None:
         """본문 내용 기반 추가 판단 (제목에 키워드 없을 때)"""
-        content = section["content"]
-        content_lower = content.lower()
+        content = section.content
 
         # 번호 매긴 단계가 3개 이상 있으면 flowchart 후보
-        numbered_steps = re.findall(r'^\d+[\.\)]\s', content, re.MULTILINE)
-        if len(numbered_steps) >= 3:
+        if _has_min_matches(_NUMBERED_STEP_RE, content, 3):
             return SectionScanResult(
-                heading=section["heading"],
-                heading_level=section["heading_level"],
+                heading=section.heading,
+                heading_level=section.heading_level,
                 content=content,
-                line_start=section["line_start"],
-                line_end=section["line_end"],
+                line_start=section.line_start,
+                line_end=section.line_end,
                 classification=SectionClassification.NEED,
                 suggested_tier=MockupBackend.MERMAID,
                 suggested_diagram_type="flowchart",
-                reason=f"번호 단계 {len(numbered_steps)}개 감지 → flowchart",
+                reason="번호 단계 3개 이상 감지 → flowchart",
             )
 
         # 화살표 패턴이 있으면 flowchart/sequence 후보
-        arrow_patterns = re.findall(r'→|->|>>|에서\s.*으로|부터\s.*까지', content)
-        if len(arrow_patterns) >= 2:
+        if _has_min_matches(_ARROW_RE, content, 2):
             return SectionScanResult(
-                heading=section["heading"],
-                heading_level=section["heading_level"],
+                heading=section.heading,
+                heading_level=section.heading_level,
                 content=content,
-                line_start=section["line_start"],
-                line_end=section["line_end"],
+                line_start=section.line_start,
+                line_end=section.line_end,
                 classification=SectionClassification.NEED,
                 suggested_tier=MockupBackend.MERMAID,
                 suggested_diagram_type="flowchart",
-                reason=f"화살표/흐름 패턴 {len(arrow_patterns)}개 감지",
+                reason="화살표/흐름 패턴 2개 이상 감지",
             )
 
         return None
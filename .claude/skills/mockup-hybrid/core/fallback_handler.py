@@ -10,8 +10,7 @@ from typing import Optional
 
 import yaml
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+from .. import _bootstrap  # noqa: F401  (프로젝트 루트를 sys.path에 등록)
 
 from lib.mockup_hybrid import MockupBackend, MockupOptions
 
@@ -1,7 +1,6 @@
 """CLI entrypoint for Ultimate Debate skill."""
 
 import argparse
-import asyncio
 import json
 import os
 import sys
@@ -17,28 +16,10 @@ PACKAGES_PATH = (
 if str(PACKAGES_PATH) not in sys.path:
     sys.path.insert(0, str(PACKAGES_PATH))
 
-# Core Engine 어댑터 사용 시도, 실패 시 레거시 모드
 try:
-    from adapter import CORE_AVAILABLE, UltimateDebateAdapter  # noqa: F401
-
-    USE_ADAPTER = CORE_AVAILABLE
-    if not USE_ADAPTER:
-        # Core Engine 사용 불가 시 레거시 모드로 fallback
-        from debate.orchestrator import UltimateDebate
-except ImportError:
-    USE_ADAPTER = False
-    from debate.orchestrator import UltimateDebate
-
-# AI 클라이언트 및 인증 시스템 임포트
-try:
-    from ultimate_debate.auth import TokenStore
-    from ultimate_debate.clients.gemini_client import GeminiClient
-    from ultimate_debate.clients.openai_client import OpenAIClient
-
-    AUTH_AVAILABLE = True
-except ImportError as e:
-    AUTH_AVAILABLE = False
-    AUTH_IMPORT_ERROR = str(e)
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
 
 
 def main():
@@ -142,8 +123,15 @@ def run_debate(task: str, max_rounds: int = 5, threshold: float = 0.8) -> dict:
     Returns:
         Final debate result
     """
-    # Core Engine 어댑터 또는 레거시 모드 선택
-    if USE_ADAPTER:
+    # Core Engine 어댑터 또는 레거시 모드 선택 (토론 실행 시에만 임포트)
+    try:
+        from adapter import CORE_AVAILABLE, UltimateDebateAdapter
+
+        use_adapter = CORE_AVAILABLE
+    except ImportError:
+        use_adapter = False
+
+    if use_adapter:
         print("[INFO] Using Core Engine (packages/ultimate-debate)")
         debate = UltimateDebateAdapter(
             task=task,
@@ -151,6 +139,9 @@ def run_debate(task: str, max_rounds: int = 5, threshold: float = 0.8) -> dict:
             consensus_threshold=threshold,
         )
     else:
+        # Core Engine 사용 불가 시 레거시 모드로 fallback
+        from debate.orchestrator import UltimateDebate
+
         print("[INFO] Using Legacy Mode (skills/ultimate-debate/scripts/debate)")
         debate = UltimateDebate(
             task=task,
@@ -172,12 +163,14 @@ def run_debate(task: str, max_rounds: int = 5, threshold: float = 0.8) -> dict:
         print(f"[INFO] 등록된 AI 클라이언트: {', '.join(registered_clients)}")
 
     print(
-        f"Starting debate: {debate.engine.task_id if USE_ADAPTER else debate.task_id}"
+        f"Starting debate: {debate.engine.task_id if use_adapter else debate.task_id}"
     )
     print(f"Task: {task}")
     print(f"Max rounds: {max_rounds}")
     print(f"Threshold: {threshold}\n")
 
+    import asyncio
+
     result = asyncio.run(debate.run())
 
     print("\nDebate completed!")
@@ -197,8 +190,13 @@ def register_ai_clients(debate) -> list[str]:
     Returns:
         list[str]: 등록된 클라이언트 이름 목록
     """
-    if not AUTH_AVAILABLE:
-        print(f"[WARNING] 인증 시스템 로드 실패: {AUTH_IMPORT_ERROR}", file=sys.stderr)
+    # AI 클라이언트 및 인증 시스템 임포트
+    try:
+        from ultimate_debate.auth import TokenStore
+        from ultimate_debate.clients.gemini_client import GeminiClient
+        from ultimate_debate.clients.openai_client import OpenAIClient
+    except ImportError as e:
+        print(f"[WARNING] 인증 시스템 로드 실패: {e}", file=sys.stderr)
         return []
 
     registered = []
@@ -259,8 +257,9 @@ def get_debate_status(task_id: str) -> dict:
     if task_file.exists():
         task_content = task_file.read_text(encoding="utf-8")
 
-    # Count rounds
-    rounds = sorted(debate_path.glob("round_*"))
+    # Count rounds (scandir: DirEntry 이름만 사용, Path 객체 생성 없음)
+    with os.scandir(debate_path) as entries:
+        round_names = sorted(e.name for e in entries if e.name.startswith("round_"))
 
     # Check for FINAL.md
     final_file = debate_path / "FINAL.md"
@@ -273,13 +272,33 @@ def get_debate_status(task_id: str) -> dict:
         "task_id": task_id,
         "debate_path": str(debate_path),
         "task_content": task_content,
-        "total_rounds": len(rounds),
-        "rounds": [r.name for r in rounds],
+        "total_rounds": len(round_names),
+        "rounds": round_names,
         "has_final": has_final,
         "final_content": final_content if has_final else None,
     }
 
 
+def to_json(data) -> str:
+    """Serialize data as indented JSON (orjson if available).
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        JSON string (non-ASCII characters kept as-is)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # orjson이 처리하지 못하는 타입(예: 64bit 초과 정수)은 표준 json으로
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def print_output(data: dict, output_format: str = "json") -> None:
     """Print output in specified format.
 
@@ -288,13 +307,13 @@ def print_output(data: dict, output_format: str = "json") -> None:
         output_format: Output format (json/text)
     """
     if output_format == "json":
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        print(to_json(data))
     else:
         # Text format
         for key, value in data.items():
             if isinstance(value, (dict, list)):
                 print(f"{key}:")
-                print(json.dumps(value, indent=2, ensure_ascii=False))
+                print(to_json(value))
             else:
                 print(f"{key}: {value}")
 
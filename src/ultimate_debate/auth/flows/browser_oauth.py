@@ -2,34 +2,142 @@
 
 Claude Code /login과 동일한 방식의 브라우저 기반 OAuth 인증.
 로컬 HTTP 서버를 띄워 callback을 수신합니다.
+
+콜백 서버는 호출자의 이벤트 루프에서 asyncio.start_server로 실행되며,
+콜백 결과는 세션별 asyncio.Future로 전달됩니다 (별도 스레드/전역 상태 없음).
+따라서 uvloop 등 asyncio 호환 이벤트 루프 정책을 그대로 사용할 수 있습니다.
 """
 
-import base64
+import asyncio
 import hashlib
+import hmac
+import html
 import logging
+import os
 import secrets
 import socket
+import sys
 import threading
+import time
 import webbrowser
-from dataclasses import dataclass
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from urllib.parse import parse_qs, urlencode, urlparse
+from dataclasses import dataclass, replace
+from http import HTTPStatus
+from urllib.parse import unquote_plus, urlencode, urlparse, urlsplit
 
-import httpx
 from rich.console import Console
 from rich.panel import Panel
 
+from ultimate_debate.auth.http_client import get_shared_client, json_loads
+
+try:
+    # 선택적 가속: pybase64 (libbase64 SIMD 구현, 동일 API)
+    from pybase64 import urlsafe_b64encode as _b64encode
+except ImportError:
+    import binascii
+
+    _B64URL_TABLE = bytes.maketrans(b"+/", b"-_")
+
+    def _b64encode(data: bytes) -> bytes:
+        """base64url 인코딩 (base64 모듈 래퍼 없이 binascii + 변환 테이블)."""
+        return binascii.b2a_base64(data, newline=False).translate(_B64URL_TABLE)
+
 logger = logging.getLogger(__name__)
 console = Console()
+# 비대화형(CI, 파이프) 출력이면 Rich 패널 렌더링 생략 (모듈 로드 시 1회 판정)
+_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+
+# 콜백 응답 페이지 (모듈 로드 시 1회 인코딩)
+_SUCCESS_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>인증 성공</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI',
+                         Roboto, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+        }
+        .container {
+            text-align: center;
+            padding: 40px;
+            background: rgba(255,255,255,0.1);
+            border-radius: 16px;
+            backdrop-filter: blur(10px);
+        }
+        h1 { font-size: 48px; margin-bottom: 16px; }
+        p { font-size: 18px; opacity: 0.9; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>✅ 인증 성공!</h1>
+        <p>이 창을 닫고 터미널로 돌아가세요.</p>
+    </div>
+    <script>setTimeout(() => window.close(), 3000);</script>
+</body>
+</html>
+""".encode()
+
+# favicon/robots 등 브라우저 자동 요청용 고정 응답 (헤더 조립 없이 1회 write)
+_NO_CONTENT = (
+    b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+)
+
+# 에러 페이지 템플릿 ({message}는 HTML 이스케이프 후 치환, CSS 중괄호는 {{ }})
+_ERROR_HTML_TEMPLATE = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>인증 실패</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI',
+                         Roboto, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
+            color: white;
+        }}
+        .container {{
+            text-align: center;
+            padding: 40px;
+            background: rgba(255,255,255,0.1);
+            border-radius: 16px;
+            backdrop-filter: blur(10px);
+        }}
+        h1 {{ font-size: 48px; margin-bottom: 16px; }}
+        p {{ font-size: 18px; opacity: 0.9; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>❌ 인증 실패</h1>
+        <p>{message}</p>
+    </div>
+</body>
+</html>
+"""
 
-# 세션별 콜백 결과 저장소 (state를 키로 사용)
-_callback_results: dict[str, dict] = {}
-_callback_lock = threading.Lock()
-# 세션별 이벤트 (콜백 수신 알림)
-_callback_events: dict[str, threading.Event] = {}
+# 메시지 앞/뒤 고정 부분은 미리 인코딩 (응답 시 이스케이프된 메시지만 인코딩)
+_ERROR_HTML_HEAD, _ERROR_HTML_TAIL = (
+    _ERROR_HTML_TEMPLATE.format(message="\0").encode().split(b"\0")
+)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PKCEChallenge:
     """PKCE (Proof Key for Code Exchange) 챌린지."""
 
@@ -38,7 +146,7 @@ class PKCEChallenge:
     code_challenge_method: str = "S256"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OAuthConfig:
     """OAuth 설정."""
 
@@ -51,7 +159,7 @@ class OAuthConfig:
     extra_params: dict | None = None  # 추가 인증 파라미터
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenResponse:
     """토큰 응답."""
 
@@ -60,6 +168,21 @@ class TokenResponse:
     token_type: str
     expires_in: int
     scope: str | None = None
+    # 만료 시각 (epoch 초, 생략 시 생성 시점 + expires_in)
+    expires_at: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.expires_at:
+            # frozen 데이터클래스이므로 object.__setattr__로 설정
+            object.__setattr__(self, "expires_at", time.time() + self.expires_in)
+
+    def is_expired(self, skew: int = 60) -> bool:
+        """만료 여부 (skew초 이내 만료 예정도 만료로 간주).
+
+        Args:
+            skew: 시계 오차/전송 지연 여유 (초)
+        """
+        return time.time() >= self.expires_at - skew
 
 
 class OAuthCallbackError(Exception):
@@ -68,204 +191,303 @@ class OAuthCallbackError(Exception):
     pass
 
 
-def generate_pkce_challenge() -> PKCEChallenge:
+def _b64url_nopad(data: bytes) -> str:
+    """base64url 인코딩 (패딩 제거)."""
+    return _b64encode(data).rstrip(b"=").decode("ascii")
+
+
+_sha256 = hashlib.sha256
+
+# 난수 길이 (바이트): verifier 48 → 64자, state 24 → 32자
+_VERIFIER_BYTES = 48
+_STATE_BYTES = 24
+
+
+class _EntropyPool:
+    """CSPRNG 출력을 미리 받아 두고 잘라 쓰는 난수 풀.
+
+    세션마다 getrandom(2)을 호출하지 않고 버퍼가 소진될 때만 다시 채운다.
+    한 번 내준 바이트는 다시 내주지 않으며, fork 후 자식 프로세스는
+    부모와 같은 난수를 쓰지 않도록 버퍼를 버린다.
+    """
+
+    __slots__ = ("_buf", "_lock", "_off", "_size")
+
+    def __init__(self, size: int = 4096) -> None:
+        self._size = size
+        self._buf = b""
+        self._off = 0
+        self._lock = threading.Lock()
+
+    def get(self, n: int) -> bytes:
+        """n바이트 난수 반환 (풀 크기보다 크면 직접 생성)."""
+        if n > self._size:
+            return secrets.token_bytes(n)
+        with self._lock:
+            if self._off + n > len(self._buf):
+                self._buf = secrets.token_bytes(self._size)
+                self._off = 0
+            off = self._off
+            self._off = off + n
+            return self._buf[off : off + n]
+
+    def reset(self) -> None:
+        """남은 버퍼 폐기 (다음 get에서 새로 채움)."""
+        self._buf = b""
+        self._off = 0
+        self._lock = threading.Lock()
+
+
+_entropy = _EntropyPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_entropy.reset)
+
+
+def generate_pkce_challenge(verifier_bytes: bytes | None = None) -> PKCEChallenge:
     """PKCE 챌린지 생성.
 
+    Args:
+        verifier_bytes: code_verifier용 난수 (None이면 새로 생성)
+
     Returns:
         PKCEChallenge: code_verifier와 code_challenge 포함
     """
-    # code_verifier: 43-128자의 랜덤 문자열
-    code_verifier = secrets.token_urlsafe(64)
+    if verifier_bytes is None:
+        verifier_bytes = _entropy.get(_VERIFIER_BYTES)
+
+    # code_verifier: 43-128자의 랜덤 문자열 (48바이트 → 패딩 없는 64자)
+    # ASCII bytes 상태로 해시에 바로 사용 (str → bytes 재인코딩 없음)
+    verifier = _b64encode(verifier_bytes).rstrip(b"=")
 
-    # code_challenge: code_verifier의 SHA256 해시를 base64url 인코딩
-    digest = hashlib.sha256(code_verifier.encode()).digest()
-    code_challenge = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+    # code_challenge: BASE64URL(SHA256(ASCII(code_verifier))) (RFC 7636)
+    # (32바이트 digest → 43자 + '=' 1개이므로 rstrip 대신 슬라이스)
+    digest = _sha256(verifier).digest()
+    code_challenge = _b64encode(digest)[:43].decode("ascii")
 
     return PKCEChallenge(
-        code_verifier=code_verifier,
+        code_verifier=verifier.decode("ascii"),
         code_challenge=code_challenge,
         code_challenge_method="S256",
     )
 
 
+def _open_browser(url: str) -> None:
+    """브라우저를 백그라운드 스레드에서 열기 (프로세스 기동 지연 회피)."""
+    threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+
+
+def _acquire_port_socket() -> socket.socket:
+    """loopback 임의 포트에 바인딩된 소켓 반환 (닫지 않고 유지).
+
+    포트 번호만 반환 후 재바인딩하면 그 사이 다른 프로세스가
+    포트를 가져갈 수 있으므로(TOCTOU), 바인딩된 소켓을 그대로 서버에 넘깁니다.
+
+    Returns:
+        socket.socket: 바인딩된 TCP 소켓 (listen 전)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.bind(("127.0.0.1", 0))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
 def find_free_port() -> int:
     """사용 가능한 포트 찾기.
 
     Returns:
         int: 사용 가능한 포트 번호
     """
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("localhost", 0))
+    with _acquire_port_socket() as s:
         return s.getsockname()[1]
 
 
-class OAuthCallbackHandler(BaseHTTPRequestHandler):
-    """OAuth Callback 핸들러."""
+# 콜백에서 사용하는 쿼리 파라미터 (그 외 키는 디코딩하지 않음)
+_CALLBACK_PARAM_KEYS = frozenset({"code", "state", "error", "error_description"})
+
+
+def extract_callback_params(query: str) -> dict[str, str]:
+    """콜백 쿼리에서 필요한 키만 1회 순회로 추출 (키별 첫 값 사용).
+
+    parse_qs와 달리 값마다 리스트를 만들지 않고, 관심 없는 키는
+    디코딩하지 않으므로 `?a=&a=&...` 같은 반복 키 입력에도 비용이 늘지 않습니다.
+    """
+    params: dict[str, str] = {}
+    for pair in query.split("&"):
+        key, _, value = pair.partition("=")
+        if key in _CALLBACK_PARAM_KEYS and key not in params:
+            params[key] = unquote_plus(value)
+    return params
+
+
+def _set_result_once(future: asyncio.Future, result: dict) -> None:
+    """Future가 아직 대기 중일 때만 결과 설정 (브라우저 재시도 등 중복 콜백 무시)."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _http_response(
+    status: HTTPStatus,
+    body: bytes = b"",
+    content_type: str = "text/html; charset=utf-8",
+) -> bytes:
+    """HTTP/1.1 응답 바이트 조립 (Content-Length 명시, 연결 종료)."""
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+# 고정 응답 (모듈 로드 시 1회 조립)
+_SUCCESS_RESPONSE = _http_response(HTTPStatus.OK, _SUCCESS_HTML)
+_NOT_FOUND = _http_response(HTTPStatus.NOT_FOUND)
+_METHOD_NOT_ALLOWED = _http_response(HTTPStatus.METHOD_NOT_ALLOWED)
+_MISSING_CODE = _http_response(
+    HTTPStatus.BAD_REQUEST, b"Missing authorization code", "text/plain"
+)
+
+# 콜백 서버 listen 대기열 (콜백 1건 + favicon/preconnect 등 소수 연결만 발생)
+_CALLBACK_BACKLOG = 8
+
+# 요청 라인 + 헤더 수신 제한 시간 (preconnect 등 유휴 연결이 종료를 막지 않도록)
+_REQUEST_READ_TIMEOUT = 10.0
+
+
+class OAuthCallbackHandler:
+    """OAuth Callback 핸들러.
+
+    asyncio.start_server의 연결 콜백으로 사용되며, 세션 1개 전용입니다.
+    콜백 결과는 이벤트 루프 안에서 세션 Future에 직접 설정됩니다.
+    """
+
+    def __init__(self, expected_state: str, result_future: asyncio.Future):
+        """초기화.
 
-    def log_message(self, format, *args):
-        """로그 출력 비활성화."""
-        pass
+        Args:
+            expected_state: 이 세션의 OAuth state
+            result_future: 콜백 결과를 받을 Future
+        """
+        self.expected_state = expected_state
+        # 상수 시간 비교용 (요청마다 인코딩하지 않도록 1회 변환)
+        self._expected_state_bytes = expected_state.encode()
+        self.result_future = result_future
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    async def __call__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """연결 1개 처리 (요청 1건 → 응답 → 연결 종료)."""
+        self._writers.add(writer)
+        try:
+            request = await asyncio.wait_for(
+                self._read_request(reader), _REQUEST_READ_TIMEOUT
+            )
+            if request is None:
+                return
+            writer.write(self._respond(*request))
+            await writer.drain()
+        except (TimeoutError, ValueError, asyncio.IncompleteReadError, OSError):
+            # 유휴/비정상 연결은 응답 없이 종료
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def close_connections(self) -> None:
+        """남은 연결 강제 종료 (server.wait_closed()가 유휴 연결에 막히지 않도록)."""
+        for writer in list(self._writers):
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str] | None:
+        """요청 라인 파싱 후 헤더 소비.
+
+        Returns:
+            tuple[str, str] | None: (method, target), 요청이 없으면 None
+        """
+        request_line = await reader.readline()
+        # 헤더는 사용하지 않지만 응답 전에 소비 (미수신 데이터가 남은 채 닫으면 RST)
+        while await reader.readline() not in (b"\r\n", b"\n", b""):
+            pass
 
-    def do_GET(self):
-        """GET 요청 처리 (OAuth callback)."""
-        parsed = urlparse(self.path)
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3:
+            return None
+        return parts[0], parts[1]
+
+    def _respond(self, method: str, target: str) -> bytes:
+        """요청 처리 후 응답 바이트 반환 (OAuth callback)."""
+        if method != "GET":
+            return _METHOD_NOT_ALLOWED
+
+        parsed = urlsplit(target)
 
         logger.debug("Received request: %s", parsed.path)
 
         # favicon.ico 및 기타 브라우저 자동 요청 무시
-        if parsed.path in ["/favicon.ico", "/robots.txt"]:
-            self.send_response(204)  # No Content
-            self.end_headers()
-            return
+        if parsed.path in ("/favicon.ico", "/robots.txt"):
+            return _NO_CONTENT
 
         # OAuth 콜백 경로가 아니면 무시
-        if parsed.path not in ["/auth/callback", "/callback"]:
+        if parsed.path not in ("/auth/callback", "/callback"):
             logger.warning("Invalid callback path: %s", parsed.path)
-            self.send_response(404)
-            self.end_headers()
-            return
+            return _NOT_FOUND
 
-        params = parse_qs(parsed.query)
+        params = extract_callback_params(parsed.query)
 
         logger.debug("Callback params: %s", list(params.keys()))
 
         # state 추출 (세션 식별)
-        state = params.get("state", [None])[0]
+        state = params.get("state")
         state_preview = state[:16] if state else None
         logger.debug("State: %s...", state_preview)
 
-        # 에러 체크
-        if "error" in params:
-            error = params["error"][0]
+        # 다른 세션/위조 state는 결과 설정 전에 거부
+        if not self._is_session_state(state):
+            logger.warning("State mismatch, ignoring callback: %s", state_preview)
+            return _STATE_MISMATCH
+
+        # 에러 체크 (빈 값은 parse_qs와 같이 없는 것으로 취급)
+        error = params.get("error")
+        if error:
             logger.error("OAuth error: %s", error)
-            if state:
-                with _callback_lock:
-                    _callback_results[state] = {
-                        "auth_code": None,
-                        "error": error
-                    }
-            self._send_error_response(
-                params.get("error_description", ["인증 거부됨"])[0]
-            )
-            return
+            result = {"auth_code": None, "error": error}
+            _set_result_once(self.result_future, result)
+            return _error_response(params.get("error_description") or "인증 거부됨")
 
         # 코드 추출
-        if "code" in params:
-            auth_code = params["code"][0]
+        auth_code = params.get("code")
+        if auth_code:
             code_preview = auth_code[:16]
             logger.debug("Auth code received: %s...", code_preview)
-            if state:
-                with _callback_lock:
-                    _callback_results[state] = {
-                        "auth_code": auth_code,
-                        "error": None
-                    }
-                    logger.debug("Stored callback result: %s...", state_preview)
-                    # 이벤트 시그널 (대기 중인 스레드에 알림)
-                    if state in _callback_events:
-                        _callback_events[state].set()
-                        logger.debug("Event set: %s", state_preview)
-            else:
-                logger.warning("No state in callback, cannot store result")
-            self._send_success_response()
-        else:
-            # code가 없는 요청은 에러
-            logger.warning("No code in callback parameters")
-            self.send_response(400)
-            self.send_header("Content-type", "text/plain")
-            self.end_headers()
-            self.wfile.write(b"Missing authorization code")
-
-    def _send_success_response(self):
-        """성공 응답 전송."""
-        self.send_response(200)
-        self.send_header("Content-type", "text/html; charset=utf-8")
-        self.end_headers()
-
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>인증 성공</title>
-            <style>
-                body {
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI',
-                                 Roboto, sans-serif;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    height: 100vh;
-                    margin: 0;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                }
-                .container {
-                    text-align: center;
-                    padding: 40px;
-                    background: rgba(255,255,255,0.1);
-                    border-radius: 16px;
-                    backdrop-filter: blur(10px);
-                }
-                h1 { font-size: 48px; margin-bottom: 16px; }
-                p { font-size: 18px; opacity: 0.9; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>✅ 인증 성공!</h1>
-                <p>이 창을 닫고 터미널로 돌아가세요.</p>
-            </div>
-            <script>setTimeout(() => window.close(), 3000);</script>
-        </body>
-        </html>
-        """
-        self.wfile.write(html.encode())
-
-    def _send_error_response(self, message: str):
-        """에러 응답 전송."""
-        self.send_response(400)
-        self.send_header("Content-type", "text/html; charset=utf-8")
-        self.end_headers()
-
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>인증 실패</title>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI',
-                                 Roboto, sans-serif;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    height: 100vh;
-                    margin: 0;
-                    background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
-                    color: white;
-                }}
-                .container {{
-                    text-align: center;
-                    padding: 40px;
-                    background: rgba(255,255,255,0.1);
-                    border-radius: 16px;
-                    backdrop-filter: blur(10px);
-                }}
-                h1 {{ font-size: 48px; margin-bottom: 16px; }}
-                p {{ font-size: 18px; opacity: 0.9; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>❌ 인증 실패</h1>
-                <p>{message}</p>
-            </div>
-        </body>
-        </html>
-        """
-        self.wfile.write(html.encode())
+            result = {"auth_code": auth_code, "error": None}
+            _set_result_once(self.result_future, result)
+            logger.debug("Resolved callback result: %s...", state_preview)
+            return _SUCCESS_RESPONSE
+
+        # code가 없는 요청은 에러
+        logger.warning("No code in callback parameters")
+        return _MISSING_CODE
+
+    def _is_session_state(self, state: str | None) -> bool:
+        """콜백 state가 이 세션의 state와 일치하는지 확인 (상수 시간 비교)."""
+        return state is not None and hmac.compare_digest(
+            state.encode(), self._expected_state_bytes
+        )
+
+
+def _error_response(message: str) -> bytes:
+    """에러 페이지 응답 (메시지는 HTML 이스케이프)."""
+    body = _ERROR_HTML_HEAD + html.escape(message).encode() + _ERROR_HTML_TAIL
+    return _http_response(HTTPStatus.BAD_REQUEST, body)
+
+
+_STATE_MISMATCH = _error_response("세션 state가 일치하지 않습니다.")
 
 
 class BrowserOAuth:
@@ -305,22 +527,45 @@ class BrowserOAuth:
             auto_open_browser: 브라우저 자동 열기 (기본 False)
         """
         self.config = config
-        self.pkce = generate_pkce_challenge()
-        self.state = secrets.token_urlsafe(32)
-        self.port = fixed_port if fixed_port else find_free_port()
+        # verifier/state 난수를 공유 난수 풀에서 한 번에 가져옴
+        rnd = _entropy.get(_VERIFIER_BYTES + _STATE_BYTES)
+        self.pkce = generate_pkce_challenge(rnd[:_VERIFIER_BYTES])
+        self.state = _b64url_nopad(rnd[_VERIFIER_BYTES:])
+        # 자동 포트는 바인딩된 소켓째로 보관 → 콜백 서버가 그대로 인수
+        # (수동 모드는 로컬 서버를 띄우지 않으므로 포트 예약 불필요)
+        self._presocket: socket.socket | None = None
+        if fixed_port:
+            self.port = fixed_port
+        elif manual_callback:
+            self.port = find_free_port()
+        else:
+            self._presocket = _acquire_port_socket()
+            self.port = self._presocket.getsockname()[1]
         self.manual_callback = manual_callback
         self.auto_open_browser = auto_open_browser
 
-        # redirect_uri에 포트 적용
-        if "{port}" in self.config.redirect_uri:
-            self.config.redirect_uri = self.config.redirect_uri.format(port=self.port)
+        # redirect_uri에 포트 적용 (공유 설정을 변경하지 않도록 인스턴스별 사본)
+        if "{port}" in config.redirect_uri:
+            self.config = replace(
+                config, redirect_uri=config.redirect_uri.format(port=self.port)
+            )
 
-    def _build_authorization_url(self) -> str:
-        """인증 URL 생성.
+        # 인증 URL은 인스턴스 수명 동안 불변 → 1회만 생성
+        self._auth_url = self._encode_authorization_url()
 
-        Returns:
-            str: 인증 URL
-        """
+    def close(self) -> None:
+        """인증 없이 폐기할 때 예약해 둔 포트 소켓 해제 (여러 번 호출해도 안전)."""
+        sock, self._presocket = self._presocket, None
+        if sock is not None:
+            sock.close()
+
+    def __del__(self) -> None:
+        # __init__ 도중 실패해 속성이 없을 수 있음
+        if getattr(self, "_presocket", None) is not None:
+            self.close()
+
+    def _encode_authorization_url(self) -> str:
+        """인증 URL 인코딩 (설정/PKCE/state 확정 후 1회 호출)."""
         params = {
             "client_id": self.config.client_id,
             "redirect_uri": self.config.redirect_uri,
@@ -337,6 +582,14 @@ class BrowserOAuth:
 
         return f"{self.config.authorization_endpoint}?{urlencode(params)}"
 
+    def _build_authorization_url(self) -> str:
+        """인증 URL 반환.
+
+        Returns:
+            str: 인증 URL
+        """
+        return self._auth_url
+
     async def _exchange_code_for_token(self, code: str) -> TokenResponse:
         """인증 코드를 토큰으로 교환.
 
@@ -357,25 +610,29 @@ class BrowserOAuth:
         if self.config.client_secret:
             data["client_secret"] = self.config.client_secret
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.config.token_endpoint,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        client = await get_shared_client()
+        response = await client.post(
+            self.config.token_endpoint,
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
-            if response.status_code != 200:
-                raise OAuthCallbackError(f"토큰 교환 실패: {response.text}")
+        if response.status_code != 200:
+            # 오설정된 엣지의 대용량 HTML 등을 통째로 디코딩하지 않도록 1 KiB만 사용
+            detail = response.content[:1024].decode("utf-8", "replace")
+            raise OAuthCallbackError(
+                f"토큰 교환 실패 ({response.status_code}): {detail}"
+            )
 
-            result = response.json()
+        result = json_loads(response.content)
 
-            return TokenResponse(
-                access_token=result["access_token"],
-                refresh_token=result.get("refresh_token"),
-                token_type=result.get("token_type", "Bearer"),
-                expires_in=result.get("expires_in", 3600),
-                scope=result.get("scope"),
-            )
+        return TokenResponse(
+            access_token=result["access_token"],
+            refresh_token=result.get("refresh_token"),
+            token_type=result.get("token_type", "Bearer"),
+            expires_in=result.get("expires_in", 3600),
+            scope=result.get("scope"),
+        )
 
     def _parse_callback_url(self, callback_url: str) -> tuple[str, str]:
         """콜백 URL에서 code와 state 추출.
@@ -390,19 +647,18 @@ class BrowserOAuth:
             OAuthCallbackError: 파싱 실패 시
         """
         parsed = urlparse(callback_url)
-        params = parse_qs(parsed.query)
+        # 일부 IdP는 파라미터를 fragment(#...)로 전달
+        params = extract_callback_params(parsed.query or parsed.fragment)
 
-        if "error" in params:
-            error_desc = params.get("error_description", ["인증 거부됨"])[0]
+        if params.get("error"):
+            error_desc = params.get("error_description") or "인증 거부됨"
             raise OAuthCallbackError(f"인증 실패: {error_desc}")
 
-        if "code" not in params:
+        code = params.get("code")
+        if not code:
             raise OAuthCallbackError("URL에서 code 파라미터를 찾을 수 없습니다.")
 
-        code = params["code"][0]
-        state = params.get("state", [None])[0]
-
-        return code, state
+        return code, params.get("state")
 
     async def authenticate_manual(self) -> TokenResponse:
         """수동 콜백 인증 수행.
@@ -417,25 +673,28 @@ class BrowserOAuth:
         auth_url = self._build_authorization_url()
 
         # 안내 출력
-        console.print()
-        console.print(
-            Panel.fit(
-                "[bold cyan]수동 OAuth 인증 모드[/bold cyan]\n\n"
-                "1. 아래 URL을 브라우저에서 엽니다\n"
-                "2. 로그인을 완료합니다\n"
-                "3. 리디렉션된 URL (에러 페이지 포함)을 복사합니다\n"
-                "4. 복사한 URL을 아래에 붙여넣습니다",
-                title="[AUTH] Manual OAuth Login",
-                border_style="yellow",
+        if _IS_TTY:
+            console.print()
+            console.print(
+                Panel.fit(
+                    "[bold cyan]수동 OAuth 인증 모드[/bold cyan]\n\n"
+                    "1. 아래 URL을 브라우저에서 엽니다\n"
+                    "2. 로그인을 완료합니다\n"
+                    "3. 리디렉션된 URL (에러 페이지 포함)을 복사합니다\n"
+                    "4. 복사한 URL을 아래에 붙여넣습니다",
+                    title="[AUTH] Manual OAuth Login",
+                    border_style="yellow",
+                )
             )
-        )
-        console.print()
-        console.print("[bold]인증 URL:[/bold]")
-        console.print(f"[link={auth_url}]{auth_url}[/link]")
-        console.print()
+            console.print()
+            console.print("[bold]인증 URL:[/bold]")
+            console.print(f"[link={auth_url}]{auth_url}[/link]")
+            console.print()
+        else:
+            print(f"[AUTH] Manual OAuth Login\n인증 URL:\n{auth_url}", flush=True)
 
         # 브라우저 자동 열기
-        webbrowser.open(auth_url)
+        _open_browser(auth_url)
         console.print("[dim]브라우저가 열렸습니다. 로그인 후 URL을 복사하세요.[/dim]")
         console.print()
 
@@ -443,8 +702,9 @@ class BrowserOAuth:
         console.print("[bold yellow]리디렉션된 URL을 붙여넣으세요:[/bold yellow]")
         console.print("[dim](localhost:1455... 또는 에러 페이지 URL 전체)[/dim]")
 
+        # input()은 블로킹이므로 이벤트 루프를 막지 않도록 워커 스레드에서 호출
         try:
-            callback_url = input("> ").strip()
+            callback_url = (await asyncio.to_thread(input, "> ")).strip()
         except (EOFError, KeyboardInterrupt) as e:
             raise OAuthCallbackError("사용자가 취소했습니다.") from e
 
@@ -455,7 +715,7 @@ class BrowserOAuth:
         code, state = self._parse_callback_url(callback_url)
 
         # state 검증
-        if state and state != self.state:
+        if state and not hmac.compare_digest(state.encode(), self.state.encode()):
             console.print("[yellow]Warning: State 불일치 (보안 경고)[/yellow]")
             # 계속 진행 (수동 모드에서는 허용)
 
@@ -469,39 +729,16 @@ class BrowserOAuth:
 
         return token
 
-    async def authenticate(self, timeout: int = 300) -> TokenResponse:
-        """인증 수행.
+    def _print_login_instructions(self, auth_url: str) -> None:
+        """로그인 안내 출력 (비대화형 환경에서는 Rich 렌더링 생략).
 
         Args:
-            timeout: 타임아웃 (초)
-
-        Returns:
-            TokenResponse: 토큰 응답
+            auth_url: 인증 URL
         """
-        # 수동 콜백 모드
-        if self.manual_callback:
-            return await self.authenticate_manual()
-
-        # 이 세션의 state로 결과를 추적
-        session_state = self.state
-
-        # 이벤트 생성 (콜백 수신 대기용)
-        callback_event = threading.Event()
-        with _callback_lock:
-            _callback_events[session_state] = callback_event
-
-        # 로컬 서버 시작 (0.0.0.0으로 모든 인터페이스 바인딩)
-        # Windows에서 localhost와 127.0.0.1 모두 받기 위해
-        server = HTTPServer(("0.0.0.0", self.port), OAuthCallbackHandler)
-        server.timeout = 1  # 1초마다 이벤트 체크
-        logger.debug("Server on 0.0.0.0:%d", self.port)
-
-        # 인증 URL 생성
-        auth_url = self._build_authorization_url()
-
-        # 안내 출력
-        console.print()
-        if self.auto_open_browser:
+        if not _IS_TTY:
+            print(f"[AUTH] Login Required\n인증 URL:\n{auth_url}", flush=True)
+        elif self.auto_open_browser:
+            console.print()
             console.print(
                 Panel.fit(
                     f"[bold cyan]브라우저가 자동으로 열립니다.[/bold cyan]\n\n"
@@ -512,9 +749,9 @@ class BrowserOAuth:
                 )
             )
             console.print()
-            webbrowser.open(auth_url)
         else:
             # URL만 출력 (사용자가 직접 복사)
+            console.print()
             console.print(
                 Panel.fit(
                     f"[bold cyan]아래 URL을 브라우저에서 열어주세요:[/bold cyan]\n\n"
@@ -525,61 +762,63 @@ class BrowserOAuth:
             )
             console.print()
 
-        console.print("[dim]브라우저에서 로그인 후 대기 중...[/dim]")
+    async def authenticate(self, timeout: int = 300) -> TokenResponse:
+        """인증 수행.
 
-        # 서버를 별도 스레드에서 실행
-        server_stop = threading.Event()
+        Args:
+            timeout: 타임아웃 (초)
 
-        def serve():
-            logger.debug("Listening on port %d", self.port)
-            while not server_stop.is_set():
-                server.handle_request()
-            logger.debug("Server exiting")
+        Returns:
+            TokenResponse: 토큰 응답
+        """
+        # 수동 콜백 모드
+        if self.manual_callback:
+            return await self.authenticate_manual()
 
-        thread = threading.Thread(target=serve, daemon=True)
-        thread.start()
+        # 콜백 결과는 이 세션의 Future로 직접 전달됨
+        loop = asyncio.get_running_loop()
+        result_future: asyncio.Future = loop.create_future()
 
-        # 콜백 이벤트 대기 (타임아웃까지)
-        logger.debug("Waiting for callback (timeout: %ds)", timeout)
-        callback_received = callback_event.wait(timeout=timeout)
+        handler = OAuthCallbackHandler(self.state, result_future)
 
-        # 서버 중지 신호
-        server_stop.set()
+        # 로컬 서버 시작 (loopback 전용 바인딩, 외부 인터페이스 노출 없음)
+        # 같은 이벤트 루프에서 처리 → 스레드 전환 없이 Future에 직접 결과 설정
+        if self._presocket is not None:
+            # 예약 소켓은 서버 소유로 이전 (재호출 시에는 포트 재바인딩)
+            sock, self._presocket = self._presocket, None
+            server = await asyncio.start_server(
+                handler, sock=sock, backlog=_CALLBACK_BACKLOG
+            )
+        else:
+            server = await asyncio.start_server(
+                handler, "127.0.0.1", self.port, backlog=_CALLBACK_BACKLOG
+            )
+        logger.debug("Listening on 127.0.0.1:%d", self.port)
 
-        # 서버 깨우기 위해 더미 요청 (블로킹 handle_request 탈출)
         try:
-            import urllib.request
-            shutdown_url = f"http://localhost:{self.port}/__shutdown__"
-            urllib.request.urlopen(shutdown_url, timeout=1)
-        except Exception:
-            pass  # 무시
-
-        thread.join(timeout=2)  # 스레드 종료 대기
-
-        server.server_close()
-        logger.debug("HTTP Server closed")
-
-        # 결과 확인
-        with _callback_lock:
-            result = _callback_results.get(session_state)
-            # 결과를 가져온 후 삭제 (메모리 정리)
-            if session_state in _callback_results:
-                del _callback_results[session_state]
-            if session_state in _callback_events:
-                del _callback_events[session_state]
-
-            logger.debug("Callback result: %s", result)
-
-        state_preview = session_state[:16]
-        if not callback_received:
-            logger.error("Timeout waiting for callback: %s...", state_preview)
-            raise OAuthCallbackError("인증 시간이 초과되었습니다.")
-
-        if result is None:
-            logger.error("No callback received: %s...", state_preview)
-            states = list(_callback_results.keys())
-            logger.debug("Available states: %s", states)
-            raise OAuthCallbackError("인증 시간이 초과되었습니다.")
+            # 인증 URL 생성
+            auth_url = self._build_authorization_url()
+
+            self._print_login_instructions(auth_url)
+            console.print("[dim]브라우저에서 로그인 후 대기 중...[/dim]")
+
+            if self.auto_open_browser:
+                _open_browser(auth_url)
+
+            # 콜백 Future 대기 (타임아웃까지, 이벤트 루프를 막지 않음)
+            logger.debug("Waiting for callback (timeout: %ds)", timeout)
+            result = await asyncio.wait_for(result_future, timeout=timeout)
+        except TimeoutError:
+            logger.error("Timeout waiting for callback: %s...", self.state[:16])
+            raise OAuthCallbackError("인증 시간이 초과되었습니다.") from None
+        finally:
+            # 어떤 경로로 종료되든 서버 정리 (리스닝 중지 → 남은 연결 종료)
+            server.close()
+            handler.close_connections()
+            await server.wait_closed()
+            logger.debug("HTTP Server closed")
+
+        logger.debug("Callback result: %s", result)
 
         if result["error"]:
             raise OAuthCallbackError(f"인증 실패: {result['error']}")
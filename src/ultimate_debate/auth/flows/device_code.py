@@ -12,14 +12,19 @@ OpenAI와 같이 localhost 콜백이 차단된 환경에서 사용.
 """
 
 import asyncio
+import random
 import time
 from dataclasses import dataclass
 
-import httpx
 from rich.console import Console
 from rich.panel import Panel
 
-from ultimate_debate.auth.flows.browser_oauth import TokenResponse
+from ultimate_debate.auth.flows.browser_oauth import TokenResponse, _open_browser
+from ultimate_debate.auth.http_client import (
+    get_shared_client,
+    json_loads,
+    retry_after_seconds,
+)
 
 console = Console()
 
@@ -30,7 +35,7 @@ class DeviceCodeError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCodeResponse:
     """Device Code 응답.
 
@@ -51,7 +56,7 @@ class DeviceCodeResponse:
     verification_uri_complete: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCodeConfig:
     """Device Code Flow 설정.
 
@@ -91,6 +96,12 @@ class DeviceCodeOAuth:
     ERROR_EXPIRED_TOKEN = "expired_token"
     ERROR_ACCESS_DENIED = "access_denied"
 
+    # 폴링 간격 상한 (slow_down 반복 시 무한 증가 방지, 초)
+    MAX_POLL_INTERVAL = 60
+    # 동시에 시작한 클라이언트가 몰리지 않도록 대기 시간에 더하는 지터 비율
+    # (RFC 8628: interval 미만으로는 대기하지 않으므로 위쪽으로만 적용)
+    POLL_JITTER = 0.1
+
     def __init__(self, config: DeviceCodeConfig):
         """초기화.
 
@@ -110,30 +121,30 @@ class DeviceCodeOAuth:
         Raises:
             DeviceCodeError: 요청 실패 시
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.config.device_authorization_endpoint,
-                data={
-                    "client_id": self.config.client_id,
-                    "scope": self.config.scope,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        client = await get_shared_client()
+        response = await client.post(
+            self.config.device_authorization_endpoint,
+            data={
+                "client_id": self.config.client_id,
+                "scope": self.config.scope,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
-            if response.status_code != 200:
-                msg = f"device code 요청 실패: {response.status_code}"
-                raise DeviceCodeError(msg)
+        if response.status_code != 200:
+            msg = f"device code 요청 실패: {response.status_code}"
+            raise DeviceCodeError(msg)
 
-            data = response.json()
+        data = json_loads(response.content)
 
-            return DeviceCodeResponse(
-                device_code=data["device_code"],
-                user_code=data["user_code"],
-                verification_uri=data["verification_uri"],
-                verification_uri_complete=data.get("verification_uri_complete"),
-                expires_in=data.get("expires_in", 900),  # 기본 15분
-                interval=data.get("interval", 5),  # 기본 5초
-            )
+        return DeviceCodeResponse(
+            device_code=data["device_code"],
+            user_code=data["user_code"],
+            verification_uri=data["verification_uri"],
+            verification_uri_complete=data.get("verification_uri_complete"),
+            expires_in=data.get("expires_in", 900),  # 기본 15분
+            interval=data.get("interval", 5),  # 기본 5초
+        )
 
     async def poll_for_token(
         self,
@@ -156,70 +167,80 @@ class DeviceCodeOAuth:
         Raises:
             DeviceCodeError: 인증 실패, 만료, 거부 시
         """
-        start_time = time.time()
+        # 단조 시계 기준 마감 시각 (시스템 시계 변경에 영향받지 않음)
+        deadline = time.monotonic() + timeout
         current_interval = interval
 
-        async with httpx.AsyncClient() as client:
-            while True:
-                # 타임아웃 체크
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
-                    raise DeviceCodeError("인증 시간 초과 (timeout)")
-
-                # 토큰 요청
-                response = await client.post(
-                    self.config.token_endpoint,
-                    data={
-                        "client_id": self.config.client_id,
-                        "device_code": device_code,
-                        "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+        client = await get_shared_client()
+        # 첫 요청은 대기 없이 즉시 전송 (대기는 pending/slow_down 응답 후에만)
+        while True:
+            # 타임아웃 체크
+            if time.monotonic() >= deadline:
+                raise DeviceCodeError("인증 시간 초과 (timeout)")
+
+            # 토큰 요청
+            response = await client.post(
+                self.config.token_endpoint,
+                data={
+                    "client_id": self.config.client_id,
+                    "device_code": device_code,
+                    "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+
+            if response.status_code == 200:
+                # 성공
+                data = json_loads(response.content)
+                return TokenResponse(
+                    access_token=data["access_token"],
+                    refresh_token=data.get("refresh_token"),
+                    token_type=data.get("token_type", "Bearer"),
+                    expires_in=data.get("expires_in", 3600),
+                    scope=data.get("scope"),
                 )
 
-                if response.status_code == 200:
-                    # 성공
-                    data = response.json()
-                    return TokenResponse(
-                        access_token=data["access_token"],
-                        refresh_token=data.get("refresh_token"),
-                        token_type=data.get("token_type", "Bearer"),
-                        expires_in=data.get("expires_in", 3600),
-                        scope=data.get("scope"),
-                    )
-
-                # 에러 응답 처리
-                try:
-                    error_data = response.json()
-                    error = error_data.get("error", "")
-                    error_description = error_data.get("error_description", "")
-                except Exception as e:
-                    msg = f"토큰 요청 실패: {response.status_code}"
-                    raise DeviceCodeError(msg) from e
-
-                if error == self.ERROR_AUTHORIZATION_PENDING:
-                    # 아직 사용자가 인증하지 않음 - 계속 폴링
-                    await asyncio.sleep(current_interval)
-                    continue
-
-                elif error == self.ERROR_SLOW_DOWN:
-                    # 폴링 속도 감소 요청
-                    current_interval += 5  # RFC 8628: 5초 추가
-                    await asyncio.sleep(current_interval)
-                    continue
-
-                elif error == self.ERROR_EXPIRED_TOKEN:
-                    # device_code 만료
-                    raise DeviceCodeError(f"Device code expired: {error_description}")
-
-                elif error == self.ERROR_ACCESS_DENIED:
-                    # 사용자가 거부
-                    raise DeviceCodeError(f"Access denied: {error_description}")
-
-                else:
-                    # 기타 에러
-                    msg = f"토큰 요청 실패: {error} - {error_description}"
-                    raise DeviceCodeError(msg)
+            # 에러 응답 처리
+            try:
+                error_data = json_loads(response.content)
+                error = error_data.get("error", "")
+                error_description = error_data.get("error_description", "")
+            except Exception as e:
+                msg = f"토큰 요청 실패: {response.status_code}"
+                raise DeviceCodeError(msg) from e
+
+            if error == self.ERROR_AUTHORIZATION_PENDING:
+                # 아직 사용자가 인증하지 않음 - 계속 폴링
+                await self._sleep_until_next_poll(current_interval, deadline)
+                continue
+
+            elif error == self.ERROR_SLOW_DOWN:
+                # 폴링 속도 감소 요청 (Retry-After 우선, 없으면 RFC 8628: 5초 추가)
+                current_interval = min(
+                    self.MAX_POLL_INTERVAL,
+                    current_interval + (retry_after_seconds(response) or 5),
+                )
+                await self._sleep_until_next_poll(current_interval, deadline)
+                continue
+
+            elif error == self.ERROR_EXPIRED_TOKEN:
+                # device_code 만료
+                raise DeviceCodeError(f"Device code expired: {error_description}")
+
+            elif error == self.ERROR_ACCESS_DENIED:
+                # 사용자가 거부
+                raise DeviceCodeError(f"Access denied: {error_description}")
+
+            else:
+                # 기타 에러
+                msg = f"토큰 요청 실패: {error} - {error_description}"
+                raise DeviceCodeError(msg)
+
+    @classmethod
+    async def _sleep_until_next_poll(cls, interval: float, deadline: float) -> None:
+        """다음 폴링까지 지터를 더해 대기 (마감 시각을 넘겨 대기하지 않음)."""
+        delay = interval * (1 + cls.POLL_JITTER * random.random())
+        await asyncio.sleep(min(delay, max(0.0, deadline - time.monotonic())))
 
     def display_instructions(self, device_response: DeviceCodeResponse) -> None:
         """사용자 안내 메시지 출력.
@@ -278,15 +299,13 @@ class DeviceCodeOAuth:
         # 2. 사용자 안내 출력
         self.display_instructions(device_response)
 
-        # 3. 브라우저 자동 열기 (선택)
+        # 3. 브라우저 자동 열기 (선택, 백그라운드 → 첫 폴링과 겹쳐 진행)
         if auto_open_browser:
-            import webbrowser
-
             url = (
                 device_response.verification_uri_complete
                 or device_response.verification_uri
             )
-            webbrowser.open(url)
+            _open_browser(url)
             console.print("[dim]브라우저가 열렸습니다. 로그인 후 대기 중...[/dim]")
 
         # 4. 토큰 폴링
@@ -0,0 +1,92 @@
+"""Auth 공유 HTTP 클라이언트
+
+OAuth 플로우와 Provider가 함께 사용하는 httpx.AsyncClient와 응답 처리 헬퍼.
+클라이언트의 커넥션 풀은 이벤트 루프에 묶이므로, 실행 중인 루프가 바뀌거나
+클라이언트가 닫혔으면 다음 요청 시 새로 생성합니다.
+"""
+
+import asyncio
+
+import httpx
+
+__all__ = [
+    "HAS_HTTP2",
+    "HTTP_LIMITS",
+    "HTTP_TIMEOUT",
+    "aclose_shared_client",
+    "get_shared_client",
+    "json_loads",
+    "retry_after_seconds",
+]
+
+try:
+    # 선택적 가속: orjson (C 구현 JSON 파서, bytes 직접 입력)
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# h2가 설치되어 있으면 HTTP/2 사용 (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+# 동시 갱신/검증 요청이 풀 대기에 걸리지 않도록 여유 있게 설정
+# (keepalive_expiry: 기본 5초는 device code 폴링 간격(5초~)과 겹쳐 매번 재연결됨)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=40, keepalive_expiry=60
+)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _discard_client(
+    client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """다른 이벤트 루프에 묶인 이전 클라이언트 정리 (최선 노력).
+
+    그 루프가 (다른 스레드에서) 아직 실행 중이면 그 루프에서 닫습니다.
+    이미 종료된 루프(반복된 asyncio.run() 등)의 연결은 현재 루프에서 닫을 수
+    없으므로 의도적으로 버리고 GC에 맡깁니다.
+    """
+    if client.is_closed or loop is None or loop.is_closed():
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+async def get_shared_client() -> httpx.AsyncClient:
+    """공유 httpx 클라이언트 반환 (지연 생성, 루프가 바뀌면 재생성)."""
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None:
+            _discard_client(_client, _client_loop)
+        _client = httpx.AsyncClient(
+            http2=HAS_HTTP2, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose_shared_client() -> None:
+    """공유 httpx 클라이언트 종료 (다음 요청 시 다시 생성됨)."""
+    global _client, _client_loop
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+def retry_after_seconds(response: httpx.Response) -> int | None:
+    """Retry-After 헤더의 초 값 (없거나 HTTP-date 형식이면 None)."""
+    value = response.headers.get("Retry-After")
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
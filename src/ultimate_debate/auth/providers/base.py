@@ -3,82 +3,229 @@
 모든 AI Provider가 구현해야 하는 인터페이스 정의.
 """
 
+import asyncio
+import hashlib
+import logging
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any, ClassVar, Self
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_SECONDS_PER_DAY = 86400
+
+
+@dataclass(slots=True, frozen=True)
 class AuthToken:
-    """인증 토큰 데이터 클래스"""
+    """인증 토큰 데이터 클래스 (불변, 해시 가능)
+
+    만료 시각은 epoch 초(``expires_at_epoch``)로 보관하여 만료 확인을
+    float 비교 한 번으로 처리한다. ``datetime`` 이 필요한 경우에만
+    ``expires_at`` 프로퍼티로 변환한다.
+
+    갱신 시에는 기존 인스턴스를 수정하지 않고 새 토큰을 만든다.
+    """
 
     provider: str
     access_token: str
     refresh_token: str | None = None
-    expires_at: datetime | None = None
+    expires_at_epoch: float | None = None
     token_type: str = "Bearer"
-    scopes: list[str] = field(default_factory=list)
-    account_info: dict | None = None
+    scopes: tuple[str, ...] = ()
+    account_info: dict | None = field(default=None, hash=False)
+
+    @property
+    def expires_at(self) -> datetime | None:
+        """만료 시각 (로컬 naive datetime, 필요할 때만 생성)"""
+        if self.expires_at_epoch is None:
+            return None
+        return datetime.fromtimestamp(self.expires_at_epoch)
 
     def is_expired(self) -> bool:
         """토큰 만료 여부 확인"""
-        if self.expires_at is None:
+        return self.is_expired_at(time.time())
+
+    def is_expired_at(self, now: float) -> bool:
+        """주어진 epoch 시각 기준 만료 여부 확인
+
+        여러 토큰을 한 번에 확인할 때 ``time.time()`` 을 한 번만 호출하도록
+        기준 시각을 받는다.
+        """
+        if self.expires_at_epoch is None:
             return False
-        return datetime.now() >= self.expires_at
+        return now >= self.expires_at_epoch
 
     def expires_in_days(self) -> int | None:
         """만료까지 남은 일수"""
-        if self.expires_at is None:
+        if self.expires_at_epoch is None:
             return None
-        delta = self.expires_at - datetime.now()
-        return max(0, delta.days)
+        return max(0, int((self.expires_at_epoch - time.time()) // _SECONDS_PER_DAY))
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (저장용)"""
+        expires_at = None
+        if self.expires_at_epoch is not None:
+            expires_at = datetime.fromtimestamp(
+                self.expires_at_epoch, tz=UTC
+            ).isoformat()
         return {
             "provider": self.provider,
             "access_token": self.access_token,
             "refresh_token": self.refresh_token,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "expires_at": expires_at,
             "token_type": self.token_type,
-            "scopes": self.scopes,
+            "scopes": list(self.scopes),
             "account_info": self.account_info,
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "AuthToken":
-        """딕셔너리에서 생성"""
-        expires_at = None
+        """딕셔너리에서 생성
+
+        ``expires_at`` 은 ISO-8601 문자열이다. 오프셋이 없는 기존 저장
+        형식은 로컬 시각으로 해석한다.
+        """
+        expires_at_epoch = None
         if data.get("expires_at"):
-            expires_at = datetime.fromisoformat(data["expires_at"])
+            expires_at_epoch = datetime.fromisoformat(data["expires_at"]).timestamp()
         return cls(
             provider=data["provider"],
             access_token=data["access_token"],
             refresh_token=data.get("refresh_token"),
-            expires_at=expires_at,
+            expires_at_epoch=expires_at_epoch,
             token_type=data.get("token_type", "Bearer"),
-            scopes=data.get("scopes", []),
+            scopes=tuple(data.get("scopes", ())),
             account_info=data.get("account_info"),
         )
 
 
+_MISSING = object()
+
+
+class _TokenCache:
+    """토큰별 조회 결과 TTL 캐시.
+
+    원본 access_token 대신 BLAKE2b(128비트) 해시를 키로 보관하며,
+    항목은 TTL 상한과 토큰 만료 시각 중 이른 시점에 만료된다.
+    """
+
+    __slots__ = ("_entries", "_maxsize", "_ttl")
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: dict[tuple[bytes, str], tuple[float, object]] = {}
+
+    @staticmethod
+    def _digest(token: AuthToken) -> bytes:
+        return hashlib.blake2b(token.access_token.encode(), digest_size=16).digest()
+
+    def get(self, kind: str, token: AuthToken) -> object:
+        """캐시 값 반환 (없거나 만료되면 _MISSING)."""
+        key = (self._digest(token), kind)
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if time.monotonic() >= entry[0]:
+            del self._entries[key]
+            return _MISSING
+        return entry[1]
+
+    def set(self, kind: str, token: AuthToken, value: object) -> None:
+        """값 저장 (토큰 만료가 TTL보다 이르면 만료 시각까지만)."""
+        ttl = self._ttl
+        if token.expires_at_epoch is not None:
+            ttl = min(ttl, token.expires_at_epoch - time.time())
+        if ttl <= 0:
+            return
+        if len(self._entries) >= self._maxsize:
+            # 가장 먼저 저장된 항목부터 제거
+            del self._entries[next(iter(self._entries))]
+        self._entries[(self._digest(token), kind)] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, token: AuthToken) -> None:
+        """토큰의 모든 캐시 항목 제거."""
+        digest = self._digest(token)
+        for key in [key for key in self._entries if key[0] == digest]:
+            del self._entries[key]
+
+
+class _RefreshFlights:
+    """refresh_token별 진행 중인 토큰 갱신 (동시 호출은 요청 1회로 합침).
+
+    실패는 결과를 기다리는 호출자에게 다시 발생하므로, 기다리는 호출자가
+    없는 백그라운드 갱신의 실패만 로그로 남긴다.
+    """
+
+    __slots__ = ("_awaited", "_label", "_on_success", "tasks")
+
+    def __init__(
+        self,
+        label: str,
+        on_success: Callable[[str, AuthToken], None] | None = None,
+    ) -> None:
+        self._label = label
+        self._on_success = on_success
+        self.tasks: dict[str, asyncio.Task[AuthToken]] = {}
+        self._awaited: set[str] = set()
+
+    def start(
+        self, key: str, refresh: Callable[[], Coroutine[Any, Any, AuthToken]]
+    ) -> asyncio.Task[AuthToken]:
+        """key의 진행 중인 갱신 작업 반환 (없으면 refresh()로 새로 시작)."""
+        task = self.tasks.get(key)
+        if task is not None:
+            return task
+
+        task = asyncio.create_task(refresh())
+        self.tasks[key] = task
+        task.add_done_callback(partial(self._on_done, key))
+        return task
+
+    async def wait(
+        self, key: str, refresh: Callable[[], Coroutine[Any, Any, AuthToken]]
+    ) -> AuthToken:
+        """갱신 결과 대기 (실패 시 예외를 호출자에게 전달)."""
+        task = self.start(key, refresh)
+        self._awaited.add(key)
+        # 한 호출자가 취소돼도 다른 호출자가 기다리는 갱신은 계속 진행
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, done: asyncio.Task[AuthToken]) -> None:
+        self.tasks.pop(key, None)
+        awaited = key in self._awaited
+        self._awaited.discard(key)
+        if done.cancelled():
+            return
+        # 예외는 항상 여기서 회수 (모든 호출자가 취소된 경우 포함)
+        error = done.exception()
+        if error is None:
+            if self._on_success is not None:
+                self._on_success(key, done.result())
+        elif not awaited:
+            logger.warning("%s 백그라운드 토큰 갱신 오류: %s", self._label, error)
+
+
 class BaseProvider(ABC):
     """AI Provider 추상 베이스 클래스
 
     모든 Provider는 이 클래스를 상속해야 함.
+    하위 클래스는 ``name`` / ``display_name`` 을 클래스 속성으로 지정한다.
     """
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Provider 이름"""
-        pass
+    name: ClassVar[str] = ""  # Provider 이름
+    display_name: ClassVar[str] = ""  # 표시용 이름
 
-    @property
-    @abstractmethod
-    def display_name(self) -> str:
-        """표시용 이름"""
-        pass
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for attr in ("name", "display_name"):
+            value = getattr(cls, attr)
+            if not isinstance(value, str) or not value:
+                raise TypeError(f"{cls.__name__}.{attr} 클래스 속성이 필요합니다")
 
     @abstractmethod
     async def login(self, **kwargs) -> AuthToken:
@@ -132,3 +279,17 @@ class BaseProvider(ABC):
     def is_token_valid(self, token: AuthToken) -> bool:
         """토큰 유효성 빠른 확인 (만료 시간 기반)"""
         return not token.is_expired()
+
+    async def aclose(self) -> None:
+        """Provider 소유 리소스 정리 (선택적 구현)
+
+        공유 HTTP 클라이언트는 다른 Provider/플로우도 사용하므로 닫지 않습니다.
+        애플리케이션 종료 시 ``aclose_shared_client()``로 정리하세요.
+        """
+        return None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
@@ -5,11 +5,13 @@ Gemini API용 Browser OAuth 인증.
 - Browser OAuth 2.0 + PKCE
 """
 
-import json
+import asyncio
 import logging
 import os
-import socket
-from datetime import datetime, timedelta
+import random
+import time
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 import httpx
@@ -19,27 +21,133 @@ from ultimate_debate.auth.flows.browser_oauth import (
     OAuthCallbackError,
     OAuthConfig,
 )
-from ultimate_debate.auth.providers.base import AuthToken, BaseProvider
+from ultimate_debate.auth.http_client import (
+    get_shared_client,
+    json_loads,
+    retry_after_seconds,
+)
+from ultimate_debate.auth.providers.base import (
+    _MISSING,
+    AuthToken,
+    BaseProvider,
+    _RefreshFlights,
+    _TokenCache,
+)
 
 logger = logging.getLogger(__name__)
 
+# validate()/get_account_info() 결과 캐시: TTL 상한 (초), 최대 항목 수
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAXSIZE = 1024
+
+_token_cache = _TokenCache(ttl=_TOKEN_CACHE_TTL, maxsize=_TOKEN_CACHE_MAXSIZE)
+
+
+class _AdaptiveTokenBucket:
+    """적응형 토큰 버킷 (Google 엔드포인트 클라이언트 측 속도 제한).
+
+    요청마다 토큰 1개를 소비하고, 부족하면 보충될 때까지 대기한다.
+    429 응답을 받으면 보충 속도를 절반으로 줄이고(곱셈 감소),
+    성공할 때마다 min_rate만큼 다시 늘린다(덧셈 증가).
+    """
+
+    __slots__ = ("_capacity", "_max_rate", "_min_rate", "_rate", "_tokens", "_updated")
+
+    def __init__(
+        self, capacity: float = 20.0, rate: float = 20.0, min_rate: float = 1.0
+    ) -> None:
+        self._capacity = capacity
+        self._max_rate = rate
+        self._min_rate = min_rate
+        self._rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """현재 보충 속도 (초당 요청 수)."""
+        return self._rate
+
+    async def acquire(self) -> None:
+        """요청 1건 허가 (토큰이 없으면 보충될 때까지 대기)."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        # 토큰을 먼저 차감(음수 허용)한 뒤 부족분만큼 대기
+        # → await 전에 예약이 끝나므로 락 없이도 호출 순서대로 분배
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
+
+    def on_throttled(self) -> None:
+        """429 응답: 보충 속도 절반으로 감소."""
+        self._rate = max(self._min_rate, self._rate / 2)
+
+    def on_success(self) -> None:
+        """성공 응답: 보충 속도 점진 증가."""
+        self._rate = min(self._max_rate, self._rate + self._min_rate)
+
+
+_google_bucket = _AdaptiveTokenBucket()
+
+# 429 재시도: 최대 횟수, 백오프 상한 (초)
+_THROTTLE_RETRIES = 3
+_THROTTLE_BACKOFF_CAP = 30.0
+
+
+def _gemini_creds_path() -> Path:
+    """Gemini CLI 토큰 파일 경로 (GEMINI_CREDS_PATH 환경변수로 지정 가능)
+
+    HOME 변경(테스트 등)을 반영하도록 호출 시점에 계산합니다.
+    """
+    override = os.environ.get("GEMINI_CREDS_PATH")
+    if override:
+        return Path(override)
+    return Path.home() / ".gemini" / "oauth_creds.json"
+
+
+# Gemini CLI 토큰 파일 파싱 결과 캐시: ((경로, st_mtime_ns, st_size), 토큰)
+_cli_token_cache: tuple[tuple[Path, int, int], AuthToken | None] | None = None
+
 
 def try_import_gemini_cli_token() -> AuthToken | None:
     """Gemini CLI 토큰 재사용 (~/.gemini/oauth_creds.json)
 
     Gemini CLI가 저장한 OAuth 토큰을 가져와서 재사용합니다.
+    파일이 바뀌지 않았으면(mtime/크기 동일) 이전 파싱 결과를 사용합니다.
 
     Returns:
         AuthToken: 유효한 토큰이 있으면 반환, 없으면 None
     """
-    gemini_creds_path = Path.home() / ".gemini" / "oauth_creds.json"
+    global _cli_token_cache
+
+    gemini_creds_path = _gemini_creds_path()
+
+    try:
+        st = gemini_creds_path.stat()
+    except OSError:
+        return None
+
+    key = (gemini_creds_path, st.st_mtime_ns, st.st_size)
+    if _cli_token_cache is not None and _cli_token_cache[0] == key:
+        token = _cli_token_cache[1]
+    else:
+        token = _load_gemini_cli_token(gemini_creds_path)
+        _cli_token_cache = (key, token)
 
-    if not gemini_creds_path.exists():
+    # 만료 확인 (캐시된 토큰도 호출 시점 기준으로 판단)
+    if token is None or token.is_expired():
         return None
+    return token
 
+
+def _load_gemini_cli_token(path: Path) -> AuthToken | None:
+    """Gemini CLI 토큰 파일 파싱 (형식이 잘못됐으면 None)"""
     try:
-        with open(gemini_creds_path) as f:
-            creds = json.load(f)
+        with open(path, "rb") as f:
+            creds = json_loads(f.read())
 
         access_token = creds.get("access_token")
         refresh_token = creds.get("refresh_token")
@@ -49,28 +157,23 @@ def try_import_gemini_cli_token() -> AuthToken | None:
             return None
 
         # expires_at 파싱 (ISO 형식 또는 Unix timestamp)
-        expires_at = None
+        expires_at_epoch = None
         if expires_at_str:
             if isinstance(expires_at_str, (int, float)):
-                expires_at = datetime.fromtimestamp(expires_at_str)
+                expires_at_epoch = float(expires_at_str)
             else:
-                # ISO 형식
-                expires_at = datetime.fromisoformat(
+                # ISO 형식 (오프셋 없으면 로컬 시각)
+                expires_at_epoch = datetime.fromisoformat(
                     expires_at_str.replace("Z", "+00:00")
-                )
-                expires_at = expires_at.replace(tzinfo=None)
-
-        # 만료 확인
-        if expires_at and expires_at <= datetime.now():
-            return None
+                ).timestamp()
 
         return AuthToken(
             provider="google",
             access_token=access_token,
             refresh_token=refresh_token,
-            expires_at=expires_at,
+            expires_at_epoch=expires_at_epoch,
             token_type="Bearer",
-            scopes=creds.get("scopes", []),
+            scopes=tuple(creds.get("scopes", ())),
         )
     except Exception:
         return None
@@ -90,6 +193,9 @@ class GoogleProvider(BaseProvider):
         token = await provider.login()
     """
 
+    name = "google"
+    display_name = "Google Gemini"
+
     # Google OAuth 설정
     AUTHORIZATION_ENDPOINT = "https://accounts.google.com/o/oauth2/v2/auth"
     TOKEN_ENDPOINT = "https://oauth2.googleapis.com/token"
@@ -103,9 +209,10 @@ class GoogleProvider(BaseProvider):
     # 기본 스코프 (Gemini Code Assist용)
     # cloud-platform만으로 Gemini API 접근 가능 (Code Assist 경로)
     SCOPE = "https://www.googleapis.com/auth/cloud-platform openid email"
-    # 로컬 콜백 포트 설정
-    DEFAULT_REDIRECT_PORT = 8080
-    MAX_PORT_ATTEMPTS = 10
+    SCOPES = tuple(SCOPE.split())
+    # 선제 갱신: 만료 5분 전부터 백그라운드 갱신, 1분 이내면 갱신 완료까지 대기 (초)
+    REFRESH_AHEAD_SECONDS = 300
+    REFRESH_BLOCKING_SECONDS = 60
 
     # Gemini API 검증 엔드포인트
     GEMINI_MODELS_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models"
@@ -124,44 +231,53 @@ class GoogleProvider(BaseProvider):
             or os.getenv("GOOGLE_CLIENT_SECRET")
             or self.DEFAULT_CLIENT_SECRET
         )
-
-    def _is_port_available(self, port: int) -> bool:
-        """포트 사용 가능 여부 확인"""
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(("localhost", port))
-                return True
-        except OSError:
-            return False
-
-    def _find_available_port(
-        self, start_port: int = 8080, max_attempts: int = 10
-    ) -> int:
-        """사용 가능한 포트 찾기
-
-        Args:
-            start_port: 시작 포트 번호
-            max_attempts: 최대 시도 횟수
-
-        Returns:
-            int: 사용 가능한 포트
-
-        Raises:
-            RuntimeError: 사용 가능한 포트를 찾지 못한 경우
+        # refresh 요청 폼의 고정 필드 (호출마다 refresh_token만 추가)
+        self._refresh_form = {
+            "grant_type": "refresh_token",
+            "client_id": self.client_id,
+        }
+        if self.client_secret:
+            self._refresh_form["client_secret"] = self.client_secret
+        # 진행 중인 토큰 갱신 (refresh_token별 1개, 동시 호출은 결과 공유)
+        self._refreshes = _RefreshFlights("Google", on_success=self._remember_latest)
+        # 마지막으로 갱신된 토큰과 갱신 전 refresh_token (Provider당 1개만 보관)
+        self._latest_token: tuple[str, AuthToken] | None = None
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Google 엔드포인트 요청 (클라이언트 측 속도 제한 + 429 재시도)
+
+        429 응답은 Retry-After(없으면 상한 30초의 지터 지수 백오프)만큼
+        기다린 뒤 최대 _THROTTLE_RETRIES회 재시도하고, 그래도 429이면
+        마지막 응답을 그대로 반환합니다.
         """
-        for port in range(start_port, start_port + max_attempts):
-            if self._is_port_available(port):
-                return port
-        end_port = start_port + max_attempts - 1
-        raise RuntimeError(f"사용 가능한 포트를 찾을 수 없음 ({start_port}-{end_port})")
-
-    @property
-    def name(self) -> str:
-        return "google"
-
-    @property
-    def display_name(self) -> str:
-        return "Google Gemini"
+        client = await get_shared_client()
+        send = getattr(client, method)
+        for attempt in range(_THROTTLE_RETRIES + 1):
+            await _google_bucket.acquire()
+            response = await send(url, **kwargs)
+            if response.status_code != 429:
+                _google_bucket.on_success()
+                return response
+
+            _google_bucket.on_throttled()
+            if attempt == _THROTTLE_RETRIES:
+                break
+            delay = retry_after_seconds(response)
+            if delay is None:
+                delay = random.uniform(0, 2**attempt)
+            logger.warning("Google 요청 제한(429), %.1f초 후 재시도", delay)
+            await asyncio.sleep(min(delay, _THROTTLE_BACKOFF_CAP))
+        return response
+
+    def _parse_scopes(
+        self, scope: str | None, default: tuple[str, ...]
+    ) -> tuple[str, ...]:
+        """응답 scope 문자열을 튜플로 변환 (기본 SCOPE와 같으면 SCOPES 재사용)"""
+        if not scope:
+            return default
+        if scope == self.SCOPE:
+            return self.SCOPES
+        return tuple(scope.split())
 
     async def login(self, **kwargs) -> AuthToken:
         """Browser OAuth로 로그인
@@ -172,113 +288,184 @@ class GoogleProvider(BaseProvider):
         Gemini CLI의 공개 Client ID를 사용하므로
         별도 설정 없이 바로 로그인 가능합니다.
 
-        동적 포트 할당을 사용하여 포트 충돌을 방지합니다.
+        콜백 포트는 OS가 할당한 임의 포트를 바인딩된 소켓째로
+        BrowserOAuth에 넘겨 포트 충돌/선점(TOCTOU)을 방지합니다.
         """
-        # 1. Gemini CLI 토큰 확인 (우선)
-        cli_token = try_import_gemini_cli_token()
+        # 1. Gemini CLI 토큰 확인 (우선, 파일 읽기는 워커 스레드에서)
+        cli_token = await asyncio.to_thread(try_import_gemini_cli_token)
         if cli_token and not cli_token.is_expired():
             logger.info("Gemini CLI 토큰 재사용")
             return cli_token
 
         # 2. CLI 토큰 없거나 만료 시 브라우저 로그인
-        # 동적 포트 할당
-        port = self._find_available_port(
-            self.DEFAULT_REDIRECT_PORT, self.MAX_PORT_ATTEMPTS
-        )
-
+        # ({port}는 BrowserOAuth가 예약한 loopback 포트로 치환)
         config = OAuthConfig(
             client_id=self.client_id,
             client_secret=self.client_secret,
             authorization_endpoint=self.AUTHORIZATION_ENDPOINT,
             token_endpoint=self.TOKEN_ENDPOINT,
-            redirect_uri=f"http://localhost:{port}/callback",
+            redirect_uri="http://localhost:{port}/callback",
             scope=self.SCOPE,
         )
 
-        oauth = BrowserOAuth(config, fixed_port=port)
+        oauth = BrowserOAuth(config)
 
         try:
             token_response = await oauth.authenticate(timeout=300)
         except OAuthCallbackError as e:
             raise ValueError(f"Google 인증 실패: {e}") from e
 
-        # 만료 시간 계산
-        expires_at = datetime.now() + timedelta(seconds=token_response.expires_in)
-
         return AuthToken(
             provider=self.name,
             access_token=token_response.access_token,
             refresh_token=token_response.refresh_token,
-            expires_at=expires_at,
+            expires_at_epoch=token_response.expires_at,
             token_type=token_response.token_type,
-            scopes=token_response.scope.split() if token_response.scope else [],
+            # scope 생략 시 요청한 scope 그대로 부여된 것으로 간주 (RFC 6749 5.1)
+            scopes=self._parse_scopes(token_response.scope, self.SCOPES),
         )
 
     async def refresh(self, token: AuthToken) -> AuthToken:
-        """Refresh token으로 갱신"""
+        """Refresh token으로 갱신
+
+        같은 refresh_token으로 동시에 호출되면 요청은 한 번만 보내고
+        결과(또는 예외)를 모든 호출자가 공유합니다.
+        """
         if not token.refresh_token:
             raise ValueError("No refresh token available")
 
-        async with httpx.AsyncClient() as client:
-            data = {
-                "grant_type": "refresh_token",
-                "refresh_token": token.refresh_token,
-                "client_id": self.client_id,
-            }
-            if self.client_secret:
-                data["client_secret"] = self.client_secret
-
-            response = await client.post(self.TOKEN_ENDPOINT, data=data)
-
-            if response.status_code != 200:
-                raise ValueError(f"Token refresh failed: {response.text}")
-
-            result = response.json()
-            expires_at = datetime.now() + timedelta(
-                seconds=result.get("expires_in", 3600)
-            )
-
-            return AuthToken(
-                provider=self.name,
-                access_token=result["access_token"],
-                refresh_token=result.get("refresh_token", token.refresh_token),
-                expires_at=expires_at,
-                token_type=result.get("token_type", "Bearer"),
-                scopes=(
-                    result.get("scope", "").split()
-                    if result.get("scope")
-                    else token.scopes
-                ),
-            )
+        return await self._refreshes.wait(
+            token.refresh_token, partial(self._do_refresh, token)
+        )
+
+    def _remember_latest(self, key: str, token: AuthToken) -> None:
+        """갱신 완료 토큰 보관 (이전 항목은 교체)"""
+        self._latest_token = (key, token)
+
+    async def ensure_fresh(self, token: AuthToken) -> AuthToken:
+        """만료 임박 토큰을 미리 갱신
+
+        - 이미 갱신된 토큰이 있으면 그 토큰을 기준으로 판단
+        - 만료까지 REFRESH_AHEAD_SECONDS 미만: 백그라운드 갱신 시작 후 현재 토큰 반환
+        - 만료까지 REFRESH_BLOCKING_SECONDS 미만: 갱신 완료까지 대기
+
+        Args:
+            token: 현재 토큰
+
+        Returns:
+            AuthToken: 사용할 토큰
+        """
+        if not token.refresh_token:
+            return token
+
+        latest = None
+        if self._latest_token is not None:
+            latest_key, latest = self._latest_token
+            if token.refresh_token not in (latest_key, latest.refresh_token):
+                latest = None
+        if latest is not None and (
+            latest.expires_at_epoch is None
+            or token.expires_at_epoch is None
+            or latest.expires_at_epoch > token.expires_at_epoch
+        ):
+            token = latest
+        if token.expires_at_epoch is None or not token.refresh_token:
+            return token
+
+        remaining = token.expires_at_epoch - time.time()
+        if remaining >= self.REFRESH_AHEAD_SECONDS:
+            return token
+
+        refresh = partial(self._do_refresh, token)
+        if remaining < self.REFRESH_BLOCKING_SECONDS:
+            return await self._refreshes.wait(token.refresh_token, refresh)
+        self._refreshes.start(token.refresh_token, refresh)
+        return token
+
+    async def _do_refresh(self, token: AuthToken) -> AuthToken:
+        """토큰 엔드포인트에 refresh_token grant 요청"""
+        self.invalidate(token)
+        data = {**self._refresh_form, "refresh_token": token.refresh_token}
+
+        response = await self._send("post", self.TOKEN_ENDPOINT, data=data)
+
+        if response.status_code != 200:
+            raise ValueError(f"Token refresh failed: {response.text}")
+
+        result = json_loads(response.content)
+        expires_at_epoch = time.time() + result.get("expires_in", 3600)
+
+        return AuthToken(
+            provider=self.name,
+            access_token=result["access_token"],
+            refresh_token=result.get("refresh_token", token.refresh_token),
+            expires_at_epoch=expires_at_epoch,
+            token_type=result.get("token_type", "Bearer"),
+            scopes=self._parse_scopes(result.get("scope"), token.scopes),
+        )
+
+    def invalidate(self, token: AuthToken) -> None:
+        """validate()/get_account_info() 캐시에서 토큰 결과 제거"""
+        _token_cache.invalidate(token)
 
     async def logout(self, token: AuthToken) -> bool:
         """토큰 폐기"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://oauth2.googleapis.com/revoke",
-                data={"token": token.access_token},
-            )
-            return response.status_code == 200
+        self.invalidate(token)
+        response = await self._send(
+            "post",
+            "https://oauth2.googleapis.com/revoke",
+            data={"token": token.access_token},
+        )
+        return response.status_code == 200
 
     async def validate(self, token: AuthToken) -> bool:
-        """토큰 유효성 검증"""
+        """토큰 유효성 검증 (결과는 최대 60초 캐시)"""
         if token.is_expired():
             return False
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://www.googleapis.com/oauth2/v3/tokeninfo",
-                params={"access_token": token.access_token},
-            )
-            return response.status_code == 200
+        cached = _token_cache.get("valid", token)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+
+        response = await self._send(
+            "get",
+            "https://www.googleapis.com/oauth2/v3/tokeninfo",
+            params={"access_token": token.access_token},
+        )
+        valid = response.status_code == 200
+        # 서버 오류(5xx)는 일시적일 수 있으므로 캐시하지 않음
+        if response.status_code < 500:
+            _token_cache.set("valid", token, valid)
+        return valid
+
+    async def validate_and_info(self, token: AuthToken) -> tuple[bool, dict | None]:
+        """토큰 검증과 계정 정보 조회를 동시에 수행
+
+        tokeninfo/userinfo 요청을 직렬로 기다리지 않고 함께 보냅니다.
+
+        Returns:
+            tuple: (유효 여부, 계정 정보 또는 None)
+        """
+        if token.is_expired():
+            return False, None
+        valid, info = await asyncio.gather(
+            self.validate(token), self.get_account_info(token)
+        )
+        return valid, info if valid else None
 
     async def get_account_info(self, token: AuthToken) -> dict | None:
-        """계정 정보 조회"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://www.googleapis.com/oauth2/v3/userinfo",
-                headers={"Authorization": f"Bearer {token.access_token}"},
-            )
-            if response.status_code == 200:
-                return response.json()
+        """계정 정보 조회 (성공 결과는 최대 60초 캐시)"""
+        cached = _token_cache.get("account", token)
+        if cached is not _MISSING:
+            return dict(cached)  # type: ignore[call-overload]
+
+        response = await self._send(
+            "get",
+            "https://www.googleapis.com/oauth2/v3/userinfo",
+            headers={"Authorization": f"Bearer {token.access_token}"},
+        )
+        if response.status_code == 200:
+            info = json_loads(response.content)
+            _token_cache.set("account", token, info)
+            return dict(info)
         return None
@@ -4,20 +4,77 @@ ChatGPT Plus/Pro 구독자용 Browser OAuth 인증.
 Browser OAuth (PKCE) 사용.
 """
 
+import asyncio
+import base64
+import contextlib
+import json
 import logging
-from datetime import datetime, timedelta
-
-import httpx
+import os
+import secrets
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from urllib.parse import urlencode, urlparse
+
+from rich.console import Console
 
 from ultimate_debate.auth.flows.browser_oauth import (
     BrowserOAuth,
     OAuthCallbackError,
     OAuthConfig,
+    extract_callback_params,
     generate_pkce_challenge,
 )
-from ultimate_debate.auth.providers.base import AuthToken, BaseProvider
+from ultimate_debate.auth.http_client import get_shared_client, json_loads
+from ultimate_debate.auth.providers.base import (
+    _MISSING,
+    AuthToken,
+    BaseProvider,
+    _RefreshFlights,
+    _TokenCache,
+)
 
 logger = logging.getLogger(__name__)
+console = Console()
+
+# POSIX에서는 Codex CLI auth.json 갱신을 flock으로 직렬화
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# validate() 결과 캐시: TTL 상한 (초), 최대 항목 수
+_VALIDATE_CACHE_TTL = 5.0
+_VALIDATE_CACHE_MAXSIZE = 256
+
+_validate_cache = _TokenCache(ttl=_VALIDATE_CACHE_TTL, maxsize=_VALIDATE_CACHE_MAXSIZE)
+
+# Codex CLI 토큰 파일 디코딩 결과 캐시 최대 항목 수
+_CODEX_CACHE_MAXSIZE = 4
+
+
+def _codex_auth_path() -> Path:
+    """Codex CLI 토큰 파일 경로 (~/.codex/auth.json)"""
+    return Path.home() / ".codex" / "auth.json"
+
+
+@contextlib.contextmanager
+def _codex_file_lock(path: Path) -> Iterator[None]:
+    """auth.json 옆의 .lock 파일로 배타 잠금 (fcntl이 없으면 잠금 없음)"""
+    if not HAS_FCNTL:
+        yield
+        return
+    with open(path.with_name(path.name + ".lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
 class OpenAIProvider(BaseProvider):
@@ -31,6 +88,9 @@ class OpenAIProvider(BaseProvider):
         token = await provider.login()
     """
 
+    name = "openai"
+    display_name = "OpenAI (ChatGPT Plus/Pro)"
+
     # OpenAI OAuth 설정 (Codex CLI 호환)
     AUTHORIZATION_ENDPOINT = "https://auth.openai.com/oauth/authorize"
     TOKEN_ENDPOINT = "https://auth.openai.com/oauth/token"
@@ -39,6 +99,10 @@ class OpenAIProvider(BaseProvider):
     SCOPE = "openid profile email offline_access"
     # Codex CLI는 고정 포트 1455 사용
     REDIRECT_PORT = 1455
+    USERINFO_ENDPOINT = "https://auth.openai.com/userinfo"
+
+    # (경로, mtime_ns, 크기) → 디코딩된 Codex CLI 토큰 (파싱 실패 시 None)
+    _codex_cache: dict[tuple[str, int, int], AuthToken | None] = {}
 
     def __init__(self, client_id: str | None = None):
         """초기화.
@@ -50,14 +114,8 @@ class OpenAIProvider(BaseProvider):
         self._pkce = None
         self._state = None
         self._redirect_uri = None
-
-    @property
-    def name(self) -> str:
-        return "openai"
-
-    @property
-    def display_name(self) -> str:
-        return "OpenAI (ChatGPT Plus/Pro)"
+        # refresh_token별 진행 중인 갱신 작업 (동시 갱신 요청 합치기)
+        self._refreshes = _RefreshFlights("OpenAI")
 
     def get_auth_url(self) -> str:
         """인증 URL 생성 (Step 1).
@@ -65,9 +123,6 @@ class OpenAIProvider(BaseProvider):
         Returns:
             str: 브라우저에서 열어야 할 인증 URL
         """
-        import secrets
-        from urllib.parse import urlencode
-
         # PKCE 챌린지 생성
         self._pkce = generate_pkce_challenge()
         self._state = secrets.token_urlsafe(32)
@@ -94,65 +149,82 @@ class OpenAIProvider(BaseProvider):
         Returns:
             AuthToken: 인증 토큰
         """
-        from urllib.parse import parse_qs, urlparse
-
         # URL 파싱
         parsed = urlparse(callback_url)
-        params = parse_qs(parsed.query)
+        params = extract_callback_params(parsed.query)
 
-        if "error" in params:
-            error_desc = params.get("error_description", ["인증 거부됨"])[0]
+        if params.get("error"):
+            error_desc = params.get("error_description") or "인증 거부됨"
             raise ValueError(f"인증 실패: {error_desc}")
 
-        if "code" not in params:
+        code = params.get("code")
+        if not code:
             raise ValueError("URL에서 code 파라미터를 찾을 수 없습니다.")
 
-        code = params["code"][0]
-
         # 토큰 교환
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_ENDPOINT,
-                data={
-                    "grant_type": "authorization_code",
-                    "client_id": self.client_id,
-                    "code": code,
-                    "redirect_uri": self._redirect_uri,
-                    "code_verifier": self._pkce.code_verifier,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        client = await get_shared_client()
+        response = await client.post(
+            self.TOKEN_ENDPOINT,
+            data={
+                "grant_type": "authorization_code",
+                "client_id": self.client_id,
+                "code": code,
+                "redirect_uri": self._redirect_uri,
+                "code_verifier": self._pkce.code_verifier,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
-            if response.status_code != 200:
-                raise ValueError(f"토큰 교환 실패: {response.text}")
+        if response.status_code != 200:
+            raise ValueError(f"토큰 교환 실패: {response.text}")
 
-            result = response.json()
+        result = json_loads(response.content)
 
-        expires_at = datetime.now() + timedelta(seconds=result.get("expires_in", 3600))
+        expires_at_epoch = time.time() + result.get("expires_in", 3600)
 
         return AuthToken(
             provider=self.name,
             access_token=result["access_token"],
             refresh_token=result.get("refresh_token"),
-            expires_at=expires_at,
+            expires_at_epoch=expires_at_epoch,
             token_type=result.get("token_type", "Bearer"),
-            scopes=result.get("scope", "").split() if result.get("scope") else [],
+            scopes=tuple(result.get("scope", "").split()),
         )
 
     def _try_codex_cli_token(self) -> AuthToken | None:
         """Codex CLI의 저장된 토큰 재사용 시도.
 
+        파일이 바뀌지 않았으면(mtime/크기 동일) 이전 디코딩 결과를 사용합니다.
+
         Returns:
             AuthToken | None: 유효한 토큰 또는 None
         """
-        import base64
-        import json
-        from pathlib import Path
+        codex_path = _codex_auth_path()
+        try:
+            st = codex_path.stat()
+        except OSError:
+            return None
 
-        codex_path = Path.home() / ".codex" / "auth.json"
-        if not codex_path.exists():
+        key = (str(codex_path), st.st_mtime_ns, st.st_size)
+        cache = OpenAIProvider._codex_cache
+        if key in cache:
+            token = cache[key]
+        else:
+            token = self._load_codex_cli_token(codex_path)
+            if len(cache) >= _CODEX_CACHE_MAXSIZE:
+                # 가장 먼저 저장된 항목부터 제거
+                del cache[next(iter(cache))]
+            cache[key] = token
+
+        # 만료 확인 (캐시된 토큰도 호출 시점 기준으로 판단)
+        if token is None or token.is_expired():
             return None
+        logger.info("Codex CLI 토큰 재사용")
+        return token
 
+    @classmethod
+    def _load_codex_cli_token(cls, codex_path: Path) -> AuthToken | None:
+        """Codex CLI 토큰 파일 파싱 (형식이 잘못됐으면 None)."""
         try:
             codex = json.loads(codex_path.read_text())
             tokens = codex.get("tokens", {})
@@ -160,26 +232,23 @@ class OpenAIProvider(BaseProvider):
             if not access_token:
                 return None
 
-            # JWT exp 추출
-            payload_b64 = access_token.split(".")[1]
-            payload_b64 += "=" * (4 - len(payload_b64) % 4)
-            payload = json.loads(base64.urlsafe_b64decode(payload_b64))
-
-            exp_dt = datetime.fromtimestamp(payload["exp"])
-            if datetime.now() >= exp_dt:
-                return None
+            # JWT exp 추출 (패딩은 4의 배수까지만 보충)
+            payload_b64 = access_token.encode().split(b".")[1]
+            payload = json.loads(
+                base64.urlsafe_b64decode(payload_b64 + b"=" * (-len(payload_b64) % 4))
+            )
 
+            exp = float(payload["exp"])
             profile = payload.get("https://api.openai.com/profile", {})
             auth_info = payload.get("https://api.openai.com/auth", {})
 
-            logger.info("Codex CLI 토큰 재사용")
             return AuthToken(
-                provider=self.name,
+                provider=cls.name,
                 access_token=access_token,
                 refresh_token=tokens.get("refresh_token"),
-                expires_at=exp_dt,
+                expires_at_epoch=exp,
                 token_type="Bearer",
-                scopes=["openid", "profile", "email", "offline_access"],
+                scopes=("openid", "profile", "email", "offline_access"),
                 account_info={
                     "email": profile.get("email", ""),
                     "plan_type": auth_info.get("chatgpt_plan_type", ""),
@@ -216,10 +285,6 @@ class OpenAIProvider(BaseProvider):
         if codex_token:
             return codex_token
 
-        from rich.console import Console
-
-        console = Console()
-
         # Browser OAuth (자동 콜백 + 수동 모드 지원)
         # Codex CLI와 동일한 추가 파라미터 사용
         config = OAuthConfig(
@@ -245,21 +310,21 @@ class OpenAIProvider(BaseProvider):
         except OAuthCallbackError as e:
             raise ValueError(f"OpenAI 인증 실패: {e}") from e
 
-        # 만료 시간 계산
-        expires_at = datetime.now() + timedelta(seconds=token_response.expires_in)
-
         return AuthToken(
             provider=self.name,
             access_token=token_response.access_token,
             refresh_token=token_response.refresh_token,
-            expires_at=expires_at,
+            expires_at_epoch=token_response.expires_at,
             token_type=token_response.token_type,
-            scopes=token_response.scope.split() if token_response.scope else [],
+            scopes=tuple(token_response.scope.split()) if token_response.scope else (),
         )
 
     async def refresh(self, token: AuthToken) -> AuthToken:
         """Refresh token으로 갱신.
 
+        refresh_token은 한 번만 쓸 수 있으므로, 같은 refresh_token으로
+        동시에 호출되면 요청은 한 번만 보내고 결과(또는 예외)를 공유합니다.
+
         Args:
             token: 기존 토큰
 
@@ -269,35 +334,96 @@ class OpenAIProvider(BaseProvider):
         if not token.refresh_token:
             raise ValueError("Refresh token이 없습니다. 다시 로그인하세요.")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_ENDPOINT,
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": token.refresh_token,
-                    "client_id": self.client_id,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        return await self._refreshes.wait(
+            token.refresh_token, partial(self._do_refresh, token)
+        )
 
-            if response.status_code != 200:
-                raise ValueError(f"토큰 갱신 실패: {response.text}")
+    async def _do_refresh(self, token: AuthToken) -> AuthToken:
+        """토큰 엔드포인트에 refresh_token grant 요청."""
+        client = await get_shared_client()
+        response = await client.post(
+            self.TOKEN_ENDPOINT,
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": token.refresh_token,
+                "client_id": self.client_id,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
-            data = response.json()
-            expires_in = data.get("expires_in", 3600)
-            expires_at = datetime.now() + timedelta(seconds=expires_in)
+        if response.status_code != 200:
+            raise ValueError(f"토큰 갱신 실패: {response.text}")
 
-            scope_str = data.get("scope", "")
-            scopes = scope_str.split() if scope_str else token.scopes
+        data = json_loads(response.content)
+        expires_in = data.get("expires_in", 3600)
+        expires_at_epoch = time.time() + expires_in
 
-            return AuthToken(
-                provider=self.name,
-                access_token=data["access_token"],
-                refresh_token=data.get("refresh_token", token.refresh_token),
-                expires_at=expires_at,
-                token_type=data.get("token_type", "Bearer"),
-                scopes=scopes,
-            )
+        scope_str = data.get("scope", "")
+        scopes = tuple(scope_str.split()) if scope_str else token.scopes
+
+        # OpenAI는 refresh_token을 회전시키므로 Codex CLI 파일도 함께 갱신
+        await asyncio.to_thread(
+            self._write_back_codex_tokens, token.refresh_token, data
+        )
+
+        return AuthToken(
+            provider=self.name,
+            access_token=data["access_token"],
+            refresh_token=data.get("refresh_token", token.refresh_token),
+            expires_at_epoch=expires_at_epoch,
+            token_type=data.get("token_type", "Bearer"),
+            scopes=scopes,
+        )
+
+    @staticmethod
+    def _write_back_codex_tokens(old_refresh_token: str, data: dict) -> bool:
+        """갱신된 토큰을 Codex CLI auth.json에 반영 (원자적 교체).
+
+        파일의 refresh_token이 갱신 전 값과 같을 때만 덮어씁니다. 다른
+        계정이거나 Codex CLI가 이미 갱신한 파일은 건드리지 않습니다.
+
+        Args:
+            old_refresh_token: 갱신에 사용한 refresh token
+            data: 토큰 엔드포인트 응답
+
+        Returns:
+            bool: 파일을 갱신했으면 True
+        """
+        codex_path = _codex_auth_path()
+        if not codex_path.exists():
+            return False
+
+        try:
+            with _codex_file_lock(codex_path):
+                codex = json.loads(codex_path.read_bytes())
+                tokens = codex.get("tokens") or {}
+                if tokens.get("refresh_token") != old_refresh_token:
+                    return False
+
+                tokens["access_token"] = data["access_token"]
+                for field in ("refresh_token", "id_token"):
+                    if data.get(field):
+                        tokens[field] = data[field]
+                codex["tokens"] = tokens
+                codex["last_refresh"] = datetime.now(UTC).isoformat()
+
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=".auth.", suffix=".tmp", dir=codex_path.parent
+                )
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        json.dump(codex, f, indent=2)
+                    os.replace(tmp_path, codex_path)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
+                    raise
+        except Exception:
+            logger.warning("Codex CLI 토큰 파일 갱신 실패", exc_info=True)
+            return False
+
+        logger.info("Codex CLI 토큰 파일 갱신")
+        return True
 
     async def logout(self, token: AuthToken) -> bool:
         """로그아웃 (토큰 폐기).
@@ -309,10 +435,11 @@ class OpenAIProvider(BaseProvider):
             bool: 성공 여부
         """
         # OpenAI는 로컬에서만 삭제
+        _validate_cache.invalidate(token)
         return True
 
     async def validate(self, token: AuthToken) -> bool:
-        """토큰 유효성 검증.
+        """토큰 유효성 검증 (결과는 최대 5초 캐시).
 
         Args:
             token: 검증할 토큰
@@ -323,13 +450,21 @@ class OpenAIProvider(BaseProvider):
         if token.is_expired():
             return False
 
+        cached = _validate_cache.get("valid", token)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+
         # UserInfo 엔드포인트로 검증 (OAuth 토큰 호환)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://auth.openai.com/userinfo",
-                headers={"Authorization": f"Bearer {token.access_token}"},
-            )
-            return response.status_code == 200
+        client = await get_shared_client()
+        response = await client.get(
+            self.USERINFO_ENDPOINT,
+            headers={"Authorization": f"Bearer {token.access_token}"},
+        )
+        valid = response.status_code == 200
+        # 서버 오류(5xx)는 일시적일 수 있으므로 캐시하지 않음
+        if response.status_code < 500:
+            _validate_cache.set("valid", token, valid)
+        return valid
 
     async def get_account_info(self, token: AuthToken) -> dict | None:
         """계정 정보 조회.
@@ -340,15 +475,15 @@ class OpenAIProvider(BaseProvider):
         Returns:
             dict: 계정 정보 또는 None
         """
-        async with httpx.AsyncClient() as client:
-            # UserInfo 엔드포인트
-            response = await client.get(
-                "https://auth.openai.com/userinfo",
-                headers={"Authorization": f"Bearer {token.access_token}"},
-            )
-            if response.status_code == 200:
-                try:
-                    return response.json()
-                except Exception:
-                    return None
+        # UserInfo 엔드포인트
+        client = await get_shared_client()
+        response = await client.get(
+            self.USERINFO_ENDPOINT,
+            headers={"Authorization": f"Bearer {token.access_token}"},
+        )
+        if response.status_code == 200:
+            try:
+                return json_loads(response.content)
+            except Exception:
+                return None
         return None
@@ -3,13 +3,23 @@
 OS 자격증명 저장소를 사용한 토큰 관리.
 """
 
+import asyncio
+import contextlib
 import json
+import logging
 import os
 import platform
+import tempfile
+import time
 from pathlib import Path
 
 from ultimate_debate.auth.providers.base import AuthToken
 
+logger = logging.getLogger(__name__)
+
+# 실행 중 바뀌지 않으므로 모듈 로드 시 한 번만 판별
+_SYSTEM = platform.system()
+
 # keyring이 없으면 파일 기반 저장소 사용
 try:
     import keyring
@@ -18,6 +28,21 @@ try:
 except ImportError:
     HAS_KEYRING = False
 
+try:
+    # 선택적 가속: orjson (C 구현 JSON 파서/직렬화, bytes 직접 입출력)
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dump_bytes(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dump_bytes(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 
 class TokenStore:
     """토큰 저장소
@@ -27,6 +52,9 @@ class TokenStore:
     - macOS: Keychain (keyring) 또는 파일
     - Linux: libsecret (keyring) 또는 파일
 
+    async 메서드의 keyring/파일 I/O는 이벤트 루프를 막지 않도록
+    스레드에서 실행한다.
+
     Example:
         store = TokenStore()
         await store.save(token)
@@ -35,17 +63,25 @@ class TokenStore:
     """
 
     SERVICE_NAME = "claude-code-ai-auth"
+    # keyring은 목록 조회가 어려우므로 알려진 provider만 확인
+    KNOWN_PROVIDERS = ("openai", "google", "poe", "anthropic")
+    # list_providers() 결과 캐시 유효 시간 (초)
+    LIST_CACHE_TTL = 2.0
 
     def __init__(self, storage_dir: Path | None = None):
         self.storage_dir = storage_dir or self._default_storage_dir()
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._list_cache: tuple[float, list[str]] | None = None
 
     def _default_storage_dir(self) -> Path:
-        """OS별 기본 저장 디렉토리"""
-        system = platform.system()
-        if system == "Windows":
+        """OS별 기본 저장 디렉토리
+
+        OS 판별은 import 시 한 번만 하고, 환경변수(APPDATA/XDG_CONFIG_HOME)는
+        재정의를 반영하도록 생성 시마다 읽는다.
+        """
+        if _SYSTEM == "Windows":
             base = Path(os.environ.get("APPDATA", Path.home()))
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             base = Path.home() / "Library" / "Application Support"
         else:  # Linux
             base = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
@@ -64,18 +100,24 @@ class TokenStore:
         Returns:
             bool: 성공 여부
         """
+        self._list_cache = None
+        tmp_path = None
         try:
             file_path = self._token_file_path(token.provider)
-            with open(file_path, "w") as f:
-                json.dump(token.to_dict(), f, indent=2)
-            # 보안: 사용자만 읽기/쓰기 (Windows에서는 무시됨)
-            try:
-                file_path.chmod(0o600)
-            except Exception:
-                pass  # Windows에서는 chmod가 제한적
+            # 같은 디렉토리의 임시 파일에 쓴 뒤 교체 (원자적 저장)
+            # mkstemp는 O_EXCL + 0o600으로 생성하므로 별도 chmod 불필요
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{token.provider}.", suffix=".tmp", dir=self.storage_dir
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dump_bytes(token.to_dict()))
+            os.replace(tmp_path, file_path)
             return True
         except Exception as e:
-            print(f"File save error: {e}")
+            logger.warning("Token file save error: %s", e)
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
             return False
 
     async def save(self, token: AuthToken) -> bool:
@@ -89,18 +131,21 @@ class TokenStore:
         Returns:
             bool: 성공 여부
         """
+        self._list_cache = None
         if HAS_KEYRING:
             try:
                 # keyring 사용 (암호화 저장)
                 token_data = json.dumps(token.to_dict())
-                keyring.set_password(self.SERVICE_NAME, token.provider, token_data)
+                await asyncio.to_thread(
+                    keyring.set_password, self.SERVICE_NAME, token.provider, token_data
+                )
                 return True
             except Exception:
                 # keyring 실패 시 파일 fallback (조용히 전환)
                 pass
 
         # 파일 기반 저장 (fallback 또는 keyring 미설치)
-        return self._save_to_file(token)
+        return await asyncio.to_thread(self._save_to_file, token)
 
     def _load_from_file(self, provider: str) -> AuthToken | None:
         """파일에서 토큰 로드
@@ -112,13 +157,10 @@ class TokenStore:
             AuthToken 또는 None
         """
         try:
-            file_path = self._token_file_path(provider)
-            if file_path.exists():
-                with open(file_path) as f:
-                    return AuthToken.from_dict(json.load(f))
+            data = self._token_file_path(provider).read_bytes()
+            return AuthToken.from_dict(_json_loads(data))
         except Exception:
-            pass
-        return None
+            return None
 
     async def load(self, provider: str) -> AuthToken | None:
         """토큰 로드
@@ -134,14 +176,16 @@ class TokenStore:
         # 1. keyring에서 시도
         if HAS_KEYRING:
             try:
-                token_data = keyring.get_password(self.SERVICE_NAME, provider)
+                token_data = await asyncio.to_thread(
+                    keyring.get_password, self.SERVICE_NAME, provider
+                )
                 if token_data:
-                    return AuthToken.from_dict(json.loads(token_data))
-            except Exception:
-                pass
+                    return AuthToken.from_dict(_json_loads(token_data))
+            except Exception as e:
+                logger.debug("Token keyring load error: %s", e)
 
         # 2. 파일에서 시도 (fallback)
-        return self._load_from_file(provider)
+        return await asyncio.to_thread(self._load_from_file, provider)
 
     async def delete(self, provider: str) -> bool:
         """토큰 삭제
@@ -152,41 +196,53 @@ class TokenStore:
         Returns:
             bool: 성공 여부
         """
+        self._list_cache = None
         try:
             if HAS_KEYRING:
-                keyring.delete_password(self.SERVICE_NAME, provider)
+                await asyncio.to_thread(
+                    keyring.delete_password, self.SERVICE_NAME, provider
+                )
             file_path = self._token_file_path(provider)
-            if file_path.exists():
-                file_path.unlink()
+            await asyncio.to_thread(file_path.unlink, missing_ok=True)
             return True
         except Exception as e:
-            print(f"Token delete error: {e}")
+            logger.warning("Token delete error: %s", e)
             return False
 
     async def list_providers(self) -> list[str]:
         """저장된 모든 provider 목록
 
+        결과는 LIST_CACHE_TTL 동안 캐시하며 save/delete 시 무효화됩니다.
+
         Returns:
             list[str]: Provider 이름 목록
         """
-        providers = []
+        now = time.monotonic()
+        if self._list_cache is not None:
+            cached_at, cached = self._list_cache
+            if now - cached_at < self.LIST_CACHE_TTL:
+                return list(cached)
 
         # 파일 기반 검색
-        for file_path in self.storage_dir.glob("*.json"):
-            providers.append(file_path.stem)
+        providers = {file_path.stem for file_path in self.storage_dir.glob("*.json")}
 
-        # keyring은 목록 조회가 어려우므로 알려진 provider만 확인
-        known_providers = ["openai", "google", "poe", "anthropic"]
         if HAS_KEYRING:
-            for provider in known_providers:
-                if provider not in providers:
-                    try:
-                        if keyring.get_password(self.SERVICE_NAME, provider):
-                            providers.append(provider)
-                    except Exception:
-                        pass
-
-        return list(set(providers))
+            # 블로킹 IPC 호출이므로 스레드에서 동시에 조회
+            candidates = [p for p in self.KNOWN_PROVIDERS if p not in providers]
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(keyring.get_password, self.SERVICE_NAME, p)
+                    for p in candidates
+                ),
+                return_exceptions=True,
+            )
+            for provider, result in zip(candidates, results, strict=True):
+                if result and not isinstance(result, BaseException):
+                    providers.add(provider)
+
+        result = sorted(providers)
+        self._list_cache = (now, result)
+        return list(result)
 
     async def clear_all(self) -> bool:
         """모든 토큰 삭제
@@ -194,10 +250,48 @@ class TokenStore:
         Returns:
             bool: 성공 여부
         """
+        providers = await self.list_providers()
+        self._list_cache = None
+        success = True
+
+        if HAS_KEYRING:
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        keyring.delete_password, self.SERVICE_NAME, provider
+                    )
+                    for provider in providers
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.warning("Token delete error: %s", result)
+                    success = False
+
+        # 토큰 파일은 디렉토리 한 번 순회로 삭제
+        if not await asyncio.to_thread(self._unlink_all_files):
+            success = False
+        return success
+
+    def _unlink_all_files(self) -> bool:
+        """저장 디렉토리의 모든 토큰 파일 삭제
+
+        Returns:
+            bool: 모두 삭제했으면 True
+        """
         success = True
-        for provider in await self.list_providers():
-            if not await self.delete(provider):
-                success = False
+        with os.scandir(self.storage_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning("Token delete error: %s", e)
+                    success = False
         return success
 
     # Sync 버전 메서드 (cross-ai-verifier 호환용)
@@ -218,13 +312,46 @@ class TokenStore:
             try:
                 token_data = keyring.get_password(self.SERVICE_NAME, provider)
                 if token_data:
-                    return AuthToken.from_dict(json.loads(token_data))
-            except Exception:
-                pass
+                    return AuthToken.from_dict(_json_loads(token_data))
+            except Exception as e:
+                logger.debug("Token keyring load error: %s", e)
 
         # 2. 파일에서 시도 (fallback)
         return self._load_from_file(provider)
 
+    def load_all_sync(self) -> dict[str, AuthToken]:
+        """저장된 모든 토큰 로드 (동기 버전)
+
+        토큰 파일은 디렉토리 한 번 순회로 읽고, keyring에 저장된 토큰이
+        있으면 load_sync와 같이 keyring 쪽을 우선합니다. 읽을 수 없는
+        항목은 건너뜁니다.
+
+        Returns:
+            dict[str, AuthToken]: Provider 이름 → 토큰
+        """
+        tokens: dict[str, AuthToken] = {}
+        with os.scandir(self.storage_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        data = f.read()
+                    tokens[entry.name[:-5]] = AuthToken.from_dict(_json_loads(data))
+                except Exception:
+                    continue
+
+        if HAS_KEYRING:
+            for provider in {*self.KNOWN_PROVIDERS, *tokens}:
+                try:
+                    token_data = keyring.get_password(self.SERVICE_NAME, provider)
+                    if token_data:
+                        tokens[provider] = AuthToken.from_dict(_json_loads(token_data))
+                except Exception:
+                    pass
+
+        return tokens
+
     def get_valid_token(self, provider: str) -> AuthToken | None:
         """유효한 토큰만 반환 (동기 버전)
 
@@ -4,21 +4,32 @@ Race condition 수정 및 콜백 처리 검증.
 """
 
 import asyncio
-import threading
+import base64
+import contextlib
+import hashlib
+import html
+import json
+import socket
+import subprocess
+import sys
 import time
+import urllib.error
+import urllib.request
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from ultimate_debate.auth.flows.browser_oauth import (
+    _ERROR_HTML_TEMPLATE,
+    _SUCCESS_HTML,
     BrowserOAuth,
     OAuthCallbackError,
+    OAuthCallbackHandler,
     OAuthConfig,
     PKCEChallenge,
     TokenResponse,
-    _callback_events,
-    _callback_lock,
-    _callback_results,
+    _EntropyPool,
+    _error_response,
     generate_pkce_challenge,
 )
 
@@ -43,6 +54,53 @@ class TestPKCE:
         assert c1.code_verifier != c2.code_verifier
         assert c1.code_challenge != c2.code_challenge
 
+    def test_code_challenge_is_s256_of_verifier(self):
+        """code_challenge = BASE64URL(SHA256(code_verifier)), 패딩 없음 (RFC 7636)."""
+        challenge = generate_pkce_challenge()
+
+        digest = hashlib.sha256(challenge.code_verifier.encode()).digest()
+        expected = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+        assert challenge.code_challenge == expected
+        assert 43 <= len(challenge.code_verifier) <= 128
+        assert "=" not in challenge.code_verifier
+
+    def test_injected_verifier_bytes(self):
+        """verifier_bytes 주입 시 결정적 결과."""
+        c1 = generate_pkce_challenge(bytes(48))
+        c2 = generate_pkce_challenge(bytes(48))
+
+        assert c1 == c2
+        assert c1.code_verifier == "A" * 64
+
+    def test_entropy_pool_never_reuses_bytes(self):
+        """난수 풀은 리필 경계를 넘어도 같은 바이트를 다시 내주지 않음."""
+        pool = _EntropyPool(size=100)
+
+        with patch(
+            "ultimate_debate.auth.flows.browser_oauth.secrets.token_bytes",
+            side_effect=[bytes(range(100)), bytes(range(100, 200))],
+        ) as token_bytes:
+            chunks = [pool.get(30) for _ in range(4)]
+
+        assert token_bytes.call_count == 2
+        assert chunks[0] == bytes(range(30))
+        assert chunks[2] == bytes(range(60, 90))
+        # 남은 10바이트로는 부족하므로 새 버퍼의 처음부터 사용
+        assert chunks[3] == bytes(range(100, 130))
+
+    def test_entropy_pool_reset_discards_buffer(self):
+        """reset(fork 후 호출) 이후에는 새 버퍼에서 가져옴."""
+        pool = _EntropyPool(size=64)
+        pool.get(16)
+        pool.reset()
+
+        with patch(
+            "ultimate_debate.auth.flows.browser_oauth.secrets.token_bytes",
+            return_value=bytes(64),
+        ):
+            assert pool.get(16) == bytes(16)
+
 
 class TestBrowserOAuth:
     """BrowserOAuth 클래스 테스트."""
@@ -63,6 +121,29 @@ class TestBrowserOAuth:
         oauth = BrowserOAuth(oauth_config)
         assert oauth.port > 0
         assert "{port}" not in oauth.config.redirect_uri
+        oauth.close()
+
+    def test_auto_port_is_reserved(self, oauth_config):
+        """자동 할당 포트는 인증 전까지 바인딩 상태로 예약."""
+        oauth = BrowserOAuth(oauth_config)
+
+        with (
+            socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s,
+            pytest.raises(OSError),
+        ):
+            s.bind(("127.0.0.1", oauth.port))
+
+        oauth.close()
+
+    def test_close_releases_reserved_port(self, oauth_config):
+        """인증하지 않은 인스턴스도 close()로 예약 포트 해제."""
+        oauth = BrowserOAuth(oauth_config)
+        oauth.close()
+        oauth.close()
+
+        assert oauth._presocket is None
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", oauth.port))
 
     def test_init_with_fixed_port(self, oauth_config):
         """고정 포트 할당 검증."""
@@ -70,6 +151,15 @@ class TestBrowserOAuth:
         assert oauth.port == 8888
         assert "8888" in oauth.config.redirect_uri
 
+    def test_shared_config_not_mutated(self, oauth_config):
+        """같은 설정을 공유해도 인스턴스별 포트가 적용되고 원본은 유지."""
+        oauth1 = BrowserOAuth(oauth_config, fixed_port=8001)
+        oauth2 = BrowserOAuth(oauth_config, fixed_port=8002)
+
+        assert "{port}" in oauth_config.redirect_uri
+        assert "8001" in oauth1.config.redirect_uri
+        assert "8002" in oauth2.config.redirect_uri
+
     def test_build_authorization_url(self, oauth_config):
         """인증 URL 생성 검증."""
         oauth = BrowserOAuth(oauth_config, fixed_port=9999)
@@ -84,68 +174,180 @@ class TestBrowserOAuth:
         assert "code_challenge_method=S256" in url
         assert "state=" in url
 
+    @pytest.mark.asyncio
+    async def test_server_closed_on_failure(self, oauth_config):
+        """인증 도중 예외가 나도 콜백 서버가 정리되는지 검증."""
+        oauth = BrowserOAuth(oauth_config)
+
+        with (
+            patch.object(
+                BrowserOAuth, "_print_login_instructions", side_effect=RuntimeError
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            await oauth.authenticate(timeout=1)
+
+        # 포트가 해제되어 다시 바인딩 가능
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", oauth.port))
 
-class TestCallbackEventSync:
-    """콜백 이벤트 동기화 테스트."""
+    @pytest.mark.asyncio
+    async def test_manual_input_does_not_block_loop(self, oauth_config):
+        """수동 모드 URL 입력 대기 중에도 이벤트 루프가 다른 작업을 처리."""
+        oauth = BrowserOAuth(oauth_config, fixed_port=1455)
+        ticks = 0
+
+        def slow_input(prompt: str) -> str:
+            time.sleep(0.2)
+            return f"http://localhost:1455/auth/callback?code=abc&state={oauth.state}"
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        with (
+            patch("builtins.input", side_effect=slow_input),
+            patch("ultimate_debate.auth.flows.browser_oauth._open_browser"),
+            patch.object(
+                BrowserOAuth, "_exchange_code_for_token", new_callable=AsyncMock
+            ) as exchange,
+        ):
+            await oauth.authenticate_manual()
+        task.cancel()
+
+        exchange.assert_awaited_once_with("abc")
+        assert ticks > 5
+
+
+class TestResponsePages:
+    """콜백 응답 페이지 테스트."""
+
+    def test_success_page_pre_encoded(self):
+        """성공 페이지가 bytes로 미리 인코딩되어 있는지 검증."""
+        assert isinstance(_SUCCESS_HTML, bytes)
+        assert "인증 성공".encode() in _SUCCESS_HTML
+
+    def test_error_page_escapes_message(self):
+        """에러 메시지가 HTML 이스케이프되는지 검증."""
+        response = _error_response("<script>alert(1)</script>")
+        head, body = response.split(b"\r\n\r\n", 1)
+
+        assert head.startswith(b"HTTP/1.1 400 ")
+        assert f"Content-Length: {len(body)}".encode() in head
+        assert b"<script>alert(1)</script>" not in body
+        assert b"&lt;script&gt;" in body
+        assert body == _ERROR_HTML_TEMPLATE.format(
+            message=html.escape("<script>alert(1)</script>")
+        ).encode()
+
+
+def _fetch_status(url: str) -> int:
+    """GET 요청 후 HTTP 상태 코드 반환."""
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+class TestCallbackFuture:
+    """콜백 → 세션 Future 전달 테스트."""
+
+    @staticmethod
+    @contextlib.asynccontextmanager
+    async def _serving():
+        """세션 state가 연결된 콜백 서버 실행."""
+        future = asyncio.get_running_loop().create_future()
+        handler = OAuthCallbackHandler("test-state-123", future)
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        try:
+            yield server, future
+        finally:
+            server.close()
+            handler.close_connections()
+            await server.wait_closed()
+
+    @staticmethod
+    def _url(server, query: str) -> str:
+        port = server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/callback?{query}"
 
-    def test_event_set_on_callback(self):
-        """콜백 수신 시 이벤트 설정 검증."""
-        test_state = "test-state-123"
-        event = threading.Event()
+    @pytest.mark.asyncio
+    async def test_callback_resolves_future(self):
+        """콜백 수신 시 Future에 인증 코드 전달."""
+        async with self._serving() as (server, future):
+            url = self._url(server, "code=test-code&state=test-state-123")
+            assert await asyncio.to_thread(_fetch_status, url) == 200
 
-        with _callback_lock:
-            _callback_events[test_state] = event
+            result = await asyncio.wait_for(future, timeout=1)
+            assert result == {"auth_code": "test-code", "error": None}
 
-        # 콜백 결과 시뮬레이션
-        with _callback_lock:
-            _callback_results[test_state] = {
-                "auth_code": "test-code",
-                "error": None
-            }
-            if test_state in _callback_events:
-                _callback_events[test_state].set()
+    @pytest.mark.asyncio
+    async def test_error_callback_resolves_future(self):
+        """에러 콜백도 타임아웃 없이 즉시 전달."""
+        async with self._serving() as (server, future):
+            url = self._url(server, "error=access_denied&state=test-state-123")
+            assert await asyncio.to_thread(_fetch_status, url) == 400
 
-        # 이벤트가 설정되었는지 확인
-        assert event.is_set()
+            result = await asyncio.wait_for(future, timeout=1)
+            assert result == {"auth_code": None, "error": "access_denied"}
 
-        # 정리
-        with _callback_lock:
-            del _callback_results[test_state]
-            del _callback_events[test_state]
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", ["code=", "error=", "code=&error="])
+    async def test_blank_params_keep_waiting(self, query):
+        """빈 code/error 콜백은 400으로 거부하고 세션 결과를 설정하지 않음."""
+        async with self._serving() as (server, future):
+            url = self._url(server, f"{query}&state=test-state-123")
+            assert await asyncio.to_thread(_fetch_status, url) == 400
 
-    def test_event_wait_timeout(self):
-        """이벤트 대기 타임아웃 검증."""
-        event = threading.Event()
+            await asyncio.sleep(0.05)
+            assert not future.done()
 
-        # 0.1초 타임아웃으로 대기 (콜백 없음)
-        start = time.time()
-        result = event.wait(timeout=0.1)
-        elapsed = time.time() - start
+    @pytest.mark.asyncio
+    async def test_state_mismatch_ignored(self):
+        """다른 세션의 state로 온 콜백은 무시."""
+        async with self._serving() as (server, future):
+            url = self._url(server, "code=other-code&state=other-state")
+            assert await asyncio.to_thread(_fetch_status, url) == 400
 
-        assert result is False  # 타임아웃
-        assert elapsed >= 0.1
+            await asyncio.sleep(0.05)
+            assert not future.done()
 
-    def test_event_wait_success(self):
-        """이벤트 대기 성공 검증."""
-        event = threading.Event()
+    @pytest.mark.asyncio
+    async def test_state_mismatch_error_callback_ignored(self):
+        """state가 다른 에러 콜백도 세션 결과를 설정하지 않음."""
+        async with self._serving() as (server, future):
+            url = self._url(server, "error=access_denied&state=%EC%83%81%ED%83%9C")
+            assert await asyncio.to_thread(_fetch_status, url) == 400
 
-        # 별도 스레드에서 0.05초 후 이벤트 설정
-        def set_event():
-            time.sleep(0.05)
-            event.set()
+            await asyncio.sleep(0.05)
+            assert not future.done()
 
-        thread = threading.Thread(target=set_event)
-        thread.start()
+    @pytest.mark.asyncio
+    async def test_duplicate_callback_keeps_first_result(self):
+        """브라우저 재시도 등 중복 콜백은 첫 결과만 유지."""
+        async with self._serving() as (server, future):
+            for code in ("first-code", "second-code"):
+                url = self._url(server, f"code={code}&state=test-state-123")
+                assert await asyncio.to_thread(_fetch_status, url) == 200
 
-        # 이벤트 대기 (1초 타임아웃)
-        start = time.time()
-        result = event.wait(timeout=1.0)
-        elapsed = time.time() - start
+            result = await asyncio.wait_for(future, timeout=1)
+            assert result["auth_code"] == "first-code"
 
-        thread.join()
+    @pytest.mark.asyncio
+    async def test_idle_connection_does_not_block_shutdown(self):
+        """요청 없는 유휴 연결(preconnect)이 서버 종료를 막지 않음."""
+        async with self._serving() as (server, future):
+            port = server.sockets[0].getsockname()[1]
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            await asyncio.sleep(0.05)
 
-        assert result is True  # 성공
-        assert elapsed < 0.5  # 0.05초 근처에서 완료
+        # _serving 종료(wait_closed)가 즉시 완료되어야 함
+        writer.close()
+        assert not future.done()
 
 
 class TestTokenExchange:
@@ -174,18 +376,17 @@ class TestTokenExchange:
             "scope": "openid profile",
         }
 
+        mock_instance = AsyncMock()
+        # 공유 클라이언트 대체
         with patch(
-            "ultimate_debate.auth.flows.browser_oauth.httpx.AsyncClient"
-        ) as mock_client:
-            # 비동기 컨텍스트 매니저 설정
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-
-            # response 객체 설정 (json()은 동기 메서드)
+            "ultimate_debate.auth.flows.browser_oauth.get_shared_client",
+            AsyncMock(return_value=mock_instance),
+        ):
+            # response 객체 설정 (본문은 bytes로 파싱)
             from unittest.mock import MagicMock
             mock_response_obj = MagicMock()
             mock_response_obj.status_code = 200
-            mock_response_obj.json.return_value = mock_response_data
+            mock_response_obj.content = json.dumps(mock_response_data).encode()
             mock_instance.post.return_value = mock_response_obj
 
             token = await oauth._exchange_code_for_token("test-code")
@@ -195,26 +396,53 @@ class TestTokenExchange:
             assert token.refresh_token == "test-refresh-token"
             assert token.token_type == "Bearer"
             assert token.expires_in == 3600
+            assert not token.is_expired()
+            assert token.expires_at - time.time() == pytest.approx(3600, abs=5)
 
     @pytest.mark.asyncio
     async def test_exchange_code_failure(self, oauth):
         """토큰 교환 실패 검증."""
+        mock_instance = AsyncMock()
         with patch(
-            "ultimate_debate.auth.flows.browser_oauth.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-
+            "ultimate_debate.auth.flows.browser_oauth.get_shared_client",
+            AsyncMock(return_value=mock_instance),
+        ):
             from unittest.mock import MagicMock
             mock_response_obj = MagicMock()
             mock_response_obj.status_code = 400
-            mock_response_obj.text = "Invalid code"
+            mock_response_obj.content = b"Invalid code" + b"x" * 4096
             mock_instance.post.return_value = mock_response_obj
 
             with pytest.raises(OAuthCallbackError) as exc_info:
                 await oauth._exchange_code_for_token("invalid-code")
 
-            assert "토큰 교환 실패" in str(exc_info.value)
+            assert "토큰 교환 실패 (400): Invalid code" in str(exc_info.value)
+            # 에러 본문은 1 KiB로 제한
+            assert len(str(exc_info.value)) < 1100
+
+    def test_token_is_expired_with_skew(self):
+        """만료 임박 토큰은 skew 범위 내에서 만료로 판정."""
+        now = time.time()
+        token = TokenResponse(
+            access_token="t",
+            refresh_token=None,
+            token_type="Bearer",
+            expires_in=30,
+            expires_at=now + 30,
+        )
+
+        assert token.is_expired()  # 기본 skew 60초
+        assert not token.is_expired(skew=0)
+
+    def test_token_expires_at_defaults_from_expires_in(self):
+        """expires_at 생략 시 생성 시점 + expires_in으로 설정."""
+        before = time.time()
+        token = TokenResponse(
+            access_token="t", refresh_token=None, token_type="Bearer", expires_in=3600
+        )
+
+        assert before + 3600 <= token.expires_at <= time.time() + 3600
+        assert not token.is_expired()
 
 
 class TestCallbackUrlParsing:
@@ -240,6 +468,25 @@ class TestCallbackUrlParsing:
         assert code == "abc123"
         assert state == "xyz789"
 
+    def test_parse_callback_url_fragment(self, oauth):
+        """fragment로 전달된 콜백 파라미터 파싱 검증."""
+        url = "http://localhost:9999/auth/callback#code=abc123&state=xyz789"
+        code, state = oauth._parse_callback_url(url)
+
+        assert code == "abc123"
+        assert state == "xyz789"
+
+    def test_parse_callback_url_ignores_unrelated_params(self, oauth):
+        """관심 없는 키는 무시하고 키별 첫 값만 사용."""
+        url = (
+            "http://localhost:9999/auth/callback"
+            "?a=&a=&iss=x&code=abc%2B1&code=second&state=xyz789"
+        )
+        code, state = oauth._parse_callback_url(url)
+
+        assert code == "abc+1"
+        assert state == "xyz789"
+
     def test_parse_callback_url_error(self, oauth):
         """콜백 URL 에러 파싱 검증."""
         url = "http://localhost:9999/auth/callback?error=access_denied&error_description=User+denied"
@@ -257,3 +504,19 @@ class TestCallbackUrlParsing:
             oauth._parse_callback_url(url)
 
         assert "code" in str(exc_info.value)
+
+
+class TestModuleImport:
+    """모듈 로드 환경 테스트."""
+
+    def test_import_without_stdout(self):
+        """sys.stdout이 None이어도(pythonw 등) 모듈 로드 가능."""
+        code = (
+            "import sys; sys.stdout = None\n"
+            "from ultimate_debate.auth.flows import browser_oauth\n"
+            "assert browser_oauth._IS_TTY is False\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
@@ -1,69 +1,74 @@
 """Test concurrent authentication session isolation."""
 import pytest
 import asyncio
-import threading
-import time
-from unittest.mock import patch, MagicMock, Mock
-from http.server import HTTPServer
+import urllib.request
 
 from ultimate_debate.auth.flows.browser_oauth import (
     BrowserOAuth,
     OAuthCallbackHandler,
     OAuthConfig,
     TokenResponse,
+    _set_result_once,
 )
 
 
+async def _start_server(state: str) -> tuple[asyncio.Server, asyncio.Future]:
+    """세션 전용 콜백 서버를 임의 포트로 시작."""
+    future = asyncio.get_running_loop().create_future()
+    server = await asyncio.start_server(
+        OAuthCallbackHandler(state, future), "127.0.0.1", 0
+    )
+    return server, future
+
+
+def _send_callback(server: asyncio.Server, code: str, state: str) -> None:
+    """서버에 OAuth 콜백 요청 전송."""
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/callback?code={code}&state={state}"
+    with urllib.request.urlopen(url, timeout=5):
+        pass
+
+
 class TestConcurrentAuthIsolation:
     """동시 인증 요청 격리 테스트."""
 
-    def test_callback_handler_session_isolation(self):
+    @pytest.mark.asyncio
+    async def test_callback_handler_session_isolation(self):
         """각 세션이 독립적인 콜백 결과를 가짐."""
         # 세션 1과 세션 2가 서로 간섭하지 않음을 검증
         session1_state = "state_session_1"
         session2_state = "state_session_2"
 
-        # 세션별 결과 저장소 (새로운 구현에서 사용할 패턴)
-        # 수정 후: browser_oauth._callback_results를 사용
-        from ultimate_debate.auth.flows import browser_oauth
-
-        # 초기화
-        if hasattr(browser_oauth, '_callback_results'):
-            browser_oauth._callback_results.clear()
-
-        # 세션 1 콜백 시뮬레이션
-        if hasattr(browser_oauth, '_callback_results'):
-            browser_oauth._callback_results[session1_state] = {
-                "auth_code": "code_1",
-                "error": None
-            }
+        server1, future1 = await _start_server(session1_state)
+        server2, future2 = await _start_server(session2_state)
 
-            # 세션 2 콜백 시뮬레이션
-            browser_oauth._callback_results[session2_state] = {
-                "auth_code": "code_2",
-                "error": None
-            }
+        try:
+            # 세션 2 → 세션 1 순서로 콜백 시뮬레이션
+            await asyncio.to_thread(_send_callback, server2, "code_2", session2_state)
+            await asyncio.to_thread(_send_callback, server1, "code_1", session1_state)
 
             # 각 세션이 자신의 결과만 받음
-            assert browser_oauth._callback_results[session1_state]["auth_code"] == "code_1"
-            assert browser_oauth._callback_results[session2_state]["auth_code"] == "code_2"
-        else:
-            # 아직 구현 안 됨 - 테스트 스킵
-            pytest.skip("_callback_results not implemented yet")
+            result1 = await asyncio.wait_for(future1, timeout=1)
+            result2 = await asyncio.wait_for(future2, timeout=1)
+            assert result1["auth_code"] == "code_1"
+            assert result2["auth_code"] == "code_2"
+        finally:
+            for server in (server1, server2):
+                server.close()
+                await server.wait_closed()
 
     def test_class_variables_should_not_exist(self):
         """OAuthCallbackHandler가 클래스 변수를 공유하면 안 됨."""
-        # 수정 후: 클래스 변수가 제거되고 _callback_results로 대체됨
-
         # 클래스 변수가 제거되었는지 확인
         assert not hasattr(OAuthCallbackHandler, 'auth_code')
         assert not hasattr(OAuthCallbackHandler, 'error')
         assert not hasattr(OAuthCallbackHandler, 'state')
 
-        # 대신 모듈 레벨의 _callback_results 사용
+        # 모듈 전역 저장소 대신 서버 인스턴스별 Future 사용
         from ultimate_debate.auth.flows import browser_oauth
-        assert hasattr(browser_oauth, '_callback_results')
-        assert hasattr(browser_oauth, '_callback_lock')
+        assert not hasattr(browser_oauth, '_callback_results')
+        assert not hasattr(browser_oauth, '_callback_events')
+        assert not hasattr(browser_oauth, '_callback_lock')
 
     @pytest.mark.asyncio
     async def test_concurrent_browser_oauth_instances(self):
@@ -116,132 +121,54 @@ class TestConcurrentAuthIsolation:
 
         assert state1 != state2
 
-        # _callback_results를 통한 격리 검증
-        from ultimate_debate.auth.flows import browser_oauth
-
-        if hasattr(browser_oauth, '_callback_results'):
-            # 세션 1 콜백 시뮬레이션
-            browser_oauth._callback_results[state1] = {
-                "auth_code": "code_for_session_1",
-                "error": None
-            }
-
-            # 세션 2 콜백 시뮬레이션
-            browser_oauth._callback_results[state2] = {
-                "auth_code": "code_for_session_2",
-                "error": None
-            }
-
-            # 각 세션이 자신의 코드만 받음
-            assert browser_oauth._callback_results[state1]["auth_code"] == "code_for_session_1"
-            assert browser_oauth._callback_results[state2]["auth_code"] == "code_for_session_2"
-
-            # 정리
-            browser_oauth._callback_results.clear()
-        else:
-            pytest.skip("_callback_results not implemented yet")
-
-    def test_callback_handler_stores_result_by_state(self):
-        """OAuthCallbackHandler가 state별로 결과를 저장함."""
-        from ultimate_debate.auth.flows import browser_oauth
-
-        if not hasattr(browser_oauth, '_callback_results'):
-            pytest.skip("_callback_results not implemented yet")
-
-        # 초기화
-        browser_oauth._callback_results.clear()
-
-        # do_GET을 직접 호출하는 대신 _callback_results를 직접 조작하여 검증
-        # (OAuthCallbackHandler.__init__가 복잡한 socket 설정을 요구하므로)
-
-        # 세션별 결과 저장 시뮬레이션
-        test_state = "test_state_456"
-        test_code = "test_code_123"
-
-        with browser_oauth._callback_lock:
-            browser_oauth._callback_results[test_state] = {
-                "auth_code": test_code,
-                "error": None
-            }
-
-        # 저장된 결과 확인
-        assert test_state in browser_oauth._callback_results
-        assert browser_oauth._callback_results[test_state]["auth_code"] == test_code
-        assert browser_oauth._callback_results[test_state]["error"] is None
-
-        # 다른 세션과 격리 확인
-        another_state = "another_state_789"
-        another_code = "another_code_xyz"
-
-        with browser_oauth._callback_lock:
-            browser_oauth._callback_results[another_state] = {
-                "auth_code": another_code,
-                "error": None
-            }
-
-        # 두 세션이 독립적으로 존재
-        assert browser_oauth._callback_results[test_state]["auth_code"] == test_code
-        assert browser_oauth._callback_results[another_state]["auth_code"] == another_code
-
-        # 정리
-        browser_oauth._callback_results.clear()
-
-
-class TestCallbackResultsThreadSafety:
-    """_callback_results의 thread-safety 테스트."""
-
-    def test_callback_lock_exists(self):
-        """_callback_lock이 존재하는지 확인."""
-        from ultimate_debate.auth.flows import browser_oauth
+        # 세션별 Future를 통한 격리 검증
+        loop = asyncio.get_running_loop()
+        future1 = loop.create_future()
+        future2 = loop.create_future()
+
+        # 두 세션의 콜백을 동시에 전달
+        await asyncio.gather(
+            asyncio.to_thread(
+                loop.call_soon_threadsafe,
+                _set_result_once,
+                future1,
+                {"auth_code": "code_for_session_1", "error": None},
+            ),
+            asyncio.to_thread(
+                loop.call_soon_threadsafe,
+                _set_result_once,
+                future2,
+                {"auth_code": "code_for_session_2", "error": None},
+            ),
+        )
 
-        if not hasattr(browser_oauth, '_callback_lock'):
-            pytest.skip("_callback_lock not implemented yet")
+        # 각 세션이 자신의 코드만 받음
+        assert (await future1)["auth_code"] == "code_for_session_1"
+        assert (await future2)["auth_code"] == "code_for_session_2"
 
-        assert hasattr(browser_oauth, '_callback_lock')
-        # threading.Lock은 인스턴스이므로 type으로 체크
-        assert type(browser_oauth._callback_lock).__name__ == 'lock'
 
-    def test_concurrent_writes_are_thread_safe(self):
-        """동시 쓰기가 thread-safe한지 확인."""
-        from ultimate_debate.auth.flows import browser_oauth
+class TestCallbackFutureConcurrency:
+    """콜백 Future 전달의 동시성 테스트."""
 
-        if not hasattr(browser_oauth, '_callback_results') or not hasattr(browser_oauth, '_callback_lock'):
-            pytest.skip("_callback_results or _callback_lock not implemented yet")
-
-        # 초기화
-        browser_oauth._callback_results.clear()
-
-        results = []
-
-        def write_result(state_id: str, code: str):
-            """결과를 _callback_results에 쓰기."""
-            with browser_oauth._callback_lock:
-                browser_oauth._callback_results[state_id] = {
-                    "auth_code": code,
-                    "error": None
-                }
-                # 약간의 지연으로 race condition 유도
-                time.sleep(0.001)
-            results.append(state_id)
-
-        # 10개의 스레드가 동시에 쓰기
-        threads = []
-        for i in range(10):
-            t = threading.Thread(target=write_result, args=(f"state_{i}", f"code_{i}"))
-            threads.append(t)
-            t.start()
-
-        # 모든 스레드 완료 대기
-        for t in threads:
-            t.join()
-
-        # 모든 결과가 저장되었는지 확인
-        assert len(browser_oauth._callback_results) == 10
-
-        for i in range(10):
-            state = f"state_{i}"
-            assert state in browser_oauth._callback_results
-            assert browser_oauth._callback_results[state]["auth_code"] == f"code_{i}"
-
-        # 정리
-        browser_oauth._callback_results.clear()
+    @pytest.mark.asyncio
+    async def test_concurrent_callbacks_resolve_once(self):
+        """동시 콜백 요청이 Future를 정확히 1회만 설정."""
+        state = "state_concurrent"
+        server, future = await _start_server(state)
+
+        try:
+            # 10개의 콜백 요청을 동시에 전송
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(_send_callback, server, f"code_{i}", state)
+                    for i in range(10)
+                )
+            )
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        # 첫 결과 하나만 설정되고 예외 없이 완료
+        result = await asyncio.wait_for(future, timeout=1)
+        assert result["auth_code"].startswith("code_")
+        assert future.done() and future.exception() is None
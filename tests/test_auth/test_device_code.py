@@ -4,6 +4,8 @@ RFC 8628 Device Authorization Grant 테스트.
 """
 
 import asyncio
+import json
+import time
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -19,6 +21,11 @@ from ultimate_debate.auth.flows.device_code import (
 )
 
 
+def _json_bytes(payload: dict) -> bytes:
+    """모의 응답 본문 (토큰 엔드포인트는 response.content를 바이트째 파싱)."""
+    return json.dumps(payload).encode()
+
+
 class TestDeviceCodeResponse:
     """DeviceCodeResponse 데이터클래스 테스트."""
 
@@ -108,7 +115,7 @@ class TestDeviceCodeOAuth:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                status_code=200, json=lambda: mock_response
+                status_code=200, content=_json_bytes(mock_response)
             )
 
             result = await oauth.request_device_code()
@@ -142,7 +149,7 @@ class TestDeviceCodeOAuth:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                status_code=200, json=lambda: mock_token_response
+                status_code=200, content=_json_bytes(mock_token_response)
             )
 
             # TokenResponse는 browser_oauth에서 import
@@ -178,8 +185,8 @@ class TestDeviceCodeOAuth:
             nonlocal call_count
             call_count += 1
             if call_count < 3:
-                return MagicMock(status_code=400, json=lambda: pending_response)
-            return MagicMock(status_code=200, json=lambda: success_response)
+                return MagicMock(status_code=400, content=_json_bytes(pending_response))
+            return MagicMock(status_code=200, content=_json_bytes(success_response))
 
         with patch("httpx.AsyncClient.post", side_effect=mock_post_side_effect):
             result = await oauth.poll_for_token(
@@ -210,8 +217,10 @@ class TestDeviceCodeOAuth:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                return MagicMock(status_code=400, json=lambda: slow_down_response)
-            return MagicMock(status_code=200, json=lambda: success_response)
+                return MagicMock(
+                    status_code=400, content=_json_bytes(slow_down_response)
+                )
+            return MagicMock(status_code=200, content=_json_bytes(success_response))
 
         with patch("httpx.AsyncClient.post", side_effect=mock_post_side_effect):
             # slow_down 시 interval이 증가해야 함
@@ -223,6 +232,100 @@ class TestDeviceCodeOAuth:
 
         assert result.access_token == "access_123"
 
+    @pytest.mark.asyncio
+    async def test_poll_for_token_first_poll_immediate(self, oauth):
+        """첫 폴링은 interval 대기 없이 즉시 전송."""
+        success = MagicMock(
+            status_code=200,
+            content=_json_bytes({"access_token": "access_123", "expires_in": 3600}),
+        )
+
+        with (
+            patch("httpx.AsyncClient.post", return_value=success),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await oauth.poll_for_token(
+                device_code="dev_code_123",
+                interval=5,
+                timeout=30,
+            )
+
+        assert result.access_token == "access_123"
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_poll_for_token_slow_down_retry_after(self, oauth):
+        """slow_down 응답의 Retry-After 헤더를 interval 증가분으로 사용."""
+        slow_down = MagicMock(
+            status_code=400,
+            content=_json_bytes({"error": "slow_down"}),
+            headers={"Retry-After": "2"},
+        )
+        success = MagicMock(
+            status_code=200,
+            content=_json_bytes({"access_token": "access_123", "expires_in": 3600}),
+        )
+
+        with (
+            patch("httpx.AsyncClient.post", side_effect=[slow_down, success]),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await oauth.poll_for_token(
+                device_code="dev_code_123",
+                interval=1,
+                timeout=30,
+            )
+
+        assert result.access_token == "access_123"
+        # interval 1 + Retry-After 2 (지터는 위쪽으로 최대 10%)
+        assert 3 <= mock_sleep.await_args.args[0] <= 3.3
+
+    @pytest.mark.asyncio
+    async def test_poll_for_token_slow_down_capped(self, oauth):
+        """slow_down이 반복돼도 interval은 MAX_POLL_INTERVAL을 넘지 않음."""
+        slow_down = MagicMock(
+            status_code=400, content=_json_bytes({"error": "slow_down"}), headers={}
+        )
+        success = MagicMock(
+            status_code=200,
+            content=_json_bytes({"access_token": "access_123", "expires_in": 3600}),
+        )
+
+        with (
+            patch("httpx.AsyncClient.post", side_effect=[slow_down] * 20 + [success]),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            await oauth.poll_for_token(
+                device_code="dev_code_123",
+                interval=5,
+                timeout=10_000,
+            )
+
+        max_delay = DeviceCodeOAuth.MAX_POLL_INTERVAL * (
+            1 + DeviceCodeOAuth.POLL_JITTER
+        )
+        delays = [c.args[0] for c in mock_sleep.await_args_list]
+        assert max(delays) <= max_delay
+        assert min(delays) >= 10
+
+    @pytest.mark.asyncio
+    async def test_poll_for_token_sleep_capped_by_deadline(self, oauth):
+        """마감 시각을 넘겨 대기하지 않음."""
+        pending = MagicMock(
+            status_code=400, content=_json_bytes({"error": "authorization_pending"})
+        )
+
+        with patch("httpx.AsyncClient.post", return_value=pending):
+            start = time.monotonic()
+            with pytest.raises(DeviceCodeError):
+                await oauth.poll_for_token(
+                    device_code="dev_code_123",
+                    interval=5,
+                    timeout=0.2,
+                )
+
+        assert time.monotonic() - start < 1
+
     @pytest.mark.asyncio
     async def test_poll_for_token_expired(self, oauth):
         """토큰 폴링 - 만료 테스트."""
@@ -233,7 +336,7 @@ class TestDeviceCodeOAuth:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                status_code=400, json=lambda: expired_response
+                status_code=400, content=_json_bytes(expired_response)
             )
 
             with pytest.raises(DeviceCodeError) as exc:
@@ -255,7 +358,7 @@ class TestDeviceCodeOAuth:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                status_code=400, json=lambda: denied_response
+                status_code=400, content=_json_bytes(denied_response)
             )
 
             with pytest.raises(DeviceCodeError) as exc:
@@ -276,7 +379,7 @@ class TestDeviceCodeOAuth:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                status_code=400, json=lambda: pending_response
+                status_code=400, content=_json_bytes(pending_response)
             )
 
             with pytest.raises(DeviceCodeError) as exc:
@@ -359,15 +462,16 @@ class TestDeviceCodeFullFlow:
             call_count += 1
             if call_count == 1:
                 # device code 요청
-                return MagicMock(status_code=200, json=lambda: device_response)
+                return MagicMock(status_code=200, content=_json_bytes(device_response))
             elif call_count == 2:
                 # 첫 번째 폴링 - pending
                 return MagicMock(
-                    status_code=400, json=lambda: {"error": "authorization_pending"}
+                    status_code=400,
+                    content=_json_bytes({"error": "authorization_pending"}),
                 )
             else:
                 # 두 번째 폴링 - 성공
-                return MagicMock(status_code=200, json=lambda: token_response)
+                return MagicMock(status_code=200, content=_json_bytes(token_response))
 
         with patch("httpx.AsyncClient.post", side_effect=mock_post_side_effect):
             with patch.object(oauth, "display_instructions"):  # 출력 억제
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
+from ultimate_debate.auth.providers import google_provider
 from ultimate_debate.auth.providers.google_provider import (
     GoogleProvider,
     try_import_gemini_cli_token,
@@ -114,6 +115,45 @@ class TestGeminiCLITokenReuse:
 
         assert result is None
 
+    def test_try_import_gemini_cli_token_env_override(self, tmp_path, monkeypatch):
+        """GEMINI_CREDS_PATH 환경변수로 토큰 파일 경로 지정."""
+        token_file = tmp_path / "custom_creds.json"
+        token_file.write_text(json.dumps({"access_token": "custom_token"}))
+        monkeypatch.setenv("GEMINI_CREDS_PATH", str(token_file))
+
+        result = try_import_gemini_cli_token()
+
+        assert result is not None
+        assert result.access_token == "custom_token"
+
+    def test_try_import_gemini_cli_token_cached_until_modified(self, tmp_path):
+        """파일이 바뀌지 않으면 재파싱하지 않고, 바뀌면 다시 읽음."""
+        gemini_dir = tmp_path / ".gemini"
+        gemini_dir.mkdir()
+        token_file = gemini_dir / "oauth_creds.json"
+        expires_at = (datetime.now() + timedelta(hours=1)).isoformat()
+        token_file.write_text(
+            json.dumps({"access_token": "first", "expires_at": expires_at})
+        )
+
+        with (
+            patch.object(Path, "home", return_value=tmp_path),
+            patch(
+                "ultimate_debate.auth.providers.google_provider"
+                "._load_gemini_cli_token",
+                wraps=google_provider._load_gemini_cli_token,
+            ) as load,
+        ):
+            assert try_import_gemini_cli_token().access_token == "first"
+            assert try_import_gemini_cli_token().access_token == "first"
+            assert load.call_count == 1
+
+            token_file.write_text(
+                json.dumps({"access_token": "second!", "expires_at": expires_at})
+            )
+            assert try_import_gemini_cli_token().access_token == "second!"
+            assert load.call_count == 2
+
     @pytest.mark.asyncio
     async def test_google_provider_uses_cli_token(self, tmp_path):
         """GoogleProvider.login()이 CLI 토큰을 우선 사용."""
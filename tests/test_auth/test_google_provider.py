@@ -0,0 +1,386 @@
+"""Google Provider 테스트.
+
+GoogleProvider의 HTTP 메서드 검증:
+- async with 종료 시 공유 클라이언트 유지
+- refresh(): 토큰 갱신
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ultimate_debate.auth.http_client import aclose_shared_client, get_shared_client
+from ultimate_debate.auth.providers import google_provider
+from ultimate_debate.auth.providers.base import AuthToken
+from ultimate_debate.auth.providers.google_provider import GoogleProvider
+
+
+def _json_response(status: int = 200, body: dict | None = None, **kwargs) -> MagicMock:
+    """JSON 본문을 가진 httpx 응답 대역"""
+    response = MagicMock(status_code=status, **kwargs)
+    if body is not None:
+        response.content = json.dumps(body).encode()
+    return response
+
+
+@pytest.fixture
+def mock_client():
+    """공유 HTTP 클라이언트 대역 (get_shared_client가 반환)"""
+    client = MagicMock()
+    client.get = AsyncMock(return_value=_json_response())
+    client.post = AsyncMock(return_value=_json_response())
+    with patch.object(
+        google_provider, "get_shared_client", AsyncMock(return_value=client)
+    ):
+        yield client
+
+
+class TestSharedHttpClient:
+    """공유 httpx 클라이언트 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_async_with_keeps_shared_client_open(self):
+        """async with 블록 종료가 다른 사용자의 공유 클라이언트를 닫지 않음."""
+        client = await get_shared_client()
+        async with GoogleProvider():
+            pass
+
+        assert not client.is_closed
+        assert await get_shared_client() is client
+        await aclose_shared_client()
+
+
+class TestRefresh:
+    """refresh() 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_uses_shared_client(self, mock_client):
+        """토큰 갱신이 공유 클라이언트로 요청하고 기존 scope를 유지."""
+        provider = GoogleProvider(client_id="cid", client_secret="secret")
+        old_token = AuthToken(
+            provider="google",
+            access_token="old-at",
+            refresh_token="rt",
+            scopes=("openid",),
+        )
+        mock_client.post.return_value = _json_response(
+            body={"access_token": "new-at", "expires_in": 3600}
+        )
+
+        token = await provider.refresh(old_token)
+
+        assert token.access_token == "new-at"
+        assert token.refresh_token == "rt"
+        assert token.scopes == ("openid",)
+        data = mock_client.post.await_args.kwargs["data"]
+        assert data["client_secret"] == "secret"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_sends_one_request(self, mock_client):
+        """동시 refresh 호출은 요청 1회로 합쳐지고 결과를 공유."""
+        provider = GoogleProvider()
+        old_token = AuthToken(provider="google", access_token="old", refresh_token="rt")
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _json_response(body={"access_token": "new-at"})
+
+        mock_client.post.side_effect = slow_post
+
+        tokens = await asyncio.gather(*(provider.refresh(old_token) for _ in range(5)))
+
+        assert mock_client.post.await_count == 1
+        assert {t.access_token for t in tokens} == {"new-at"}
+        assert provider._refreshes.tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_shared_and_cleared(self, mock_client):
+        """갱신 실패는 모든 호출자에 전파되고 다음 호출은 다시 요청."""
+        provider = GoogleProvider()
+        old_token = AuthToken(provider="google", access_token="old", refresh_token="rt")
+        mock_client.post.return_value = _json_response(400, text="invalid_grant")
+
+        results = await asyncio.gather(
+            provider.refresh(old_token),
+            provider.refresh(old_token),
+            return_exceptions=True,
+        )
+        with pytest.raises(ValueError, match="invalid_grant"):
+            await provider.refresh(old_token)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert mock_client.post.await_count == 2
+
+
+class TestValidationCache:
+    """validate()/get_account_info() 캐시 테스트."""
+
+    @pytest.fixture
+    def token(self) -> AuthToken:
+        return AuthToken(
+            provider="google",
+            access_token=f"at-{time.time_ns()}",
+            expires_at_epoch=time.time() + 3600,
+        )
+
+    @pytest.mark.asyncio
+    async def test_validate_cached(self, token, mock_client):
+        """연속 validate는 tokeninfo를 한 번만 호출."""
+        provider = GoogleProvider()
+
+        results = [await provider.validate(token) for _ in range(3)]
+
+        assert results == [True, True, True]
+        assert mock_client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_server_error_not_cached(self, token, mock_client):
+        """5xx 응답은 캐시하지 않고 다음 호출에서 재조회."""
+        provider = GoogleProvider()
+        mock_client.get.side_effect = [_json_response(503), _json_response(200)]
+
+        assert await provider.validate(token) is False
+        assert await provider.validate(token) is True
+
+    @pytest.mark.asyncio
+    async def test_logout_invalidates_cache(self, token, mock_client):
+        """logout 후에는 캐시된 결과 대신 다시 조회."""
+        provider = GoogleProvider()
+        mock_client.get.return_value = _json_response(body={"email": "a@example.com"})
+
+        first = await provider.get_account_info(token)
+        first["email"] = "mutated"
+        assert await provider.get_account_info(token) == {"email": "a@example.com"}
+        await provider.logout(token)
+        await provider.get_account_info(token)
+
+        assert mock_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_validate_and_info_concurrent(self, token, mock_client):
+        """검증과 계정 정보 요청이 동시에 진행."""
+        provider = GoogleProvider()
+        in_flight = 0
+        peak = 0
+
+        async def get(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _json_response(body={"email": "a@example.com"})
+
+        mock_client.get.side_effect = get
+
+        valid, info = await provider.validate_and_info(token)
+
+        assert valid is True
+        assert info == {"email": "a@example.com"}
+        assert peak == 2
+
+
+class TestRateLimit:
+    """클라이언트 측 속도 제한 / 429 재시도 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_bucket_waits_when_empty(self):
+        """버킷이 비면 보충 속도에 맞춰 대기."""
+        bucket = google_provider._AdaptiveTokenBucket(capacity=1, rate=10)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await bucket.acquire()
+            mock_sleep.assert_not_awaited()
+            await bucket.acquire()
+
+        assert mock_sleep.await_args.args[0] == pytest.approx(0.1, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_429_retried_and_rate_reduced(self, mock_client):
+        """429 응답은 Retry-After 후 재시도하고 보충 속도를 절반으로."""
+        bucket = google_provider._AdaptiveTokenBucket(rate=20, min_rate=1)
+        throttled = _json_response(429, headers={"Retry-After": "2"})
+        mock_client.get.side_effect = [throttled, _json_response(200)]
+
+        with (
+            patch.object(google_provider, "_google_bucket", bucket),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            response = await GoogleProvider()._send("get", "https://example.com")
+
+        assert response.status_code == 200
+        assert mock_client.get.await_count == 2
+        mock_sleep.assert_awaited_once_with(2)
+        # 20 → 429로 10 → 성공으로 11
+        assert bucket.rate == 11
+
+    @pytest.mark.asyncio
+    async def test_429_gives_up_after_retries(self, mock_client):
+        """재시도 후에도 429면 마지막 응답 반환."""
+        bucket = google_provider._AdaptiveTokenBucket()
+        mock_client.post.return_value = _json_response(429, headers={})
+
+        with (
+            patch.object(google_provider, "_google_bucket", bucket),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            response = await GoogleProvider()._send("post", "https://example.com")
+
+        assert response.status_code == 429
+        assert mock_client.post.await_count == google_provider._THROTTLE_RETRIES + 1
+        assert all(c.args[0] <= 30 for c in mock_sleep.await_args_list)
+
+
+class TestEnsureFresh:
+    """ensure_fresh() 선제 갱신 테스트."""
+
+    @staticmethod
+    def _token(remaining: float) -> AuthToken:
+        return AuthToken(
+            provider="google",
+            access_token=f"at-{remaining}",
+            refresh_token="rt",
+            expires_at_epoch=time.time() + remaining,
+        )
+
+    @pytest.fixture
+    def mock_client(self, mock_client):
+        """갱신 요청에 새 토큰을 반환하는 클라이언트"""
+        mock_client.post.return_value = _json_response(
+            body={"access_token": "new-at", "expires_in": 3600}
+        )
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_fresh_token_untouched(self):
+        """만료까지 여유가 있으면 갱신하지 않음."""
+        provider = GoogleProvider()
+        token = self._token(3600)
+
+        assert await provider.ensure_fresh(token) is token
+        assert provider._refreshes.tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_before_expiry(self, mock_client):
+        """만료 5분 이내면 현재 토큰을 반환하고 백그라운드에서 갱신."""
+        provider = GoogleProvider()
+        token = self._token(120)
+
+        assert await provider.ensure_fresh(token) is token
+        await asyncio.gather(*provider._refreshes.tasks.values())
+        refreshed = await provider.ensure_fresh(token)
+
+        assert refreshed.access_token == "new-at"
+        assert mock_client.post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_blocking_refresh_near_expiry(self, mock_client):
+        """만료 1분 이내면 갱신 완료까지 대기."""
+        provider = GoogleProvider()
+
+        refreshed = await provider.ensure_fresh(self._token(10))
+
+        assert refreshed.access_token == "new-at"
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_latest_token(self, mock_client):
+        """갱신 결과는 Provider당 마지막 1개만 보관."""
+        provider = GoogleProvider()
+
+        for refresh_token in ("rt-a", "rt-b", "rt-c"):
+            await provider.refresh(
+                AuthToken(
+                    provider="google",
+                    access_token="at",
+                    refresh_token=refresh_token,
+                )
+            )
+
+        assert provider._latest_token[0] == "rt-c"
+        other = AuthToken(
+            provider="google",
+            access_token="at",
+            refresh_token="rt-a",
+            expires_at_epoch=time.time() + 3600,
+        )
+        assert await provider.ensure_fresh(other) is other
+
+    @pytest.mark.asyncio
+    async def test_failure_logged_only_in_background(self, mock_client, caplog):
+        """기다리는 호출자가 있는 갱신 실패는 로그 없이 호출자에게 전달."""
+        provider = GoogleProvider()
+        mock_client.post.return_value = _json_response(400, text="invalid_grant")
+
+        with pytest.raises(ValueError, match="invalid_grant"):
+            await provider.refresh(self._token(3600))
+        await asyncio.sleep(0)
+        assert "백그라운드 토큰 갱신 오류" not in caplog.text
+
+        await provider.ensure_fresh(self._token(120))
+        await asyncio.gather(
+            *provider._refreshes.tasks.values(), return_exceptions=True
+        )
+        await asyncio.sleep(0)
+
+        assert caplog.text.count("Google 백그라운드 토큰 갱신 오류") == 1
+
+
+class TestLogin:
+    """login() 테스트."""
+
+    @staticmethod
+    def _token_response(scope: str | None) -> MagicMock:
+        return MagicMock(
+            access_token="at",
+            refresh_token="rt",
+            expires_at=time.time() + 3600,
+            token_type="Bearer",
+            scope=scope,
+        )
+
+    @staticmethod
+    def _patch_browser_login():
+        return (
+            patch(
+                "ultimate_debate.auth.providers.google_provider"
+                ".try_import_gemini_cli_token",
+                return_value=None,
+            ),
+            patch("ultimate_debate.auth.providers.google_provider.BrowserOAuth"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_login_without_scope_uses_requested_scopes(self):
+        """응답에 scope가 없으면 요청한 SCOPES를 그대로 사용."""
+        provider = GoogleProvider()
+        no_cli_token, browser_oauth = self._patch_browser_login()
+
+        with no_cli_token, browser_oauth as oauth_cls:
+            oauth_cls.return_value.authenticate = AsyncMock(
+                return_value=self._token_response(None)
+            )
+            token = await provider.login()
+
+        assert token.scopes is GoogleProvider.SCOPES
+
+    @pytest.mark.asyncio
+    async def test_browser_login_uses_reserved_port(self):
+        """브라우저 로그인은 포트 스캔 없이 BrowserOAuth의 예약 포트 사용."""
+        provider = GoogleProvider()
+        token_response = self._token_response("openid email")
+
+        no_cli_token, browser_oauth = self._patch_browser_login()
+
+        with no_cli_token, browser_oauth as oauth_cls:
+            oauth_cls.return_value.authenticate = AsyncMock(
+                return_value=token_response
+            )
+            token = await provider.login()
+
+        config = oauth_cls.call_args.args[0]
+        assert config.redirect_uri == "http://localhost:{port}/callback"
+        assert "fixed_port" not in oauth_cls.call_args.kwargs
+        assert token.scopes == ("openid", "email")
@@ -0,0 +1,80 @@
+"""공유 HTTP 클라이언트 테스트"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from ultimate_debate.auth.http_client import (
+    aclose_shared_client,
+    get_shared_client,
+    retry_after_seconds,
+)
+
+
+class TestSharedClient:
+    """get_shared_client()/aclose_shared_client() 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self):
+        """호출 간 같은 클라이언트를 재사용하고 종료 후 재생성"""
+        first = await get_shared_client()
+        second = await get_shared_client()
+        assert first is second
+
+        await aclose_shared_client()
+        assert first.is_closed
+
+        third = await get_shared_client()
+        assert third is not first
+        await aclose_shared_client()
+
+    def test_client_on_running_loop_closed_when_loop_changes(self):
+        """다른 스레드에서 실행 중인 루프의 이전 클라이언트는 그 루프에서 닫음"""
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+            future = asyncio.run_coroutine_threadsafe(get_shared_client(), other)
+            first = future.result(timeout=1)
+            second = asyncio.run(get_shared_client())
+            # 이전 루프에 예약된 aclose()가 끝날 때까지 대기
+            drained = asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other)
+            drained.result(timeout=1)
+
+            assert second is not first
+            assert first.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(timeout=1)
+            other.close()
+            asyncio.run(aclose_shared_client())
+
+    def test_client_of_closed_loop_dropped(self):
+        """종료된 루프(반복된 asyncio.run)의 클라이언트는 닫지 않고 교체"""
+        first = asyncio.run(get_shared_client())
+        second = asyncio.run(get_shared_client())
+
+        assert second is not first
+        assert not first.is_closed
+        asyncio.run(aclose_shared_client())
+
+
+class TestRetryAfterSeconds:
+    """retry_after_seconds() 테스트"""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("7", 7),
+            (" 3 ", 3),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", None),
+            (None, None),
+        ],
+    )
+    def test_parse(self, header, expected):
+        """초 단위 값만 정수로 반환"""
+        response = MagicMock()
+        response.headers = {} if header is None else {"Retry-After": header}
+        assert retry_after_seconds(response) == expected
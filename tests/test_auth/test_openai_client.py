@@ -25,7 +25,7 @@ def _make_token(expired: bool = False, refresh: str | None = "rt") -> AuthToken:
         provider="openai",
         access_token="test-at",
         refresh_token=refresh,
-        expires_at=expires_at,
+        expires_at_epoch=expires_at.timestamp(),
     )
 
 
@@ -9,16 +9,43 @@ OpenAIProvider의 OAuth 메서드 검증:
 - get_account_info(): 계정 정보 조회
 """
 
+import asyncio
+import base64
+import json
+import os
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from urllib.parse import parse_qs, urlparse
 
 import pytest
 
+from ultimate_debate.auth.providers import openai_provider
 from ultimate_debate.auth.providers.base import AuthToken
 from ultimate_debate.auth.providers.openai_provider import OpenAIProvider
 
 
+def _json_response(status: int = 200, body: dict | None = None, **kwargs) -> MagicMock:
+    """JSON 본문을 가진 httpx 응답 대역"""
+    response = MagicMock(status_code=status, **kwargs)
+    if body is not None:
+        response.content = json.dumps(body).encode()
+    return response
+
+
+@pytest.fixture
+def mock_client():
+    """공유 HTTP 클라이언트 대역 (get_shared_client가 반환)"""
+    client = MagicMock()
+    client.get = AsyncMock(return_value=_json_response())
+    client.post = AsyncMock(return_value=_json_response())
+    with patch.object(
+        openai_provider, "get_shared_client", AsyncMock(return_value=client)
+    ):
+        yield client
+
+
 class TestOpenAIProviderInit:
     """OpenAIProvider 초기화 테스트."""
 
@@ -108,35 +135,28 @@ class TestExchangeCode:
     """exchange_code() 테스트."""
 
     @pytest.mark.asyncio
-    async def test_exchange_code_success(self):
+    async def test_exchange_code_success(self, mock_client):
         """토큰 교환 성공 검증."""
         provider = OpenAIProvider()
         provider._pkce = MagicMock()
         provider._pkce.code_verifier = "test-verifier"
         provider._redirect_uri = "http://localhost:1455/auth/callback"
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "at-test-123",
-            "refresh_token": "rt-test-456",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-            "scope": "openid profile email",
-        }
-
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.post.return_value = mock_response
+        mock_client.post.return_value = _json_response(
+            body={
+                "access_token": "at-test-123",
+                "refresh_token": "rt-test-456",
+                "token_type": "Bearer",
+                "expires_in": 3600,
+                "scope": "openid profile email",
+            }
+        )
 
-            callback = (
-                "http://localhost:1455/auth/callback"
-                "?code=test-code&state=test-state"
-            )
-            token = await provider.exchange_code(callback)
+        callback = (
+            "http://localhost:1455/auth/callback"
+            "?code=test-code&state=test-state"
+        )
+        token = await provider.exchange_code(callback)
 
         assert isinstance(token, AuthToken)
         assert token.access_token == "at-test-123"
@@ -169,30 +189,31 @@ class TestExchangeCode:
             await provider.exchange_code(callback)
 
     @pytest.mark.asyncio
-    async def test_exchange_code_api_failure(self):
+    async def test_exchange_code_empty_code(self):
+        """빈 code 값은 code 없음과 동일하게 처리."""
+        provider = OpenAIProvider()
+
+        callback = "http://localhost:1455/auth/callback?code=&state=test"
+
+        with pytest.raises(ValueError, match="code 파라미터"):
+            await provider.exchange_code(callback)
+
+    @pytest.mark.asyncio
+    async def test_exchange_code_api_failure(self, mock_client):
         """토큰 교환 API 실패 검증."""
         provider = OpenAIProvider()
         provider._pkce = MagicMock()
         provider._pkce.code_verifier = "test-verifier"
         provider._redirect_uri = "http://localhost:1455/auth/callback"
 
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "invalid_grant"
+        mock_client.post.return_value = _json_response(400, text="invalid_grant")
 
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.post.return_value = mock_response
-
-            callback = (
-                "http://localhost:1455/auth/callback"
-                "?code=expired-code&state=test"
-            )
-            with pytest.raises(ValueError, match="토큰 교환 실패"):
-                await provider.exchange_code(callback)
+        callback = (
+            "http://localhost:1455/auth/callback"
+            "?code=expired-code&state=test"
+        )
+        with pytest.raises(ValueError, match="토큰 교환 실패"):
+            await provider.exchange_code(callback)
 
 
 class TestLogin:
@@ -290,7 +311,7 @@ class TestLogin:
             provider="openai",
             access_token="codex-at",
             refresh_token="codex-rt",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at_epoch=(datetime.now() + timedelta(hours=1)).timestamp(),
         )
 
         with patch.object(
@@ -314,11 +335,129 @@ class TestLogin:
         assert not hasattr(provider, "login_device_code")
 
 
+class TestCodexCliToken:
+    """_try_codex_cli_token() 테스트."""
+
+    @staticmethod
+    def _write_auth(home, access_token: str) -> None:
+        codex_dir = home / ".codex"
+        codex_dir.mkdir(exist_ok=True)
+        (codex_dir / "auth.json").write_text(
+            json.dumps({"tokens": {"access_token": access_token}})
+        )
+
+    @staticmethod
+    def _jwt(exp: float) -> str:
+        payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode())
+        return f"h.{payload.decode().rstrip('=')}.s"
+
+    def test_decoded_until_modified(self, tmp_path, monkeypatch):
+        """파일이 바뀌기 전까지는 다시 디코딩하지 않음."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(OpenAIProvider, "_codex_cache", {})
+        first_jwt = self._jwt(time.time() + 3600)
+        self._write_auth(tmp_path, first_jwt)
+        provider = OpenAIProvider()
+
+        with patch.object(
+            OpenAIProvider,
+            "_load_codex_cli_token",
+            wraps=OpenAIProvider._load_codex_cli_token,
+        ) as load:
+            assert provider._try_codex_cli_token().access_token == first_jwt
+            assert provider._try_codex_cli_token().access_token == first_jwt
+            assert load.call_count == 1
+
+            second_jwt = self._jwt(time.time() + 7200)
+            self._write_auth(tmp_path, second_jwt)
+            auth_path = tmp_path / ".codex" / "auth.json"
+            st = auth_path.stat()
+            os.utime(auth_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            assert provider._try_codex_cli_token().access_token == second_jwt
+            assert load.call_count == 2
+
+    def test_expired_token_ignored(self, tmp_path, monkeypatch):
+        """만료된 Codex CLI 토큰은 None."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(OpenAIProvider, "_codex_cache", {})
+        self._write_auth(tmp_path, self._jwt(time.time() - 60))
+
+        assert OpenAIProvider()._try_codex_cli_token() is None
+
+    def test_payload_padding(self, tmp_path, monkeypatch):
+        """패딩 없이 4의 배수가 아닌 길이의 payload도 디코딩."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(OpenAIProvider, "_codex_cache", {})
+        exp = time.time() + 3600
+        for extra in ("", "a", "ab", "abc"):
+            claims = {"exp": exp, "x": extra}
+            payload = base64.urlsafe_b64encode(json.dumps(claims).encode())
+            self._write_auth(tmp_path, f"h.{payload.decode().rstrip('=')}.s")
+            token = OpenAIProvider._load_codex_cli_token(
+                tmp_path / ".codex" / "auth.json"
+            )
+            assert token is not None
+            assert token.expires_at_epoch == exp
+
+    @pytest.mark.asyncio
+    async def test_refresh_writes_back_rotated_tokens(
+        self, tmp_path, monkeypatch, mock_client
+    ):
+        """갱신된 토큰을 같은 refresh_token의 Codex CLI 파일에 반영."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        codex_dir = tmp_path / ".codex"
+        codex_dir.mkdir()
+        auth_path = codex_dir / "auth.json"
+        auth_path.write_text(
+            json.dumps(
+                {
+                    "OPENAI_API_KEY": None,
+                    "tokens": {"access_token": "old-at", "refresh_token": "old-rt"},
+                }
+            )
+        )
+        provider = OpenAIProvider()
+        old_token = AuthToken(
+            provider="openai", access_token="old-at", refresh_token="old-rt"
+        )
+        mock_client.post.return_value = _json_response(
+            body={
+                "access_token": "new-at",
+                "refresh_token": "new-rt",
+                "id_token": "new-id",
+            }
+        )
+
+        await provider.refresh(old_token)
+
+        codex = json.loads(auth_path.read_text())
+        assert codex["tokens"] == {
+            "access_token": "new-at",
+            "refresh_token": "new-rt",
+            "id_token": "new-id",
+        }
+        assert codex["OPENAI_API_KEY"] is None
+        assert "last_refresh" in codex
+        assert [p.name for p in codex_dir.glob("*.tmp")] == []
+
+        # 파일의 refresh_token이 다르면 덮어쓰지 않음
+        assert not OpenAIProvider._write_back_codex_tokens(
+            "other-rt", {"access_token": "x"}
+        )
+        assert json.loads(auth_path.read_text()) == codex
+
+    def test_missing_file(self, tmp_path, monkeypatch):
+        """파일이 없으면 None."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        assert OpenAIProvider()._try_codex_cli_token() is None
+
+
 class TestRefresh:
     """refresh() 테스트."""
 
     @pytest.mark.asyncio
-    async def test_refresh_success(self):
+    async def test_refresh_success(self, mock_client):
         """토큰 갱신 성공 검증."""
         provider = OpenAIProvider()
 
@@ -326,27 +465,20 @@ class TestRefresh:
             provider="openai",
             access_token="old-at",
             refresh_token="valid-rt",
-            expires_at=datetime.now() - timedelta(hours=1),
+            expires_at_epoch=(datetime.now() - timedelta(hours=1)).timestamp(),
         )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "new-at",
-            "refresh_token": "new-rt",
-            "token_type": "Bearer",
-            "expires_in": 7200,
-            "scope": "openid profile",
-        }
-
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.post.return_value = mock_response
+        mock_client.post.return_value = _json_response(
+            body={
+                "access_token": "new-at",
+                "refresh_token": "new-rt",
+                "token_type": "Bearer",
+                "expires_in": 7200,
+                "scope": "openid profile",
+            }
+        )
 
-            new_token = await provider.refresh(old_token)
+        new_token = await provider.refresh(old_token)
 
         assert new_token.access_token == "new-at"
         assert new_token.refresh_token == "new-rt"
@@ -361,14 +493,14 @@ class TestRefresh:
             provider="openai",
             access_token="at",
             refresh_token=None,
-            expires_at=datetime.now() - timedelta(hours=1),
+            expires_at_epoch=(datetime.now() - timedelta(hours=1)).timestamp(),
         )
 
         with pytest.raises(ValueError, match="Refresh token"):
             await provider.refresh(token)
 
     @pytest.mark.asyncio
-    async def test_refresh_api_failure(self):
+    async def test_refresh_api_failure(self, mock_client):
         """토큰 갱신 API 실패 검증."""
         provider = OpenAIProvider()
 
@@ -376,25 +508,16 @@ class TestRefresh:
             provider="openai",
             access_token="at",
             refresh_token="bad-rt",
-            expires_at=datetime.now() - timedelta(hours=1),
+            expires_at_epoch=(datetime.now() - timedelta(hours=1)).timestamp(),
         )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "invalid_grant"
+        mock_client.post.return_value = _json_response(400, text="invalid_grant")
 
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.post.return_value = mock_response
-
-            with pytest.raises(ValueError, match="토큰 갱신 실패"):
-                await provider.refresh(token)
+        with pytest.raises(ValueError, match="토큰 갱신 실패"):
+            await provider.refresh(token)
 
     @pytest.mark.asyncio
-    async def test_refresh_preserves_old_refresh_token(self):
+    async def test_refresh_preserves_old_refresh_token(self, mock_client):
         """갱신 응답에 refresh_token 없으면 기존 값 유지 검증."""
         provider = OpenAIProvider()
 
@@ -402,28 +525,69 @@ class TestRefresh:
             provider="openai",
             access_token="old-at",
             refresh_token="keep-this-rt",
-            expires_at=datetime.now() - timedelta(hours=1),
+            expires_at_epoch=(datetime.now() - timedelta(hours=1)).timestamp(),
         )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "new-at",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-        }
-
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.post.return_value = mock_response
+        mock_client.post.return_value = _json_response(
+            body={"access_token": "new-at", "token_type": "Bearer", "expires_in": 3600}
+        )
 
-            new_token = await provider.refresh(old_token)
+        new_token = await provider.refresh(old_token)
 
         assert new_token.refresh_token == "keep-this-rt"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_sends_one_request(
+        self, tmp_path, monkeypatch, mock_client
+    ):
+        """동시 refresh 호출은 요청 1회로 합쳐지고 결과를 공유."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        provider = OpenAIProvider()
+        old_token = AuthToken(provider="openai", access_token="old", refresh_token="rt")
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _json_response(body={"access_token": "new-at"})
+
+        mock_client.post.side_effect = slow_post
+
+        tokens = await asyncio.gather(*(provider.refresh(old_token) for _ in range(5)))
+
+        assert mock_client.post.await_count == 1
+        assert {t.access_token for t in tokens} == {"new-at"}
+        assert provider._refreshes.tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_shared_and_cleared(self, mock_client):
+        """갱신 실패는 모든 호출자에 전파되고 다음 호출은 다시 요청."""
+        provider = OpenAIProvider()
+        old_token = AuthToken(provider="openai", access_token="old", refresh_token="rt")
+        mock_client.post.return_value = _json_response(400, text="invalid_grant")
+
+        results = await asyncio.gather(
+            provider.refresh(old_token),
+            provider.refresh(old_token),
+            return_exceptions=True,
+        )
+        with pytest.raises(ValueError, match="invalid_grant"):
+            await provider.refresh(old_token)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert mock_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_awaited_failure_not_logged(self, mock_client, caplog):
+        """호출자에게 전달된 갱신 실패는 경고 로그를 남기지 않음."""
+        provider = OpenAIProvider()
+        old_token = AuthToken(provider="openai", access_token="old", refresh_token="rt")
+        mock_client.post.return_value = _json_response(400, text="invalid_grant")
+
+        with pytest.raises(ValueError, match="invalid_grant"):
+            await provider.refresh(old_token)
+        await asyncio.sleep(0)
+
+        assert "토큰 갱신" not in caplog.text
+
 
 class TestValidate:
     """validate() 테스트."""
@@ -436,79 +600,103 @@ class TestValidate:
         token = AuthToken(
             provider="openai",
             access_token="expired-at",
-            expires_at=datetime.now() - timedelta(hours=1),
+            expires_at_epoch=(datetime.now() - timedelta(hours=1)).timestamp(),
         )
 
         result = await provider.validate(token)
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_validate_uses_userinfo_endpoint(self):
+    async def test_validate_uses_userinfo_endpoint(self, mock_client):
         """validate()가 auth.openai.com/userinfo 사용 검증."""
         provider = OpenAIProvider()
 
         token = AuthToken(
             provider="openai",
             access_token="valid-at",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at_epoch=(datetime.now() + timedelta(hours=1)).timestamp(),
         )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.get.return_value = mock_response
-
-            result = await provider.validate(token)
+        result = await provider.validate(token)
 
-            # 호출된 URL 확인
-            call_args = mock_instance.get.call_args
-            assert call_args[0][0] == "https://auth.openai.com/userinfo"
+        # 호출된 URL 확인
+        call_args = mock_client.get.call_args
+        assert call_args[0][0] == "https://auth.openai.com/userinfo"
 
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_validate_invalid_token(self):
+    async def test_validate_invalid_token(self, mock_client):
         """유효하지 않은 토큰 검증."""
         provider = OpenAIProvider()
 
         token = AuthToken(
             provider="openai",
             access_token="invalid-at",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at_epoch=(datetime.now() + timedelta(hours=1)).timestamp(),
         )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.get.return_value = mock_response
+        mock_client.get.return_value = _json_response(401)
 
-            result = await provider.validate(token)
+        result = await provider.validate(token)
 
         assert result is False
 
 
+class TestValidationCache:
+    """validate() 결과 캐시 테스트."""
+
+    @pytest.fixture
+    def token(self) -> AuthToken:
+        return AuthToken(
+            provider="openai",
+            access_token=f"at-{time.time_ns()}",
+            expires_at_epoch=time.time() + 3600,
+        )
+
+    @pytest.mark.asyncio
+    async def test_validate_cached(self, token, mock_client):
+        """연속 validate는 userinfo를 한 번만 호출."""
+        provider = OpenAIProvider()
+
+        results = [await provider.validate(token) for _ in range(3)]
+
+        assert results == [True, True, True]
+        assert mock_client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_server_error_not_cached(self, token, mock_client):
+        """5xx 응답은 캐시하지 않고 다음 호출에서 재조회."""
+        provider = OpenAIProvider()
+        mock_client.get.side_effect = [_json_response(503), _json_response(200)]
+
+        assert await provider.validate(token) is False
+        assert await provider.validate(token) is True
+
+    @pytest.mark.asyncio
+    async def test_logout_invalidates_cache(self, token, mock_client):
+        """logout 후에는 캐시된 결과 대신 다시 조회."""
+        provider = OpenAIProvider()
+
+        await provider.validate(token)
+        await provider.logout(token)
+        await provider.validate(token)
+
+        assert mock_client.get.await_count == 2
+
+
 class TestGetAccountInfo:
     """get_account_info() 테스트."""
 
     @pytest.mark.asyncio
-    async def test_get_account_info_success(self):
+    async def test_get_account_info_success(self, mock_client):
         """계정 정보 조회 성공 검증."""
         provider = OpenAIProvider()
 
         token = AuthToken(
             provider="openai",
             access_token="valid-at",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at_epoch=(datetime.now() + timedelta(hours=1)).timestamp(),
         )
 
         user_info = {
@@ -517,44 +705,27 @@ class TestGetAccountInfo:
             "name": "Test User",
         }
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = user_info
-
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.get.return_value = mock_response
+        mock_client.get.return_value = _json_response(body=user_info)
 
-            result = await provider.get_account_info(token)
+        result = await provider.get_account_info(token)
 
         assert result == user_info
         assert result["email"] == "test@example.com"
 
     @pytest.mark.asyncio
-    async def test_get_account_info_failure(self):
+    async def test_get_account_info_failure(self, mock_client):
         """계정 정보 조회 실패 시 None 반환 검증."""
         provider = OpenAIProvider()
 
         token = AuthToken(
             provider="openai",
             access_token="invalid-at",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at_epoch=(datetime.now() + timedelta(hours=1)).timestamp(),
         )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-
-        with patch(
-            "ultimate_debate.auth.providers.openai_provider.httpx.AsyncClient"
-        ) as mock_client:
-            mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
-            mock_instance.get.return_value = mock_response
+        mock_client.get.return_value = _json_response(401)
 
-            result = await provider.get_account_info(token)
+        result = await provider.get_account_info(token)
 
         assert result is None
 
@@ -570,7 +741,7 @@ class TestLogout:
         token = AuthToken(
             provider="openai",
             access_token="at",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at_epoch=(datetime.now() + timedelta(hours=1)).timestamp(),
         )
 
         result = await provider.logout(token)
@@ -1,9 +1,11 @@
 """Provider 테스트"""
 
-import pytest
+import dataclasses
 from datetime import datetime, timedelta
 
-from ultimate_debate.auth.providers.base import AuthToken
+import pytest
+
+from ultimate_debate.auth.providers.base import AuthToken, BaseProvider
 
 
 class TestAuthToken:
@@ -14,7 +16,7 @@ class TestAuthToken:
         token = AuthToken(
             provider="test",
             access_token="test-token",
-            expires_at=datetime.now() + timedelta(days=30),
+            expires_at_epoch=(datetime.now() + timedelta(days=30)).timestamp(),
         )
         assert token.is_expired() is False
 
@@ -23,21 +25,33 @@ class TestAuthToken:
         token = AuthToken(
             provider="test",
             access_token="test-token",
-            expires_at=datetime.now() - timedelta(days=1),
+            expires_at_epoch=(datetime.now() - timedelta(days=1)).timestamp(),
         )
         assert token.is_expired() is True
 
     def test_is_expired_no_expiry(self):
         """만료 시간 없는 토큰 (무기한)"""
-        token = AuthToken(provider="test", access_token="test-token", expires_at=None)
+        token = AuthToken(
+            provider="test", access_token="test-token", expires_at_epoch=None
+        )
         assert token.is_expired() is False
 
+    def test_is_expired_at(self):
+        """기준 시각을 받아 만료 여부 확인"""
+        token = AuthToken(
+            provider="test", access_token="test-token", expires_at_epoch=1000.0
+        )
+        assert token.is_expired_at(999.9) is False
+        assert token.is_expired_at(1000.0) is True
+        no_expiry = AuthToken(provider="test", access_token="test-token")
+        assert no_expiry.is_expired_at(float("inf")) is False
+
     def test_expires_in_days(self):
         """만료까지 남은 일수"""
         token = AuthToken(
             provider="test",
             access_token="test-token",
-            expires_at=datetime.now() + timedelta(days=7, hours=12),
+            expires_at_epoch=(datetime.now() + timedelta(days=7, hours=12)).timestamp(),
         )
         # 7일 또는 8일 (시간대에 따라)
         days = token.expires_in_days()
@@ -49,8 +63,8 @@ class TestAuthToken:
             provider="openai",
             access_token="test-token",
             refresh_token="refresh-token",
-            expires_at=datetime(2026, 1, 25, 12, 0, 0),
-            scopes=["chat", "models"],
+            expires_at_epoch=(datetime(2026, 1, 25, 12, 0, 0)).timestamp(),
+            scopes=("chat", "models"),
         )
         data = token.to_dict()
 
@@ -59,6 +73,13 @@ class TestAuthToken:
         assert data["refresh_token"] == "refresh-token"
         assert data["scopes"] == ["chat", "models"]
 
+    def test_to_dict_emits_utc_offset(self):
+        """expires_at 은 UTC 오프셋이 포함된 ISO 문자열로 저장"""
+        token = AuthToken(
+            provider="openai", access_token="test-token", expires_at_epoch=0.0
+        )
+        assert token.to_dict()["expires_at"] == "1970-01-01T00:00:00+00:00"
+
     def test_from_dict(self):
         """딕셔너리에서 생성"""
         data = {
@@ -80,8 +101,8 @@ class TestAuthToken:
             provider="test",
             access_token="token123",
             refresh_token="refresh456",
-            expires_at=datetime(2026, 2, 1, 10, 30, 0),
-            scopes=["read", "write"],
+            expires_at_epoch=(datetime(2026, 2, 1, 10, 30, 0)).timestamp(),
+            scopes=("read", "write"),
         )
 
         data = original.to_dict()
@@ -93,6 +114,32 @@ class TestAuthToken:
         assert restored.expires_at == original.expires_at
         assert restored.scopes == original.scopes
 
+    def test_hashable_and_frozen(self):
+        """불변 토큰은 dict 키/set 원소로 사용 가능"""
+        token = AuthToken(
+            provider="test",
+            access_token="token123",
+            scopes=("read",),
+            account_info={"email": "a@example.com"},
+        )
+        same = AuthToken.from_dict(token.to_dict())
+
+        assert {token: "cached"}[same] == "cached"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            token.access_token = "other"  # type: ignore[misc]
+
+
+
+class TestBaseProvider:
+    """BaseProvider 테스트"""
+
+    def test_subclass_requires_name(self):
+        """name/display_name 클래스 속성 없는 하위 클래스는 정의 시 거부"""
+        with pytest.raises(TypeError, match="name"):
+
+            class NamelessProvider(BaseProvider):
+                display_name = "Nameless"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
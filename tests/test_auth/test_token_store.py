@@ -1,11 +1,17 @@
 """Token Store 테스트"""
 
-import pytest
+import logging
+import os
 import tempfile
-from pathlib import Path
+import threading
 from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 from ultimate_debate.auth.providers.base import AuthToken
+from ultimate_debate.auth.storage import token_store
 from ultimate_debate.auth.storage.token_store import TokenStore
 
 
@@ -23,8 +29,8 @@ def sample_token():
         provider="test",
         access_token="test-access-token",
         refresh_token="test-refresh-token",
-        expires_at=datetime.now() + timedelta(days=30),
-        scopes=["chat", "models"],
+        expires_at_epoch=(datetime.now() + timedelta(days=30)).timestamp(),
+        scopes=("chat", "models"),
     )
 
 
@@ -116,7 +122,7 @@ class TestTokenStore:
         expired_token = AuthToken(
             provider="expired",
             access_token="expired-token",
-            expires_at=datetime.now() - timedelta(days=1),
+            expires_at_epoch=(datetime.now() - timedelta(days=1)).timestamp(),
         )
         asyncio.run(temp_store.save(expired_token))
 
@@ -133,6 +139,135 @@ class TestTokenStore:
         assert temp_store.has_valid_token("test") is True
         assert temp_store.has_valid_token("nonexistent") is False
 
+    def test_save_to_file_atomic(self, temp_store, sample_token):
+        """파일 저장은 임시 파일 없이 0o600 권한으로 교체"""
+        assert temp_store._save_to_file(sample_token) is True
+        token2 = AuthToken(provider="test", access_token="rotated")
+        assert temp_store._save_to_file(token2) is True
+
+        assert [p.name for p in temp_store.storage_dir.iterdir()] == ["test.json"]
+        assert temp_store._load_from_file("test").access_token == "rotated"
+        if os.name == "posix":
+            file_path = temp_store.storage_dir / "test.json"
+            assert file_path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_list_providers_cached(self, temp_store, sample_token):
+        """목록은 TTL 동안 캐시되고 저장 시 무효화"""
+        temp_store._save_to_file(sample_token)
+        assert await temp_store.list_providers() == ["test"]
+
+        # 외부에서 추가된 파일은 캐시가 유효한 동안 반영되지 않음
+        (temp_store.storage_dir / "external.json").write_text("{}")
+        assert await temp_store.list_providers() == ["test"]
+
+        token2 = AuthToken(provider="test2", access_token="token2")
+        temp_store._save_to_file(token2)
+        assert await temp_store.list_providers() == ["external", "test", "test2"]
+
+    @pytest.mark.asyncio
+    async def test_list_providers_keyring_probes(self, temp_store, monkeypatch):
+        """keyring 조회는 동시에 수행하고 실패한 조회는 무시"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get_password(service, provider):
+            if provider == "poe":
+                raise RuntimeError("backend error")
+            # poe를 제외한 3개 조회가 동시에 진행되어야 통과
+            barrier.wait()
+            return "{}" if provider == "google" else None
+
+        fake_keyring = SimpleNamespace(get_password=get_password)
+        monkeypatch.setattr(token_store, "HAS_KEYRING", True)
+        monkeypatch.setattr(token_store, "keyring", fake_keyring, raising=False)
+
+        assert await temp_store.list_providers() == ["google"]
+
+    @pytest.mark.asyncio
+    async def test_keyring_calls_off_event_loop(
+        self, temp_store, sample_token, monkeypatch
+    ):
+        """async 메서드의 keyring 호출은 이벤트 루프 스레드 밖에서 실행"""
+        loop_thread = threading.get_ident()
+        stored: dict[str, str] = {}
+        threads: list[int] = []
+
+        def set_password(service, provider, data):
+            threads.append(threading.get_ident())
+            stored[provider] = data
+
+        def get_password(service, provider):
+            threads.append(threading.get_ident())
+            return stored.get(provider)
+
+        def delete_password(service, provider):
+            threads.append(threading.get_ident())
+            del stored[provider]
+
+        fake_keyring = SimpleNamespace(
+            set_password=set_password,
+            get_password=get_password,
+            delete_password=delete_password,
+        )
+        monkeypatch.setattr(token_store, "HAS_KEYRING", True)
+        monkeypatch.setattr(token_store, "keyring", fake_keyring, raising=False)
+
+        assert await temp_store.save(sample_token) is True
+        loaded = await temp_store.load("test")
+        assert loaded.access_token == sample_token.access_token
+        assert await temp_store.delete("test") is True
+
+        assert stored == {}
+        assert len(threads) == 3
+        assert loop_thread not in threads
+
+    def test_load_from_file_corrupt(self, temp_store):
+        """손상된 토큰 파일은 None"""
+        (temp_store.storage_dir / "broken.json").write_bytes(b"{not json")
+        assert temp_store._load_from_file("broken") is None
+        assert temp_store._load_from_file("missing") is None
+
+    def test_load_all_sync(self, temp_store, sample_token):
+        """모든 토큰 파일을 한 번에 로드 (손상된 파일은 건너뜀)"""
+        temp_store._save_to_file(sample_token)
+        temp_store._save_to_file(AuthToken(provider="test2", access_token="token2"))
+        (temp_store.storage_dir / "broken.json").write_bytes(b"{not json")
+        (temp_store.storage_dir / "notes.txt").write_text("ignored")
+
+        tokens = temp_store.load_all_sync()
+
+        assert sorted(tokens) == ["test", "test2"]
+        assert tokens["test"].access_token == "test-access-token"
+        assert tokens["test2"].access_token == "token2"
+
+    @pytest.mark.asyncio
+    async def test_clear_all_removes_files_only(self, temp_store, sample_token):
+        """clear_all은 토큰 파일만 삭제"""
+        temp_store._save_to_file(sample_token)
+        (temp_store.storage_dir / "notes.txt").write_text("keep")
+
+        assert await temp_store.clear_all() is True
+        assert [p.name for p in temp_store.storage_dir.iterdir()] == ["notes.txt"]
+
+    def test_save_to_file_error_logged(self, temp_store, sample_token, caplog):
+        """파일 저장 실패는 stdout 대신 로거로 보고"""
+        temp_store.storage_dir = temp_store.storage_dir / "missing"
+
+        with caplog.at_level(logging.WARNING, logger=token_store.__name__):
+            assert temp_store._save_to_file(sample_token) is False
+
+        assert "Token file save error" in caplog.text
+
+    def test_default_storage_dir_honours_env(self, tmp_path, monkeypatch):
+        """기본 저장 디렉토리는 생성 시점의 환경변수를 반영"""
+        monkeypatch.setattr(token_store, "_SYSTEM", "Linux")
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        store = TokenStore()
+
+        assert store.storage_dir == tmp_path / "claude-code" / "ai-auth"
+        assert store.storage_dir.is_dir()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])